@@ -6,9 +6,11 @@ This utility extracts significant moves from SlowMate's winning games and builds
 confidence-weighted tactical database for future games.
 
 Usage:
-    python game_analysis_utility.py [--games-dir games/] [--strictness high]
+    python game_analysis_utility.py [--games-dir games/] [--strictness high] [--depth 4] [--lines 3]
 
 Features:
+- One MultiPV search per position: the evaluation, the engine's candidate
+  moves and their principal variations come from the same search
 - Mathematical evaluation comparison using standard deviation analysis
 - Confidence weighting based on multiple statistical factors
 - Detection of considerable moves and checkmate patterns
@@ -28,40 +30,53 @@ import statistics
 import hashlib
 from pathlib import Path
 
-# Add slowmate to path for importing
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add the repository root to path for importing
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from slowmate.engine import SlowMateEngine
-from slowmate.intelligence import MoveIntelligence
+from src.engine import SlowMateEngine
 from slowmate.knowledge.middlegame_tactics import MiddlegameTactics
 
 
-class EvaluationHelper:
-    """Helper class for position evaluation during game analysis."""
+class PositionAnalyzer:
+    """
+    Searches each position once in MultiPV mode.
+    
+    The best line gives the position evaluation; the other lines score the
+    engine's alternatives, so a played move among the top lines needs no
+    search of its own. All searches share one engine and its TT.
+    """
     
-    def __init__(self):
-        """Initialize evaluation helper with intelligence module."""
-        self.temp_engine = SlowMateEngine()
-        self.intelligence = MoveIntelligence(self.temp_engine)
+    def __init__(self, depth: int = 4, lines: int = 3):
+        """Initialize the analysis engine (depth per position, MultiPV lines)."""
+        self.engine = SlowMateEngine()
+        self.engine.set_multi_pv(lines)
+        self.engine.use_book = False  # Book moves come back without scored lines
+        self.engine.uci.set_silent_mode(True)  # No UCI info output
+        self.depth = depth
     
-    def evaluate_position(self, board: chess.Board) -> float:
+    def analyze_position(self, board: chess.Board) -> List[Tuple[float, List[chess.Move]]]:
         """
-        Evaluate a chess position and return centipawn score.
-        Positive values favor white, negative favor black.
+        Return the top (score, pv) lines of a position, best first.
+        Scores are centipawns; positive values favor white, negative favor black.
         """
-        # Set the temporary engine's board to the position we want to evaluate
-        original_board = self.temp_engine.board.fen()
+        if board.is_game_over():
+            return []
         
-        try:
-            # Set position
-            self.temp_engine.board.set_fen(board.fen())
-            
-            # Use the intelligence module's position evaluation
-            evaluation = self.intelligence._evaluate_position()
-            return float(evaluation)
-        finally:
-            # Restore original board
-            self.temp_engine.board.set_fen(original_board)
+        # Same root and move list as the previous position plus one move:
+        # the engine only makes the new move and keeps the game history
+        self.engine.set_position(board.root().fen(), board.move_stack)
+        self.engine.search(depth_override=self.depth)
+        sign = 1 if board.turn == chess.WHITE else -1
+        return [(float(sign * score), pv) for score, pv in self.engine.multipv_lines]
+    
+    @staticmethod
+    def position_score(board: chess.Board, lines: List[Tuple[float, List[chess.Move]]]) -> float:
+        """Evaluation of a position from its lines (white's point of view)."""
+        if lines:
+            return lines[0][0]
+        if board.is_checkmate():
+            return -30000.0 if board.turn == chess.WHITE else 30000.0
+        return 0.0
 
 
 class GameAnalysisUtility:
@@ -69,18 +84,21 @@ class GameAnalysisUtility:
     Utility for analyzing historical games and extracting tactical knowledge.
     """
     
-    def __init__(self, games_directory: str = "games/", strictness: str = "high"):
+    def __init__(self, games_directory: str = "games/", strictness: str = "high",
+                 depth: int = 4, lines: int = 3):
         """
         Initialize the game analysis utility.
         
         Args:
             games_directory: Directory containing PGN files
             strictness: Analysis strictness ('high', 'medium', 'low')
+            depth: Search depth per position
+            lines: MultiPV lines searched per position
         """
         self.games_dir = Path(games_directory)
         self.strictness = strictness
         self.middlegame_tactics = MiddlegameTactics()
-        self.evaluator = EvaluationHelper()  # Add evaluation helper
+        self.analyzer = PositionAnalyzer(depth, lines)
         
         # Session tracking
         self.processed_games = set()  # Track duplicates in current session
@@ -116,6 +134,7 @@ class GameAnalysisUtility:
         print(f"📁 Games directory: {self.games_dir}")
         print(f"🎯 Analysis strictness: {strictness}")
         print(f"⚙️  Config: {self.strictness_config[strictness]}")
+        print(f"🔎 Search: depth {depth}, {lines} lines per position")
         print("-" * 60)
     
     def get_pgn_files(self) -> List[Path]:
@@ -202,9 +221,14 @@ class GameAnalysisUtility:
         """
         Calculate evaluation statistics for the entire game.
         Used to determine significant move thresholds.
+        
+        Every position is searched once; its lines are kept in
+        'position_lines' (one entry per position, including the final one)
+        for the move analysis.
         """
         evaluations = []
         eval_changes = []
+        position_lines = []
         
         board = chess.Board()
         previous_eval = 0
@@ -215,7 +239,9 @@ class GameAnalysisUtility:
                 move = chess.Move.from_uci(move_uci)
                 
                 # Evaluate position before move
-                current_eval = self.evaluator.evaluate_position(board)
+                lines = self.analyzer.analyze_position(board)
+                position_lines.append(lines)
+                current_eval = self.analyzer.position_score(board, lines)
                 evaluations.append(current_eval)
                 
                 # Calculate evaluation change
@@ -230,11 +256,15 @@ class GameAnalysisUtility:
                 
             except Exception as e:
                 print(f"⚠️  Evaluation error at move {i+1}: {e}")
-                continue
+                break  # Later positions would not match the move numbers
+        
+        if len(position_lines) == len(game['moves']):
+            position_lines.append(self.analyzer.analyze_position(board))
         
         # Calculate statistical measures
         if not eval_changes:
-            return {'mean_change': 0, 'std_dev': 0, 'total_moves': len(game['moves'])}
+            return {'mean_change': 0, 'std_dev': 0, 'total_moves': len(game['moves']),
+                    'evaluations': evaluations, 'position_lines': position_lines}
         
         mean_change = statistics.mean(eval_changes)
         std_dev = statistics.stdev(eval_changes) if len(eval_changes) > 1 else 0
@@ -245,7 +275,8 @@ class GameAnalysisUtility:
             'total_moves': len(game['moves']),
             'max_change': max(eval_changes) if eval_changes else 0,
             'evaluations': evaluations[:50],  # Store first 50 for analysis
-            'eval_changes': eval_changes[:50]
+            'eval_changes': eval_changes[:50],
+            'position_lines': position_lines
         }
     
     def analyze_move_significance(self, board: chess.Board, move: chess.Move, 
@@ -331,10 +362,26 @@ class GameAnalysisUtility:
             'criteria_met': criteria_met
         }
     
-    def extract_principal_variation(self, board: chess.Board, move: chess.Move, depth: int = 5) -> List[str]:
-        """Extract principal variation starting from the given move."""
-        # For now, just return the single move - could be enhanced with deeper analysis
-        return [move.uci()]
+    def played_move_line(self, move: chess.Move, lines_before: List[Tuple[float, List[chess.Move]]],
+                         lines_after: List[Tuple[float, List[chess.Move]]],
+                         board_after: chess.Board) -> Tuple[float, List[chess.Move]]:
+        """
+        Score and principal variation of a played move (white's point of view).
+        
+        Taken from the MultiPV line starting with the move when the engine
+        ranked it among its top lines, otherwise from the search of the
+        position after the move.
+        """
+        for score, pv in lines_before:
+            if pv and pv[0] == move:
+                return score, pv
+        score = self.analyzer.position_score(board_after, lines_after)
+        pv = lines_after[0][1] if lines_after else []
+        return score, [move] + pv
+    
+    def extract_principal_variation(self, pv: List[chess.Move], depth: int = 5) -> List[str]:
+        """Extract the first depth moves of a principal variation as UCI strings."""
+        return [move.uci() for move in pv[:depth]]
     
     def analyze_game(self, game: Dict) -> bool:
         """
@@ -359,7 +406,7 @@ class GameAnalysisUtility:
         game_stats = self.calculate_game_evaluation_stats(game)
         
         tactics_found = 0
-        engine = SlowMateEngine()
+        position_lines = game_stats['position_lines']
         board = chess.Board()
         
         # Determine which color SlowMate played
@@ -374,13 +421,14 @@ class GameAnalysisUtility:
                 is_slowmate_move = (slowmate_as_white and board.turn == chess.WHITE) or \
                                  (not slowmate_as_white and board.turn == chess.BLACK)
                 
-                if is_slowmate_move and i < len(game_stats['evaluations']) - 1:
-                    # Get evaluations before and after move
+                if (is_slowmate_move and i < len(game_stats['evaluations']) - 1
+                        and i + 1 < len(position_lines)):
+                    # Get evaluations before and after move (no extra searches)
                     prev_eval = game_stats['evaluations'][i]
                     
-                    # Evaluate position after move
                     board.push(move)
-                    new_eval = self.evaluator.evaluate_position(board)
+                    new_eval, move_pv = self.played_move_line(move, position_lines[i],
+                                                              position_lines[i + 1], board)
                     board.pop()
                     
                     # Analyze move significance
@@ -396,7 +444,7 @@ class GameAnalysisUtility:
                         )
                         
                         # Extract principal variation
-                        pv = self.extract_principal_variation(board, move)
+                        pv = self.extract_principal_variation(move_pv)
                         
                         # Store in middlegame tactics
                         success = self.middlegame_tactics.store_tactic(
@@ -520,10 +568,24 @@ def main():
         help='Analysis strictness level (default: high)'
     )
     
+    parser.add_argument(
+        '--depth',
+        type=int,
+        default=4,
+        help='Search depth per position (default: 4)'
+    )
+    
+    parser.add_argument(
+        '--lines',
+        type=int,
+        default=3,
+        help='MultiPV lines searched per position (default: 3)'
+    )
+    
     args = parser.parse_args()
     
     # Create and run analysis utility
-    analyzer = GameAnalysisUtility(args.games_dir, args.strictness)
+    analyzer = GameAnalysisUtility(args.games_dir, args.strictness, args.depth, args.lines)
     
     # Analyze all games
     stats = analyzer.analyze_all_games()
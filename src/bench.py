@@ -0,0 +1,204 @@
+"""
+SlowMate Chess Engine - Benchmark
+Fixed-depth search over a fixed position suite
+Version: 1.0.0-BETA
+
+Every position is searched to the same depth from a fresh game state
+with the opening book off, so with one thread the node counts depend
+only on the engine's search and evaluation. The total node count is the
+bench signature: a changed signature means the search behaves
+differently, a lower nodes/sec at the same signature means it got slower.
+
+Usage:
+    python -m src.bench [depth] [--component kind=name ...] [--setoption name=value ...]
+"""
+
+import math
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import chess
+
+from .search.enhanced import CutoffStats
+
+
+DEFAULT_BENCH_DEPTH = 3
+
+# Openings, middlegames and endgames, including perft and WAC positions
+BENCH_FENS = [
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 10",
+    "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 11",
+    "4rrk1/pp1n3p/3q2pQ/2p1pb2/2PP4/2P3N1/P2B2PP/4RRK1 b - - 7 19",
+    "rq3rk1/ppp2ppp/1bnpb3/3N2B1/3NP3/7P/PPPQ1PP1/2KR3R w - - 7 14",
+    "r1bq1r1k/1pp1n1pp/1p1p4/4p2Q/4Pp2/1BNP4/PPP2PPP/3R1RK1 w - - 2 14",
+    "r3r1k1/2p2ppp/p1p1bn2/8/1q2P3/2NPQN2/PPP3PP/R4RK1 b - - 2 15",
+    "r1bbk1nr/pp3p1p/2n5/1N4p1/2Np1B2/8/PPP2PPP/2KR1B1R w kq - 0 13",
+    "r1bq1rk1/ppp1nppp/4n3/3p3Q/3P4/1BP1B3/PP1N2PP/R4RK1 w - - 1 16",
+    "4r1k1/r1q2ppp/ppp2n2/4P3/5Rb1/1N1BQ3/PPP3PP/R5K1 w - - 1 17",
+    "2rqkb1r/ppp2p2/2npb1p1/1N1Nn2p/2P1PP2/8/PP2B1PP/R1BQK2R b KQ - 0 11",
+    "r1bq1r1k/b1p1npp1/p2p3p/1p6/3PP3/1B2NN2/PP3PPP/R2Q1RK1 w - - 1 16",
+    "3r1rk1/p5pp/bpp1pp2/8/q1PP1P2/b3P3/P2NQRPP/1R2B1K1 b - - 6 22",
+    "r1q2rk1/2p1bppp/2Pp4/p6b/Q1PNp3/4B3/PP1R1PPP/2K4R w - - 2 18",
+    "4k2r/1pb2ppp/1p2p3/1R1p4/3P4/2r1PN2/P4PPP/1R4K1 b - - 3 22",
+    "3q2k1/pb3p1p/4pbp1/2r5/PpN2N2/1P2P2P/5PP1/Q2R2K1 b - - 4 26",
+    "6k1/6p1/6Pp/ppp5/3pn2P/1P3K2/1PP2P2/8 b - - 0 1",
+    "8/8/8/8/5kp1/P7/8/1K1N4 w - - 0 1",
+    "8/8/8/5N2/8/p7/8/2NK3k w - - 0 1",
+    "8/8/4k3/8/8/8/4P3/4K3 w - - 0 1",
+    "8/8/1P6/5pr1/8/4R3/7k/2K5 w - - 0 1",
+    "8/2p4P/8/kr6/6R1/8/8/1K6 w - - 0 1",
+    "8/8/3P3k/8/1p6/8/1P6/1K3n2 b - - 0 1",
+    "8/R7/2q5/8/6k1/8/1P5p/K6R w - - 0 124",
+    "6k1/3b3r/1p1p4/p1n2p2/1PPNpP1q/P3Q1p1/1R1RB1P1/5K2 b - - 0 1",
+    "r2r1n2/pp2bk2/2p1p2p/3q4/3PN1QP/2P3R1/P4PP1/5RK1 w - - 0 1",
+    "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+    "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+    "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+    "rnbqkb1r/pp2pppp/3p1n2/8/3NP3/8/PPP2PPP/RNBQKB1R w KQkq - 1 5",
+    "r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4",
+    "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 6 8",
+    "r1bq1rk1/pp3ppp/2n1pn2/2bp4/2P5/2N1PN2/PP1B1PPP/R2QKB1R w KQ - 0 8",
+    "2r2rk1/pp1bqppp/2n1pn2/3p4/3P4/2PBPN2/P1Q2PPP/R4RK1 w - - 5 14",
+    "rnbqk2r/ppp1bppp/4pn2/3p4/2PP4/2N2N2/PP2PPPP/R1BQKB1R w KQkq - 4 5",
+    "r1bqk2r/pp2bppp/2nppn2/8/3NP3/2N1B3/PPP1BPPP/R2QK2R w KQkq - 2 8",
+    "rnbqkb1r/1p2pppp/p2p1n2/8/3NP3/2N5/PPP2PPP/R1BQKB1R w KQkq - 0 6",
+    "2rr3k/pp3pp1/1nnqbN1p/3pN3/2pP4/2P3Q1/PPB4P/R4RK1 w - - 0 1",
+    "8/7p/5k2/5p2/p1p2P2/Pr1pPK2/1P1R3P/8 b - - 0 1",
+    "5rk1/1ppb3p/p1pb4/6q1/3P1p1r/2P1R2P/PP1BQ1P1/5RKN w - - 0 1",
+    "r1bq2rk/pp3pbp/2p1p1pQ/7P/3P4/2PB1N2/PP3PP1/R3KR2 w Q - 0 1",
+    "5k2/6pp/p1qN4/1p1p4/3P4/2PKP2Q/PP3r2/3R4 b - - 0 1",
+    "r1b1kb1r/3q1ppp/pBp1pn2/8/Np3P2/5B2/PPP3PP/R2Q1RK1 w kq - 0 1",
+    "r4k2/pb3ppp/1p6/2p5/2P5/1P3N2/P4PPP/3R2K1 w - - 0 1",
+    "8/k7/3p4/p2P1p2/P2P1P2/8/8/K7 w - - 0 1",
+    "8/8/8/4k3/8/8/8/R3K3 w Q - 0 1",
+    "8/8/4k3/3p4/3P4/4K3/8/8 w - - 0 1",
+    "8/5pk1/6p1/8/3R4/6P1/5PK1/1r6 w - - 0 40",
+    "6k1/5p2/6p1/8/7p/8/6PP/6K1 b - - 0 1",
+    "8/8/2k5/5q2/5n2/8/5K2/8 b - - 0 1",
+]
+
+
+@dataclass
+class BenchPosition:
+    """Result of searching one bench position."""
+    fen: str
+    best_move: Optional[chess.Move]
+    nodes: int
+    seconds: float
+
+
+@dataclass
+class BenchResult:
+    """Results of a bench run, in suite order."""
+    depth: int
+    positions: List[BenchPosition] = field(default_factory=list)
+    pruning: Dict[str, Tuple[int, int]] = field(default_factory=dict)  # name: (tried, cut)
+    cutoffs: CutoffStats = field(default_factory=CutoffStats)
+
+    @property
+    def total_nodes(self) -> int:
+        return sum(position.nodes for position in self.positions)
+
+    @property
+    def total_time(self) -> float:
+        return sum(position.seconds for position in self.positions)
+
+    @property
+    def nps(self) -> int:
+        return int(self.total_nodes / max(self.total_time, 0.001))
+
+    @property
+    def branching_factor(self) -> float:
+        """Effective branching factor: geometric mean of nodes ** (1 / depth) per position."""
+        logs = [math.log(position.nodes) for position in self.positions if position.nodes > 0]
+        if not logs:
+            return 0.0
+        return math.exp(sum(logs) / len(logs) / self.depth)
+
+    @property
+    def signature(self) -> int:
+        """Total node count: changes whenever the search explores a different tree."""
+        return self.total_nodes
+
+
+def run_bench(engine, depth: int = DEFAULT_BENCH_DEPTH, fens: Optional[List[str]] = None,
+              report: Optional[Callable[[str], None]] = None) -> BenchResult:
+    """Search every position to depth and report one line per position plus totals.
+
+    The engine's own search output is silenced; its options (hash size,
+    components, threads) stay as set. Afterwards the engine is left on a
+    new game. The signature is reproducible with one thread only.
+    """
+    fens = BENCH_FENS if fens is None else fens
+    report = report or (lambda line: None)
+    result = BenchResult(depth)
+    uci = engine.uci
+    silent, use_book = uci.silent_mode, engine.use_book
+    engine.use_book = False
+    try:
+        for index, fen in enumerate(fens, 1):
+            engine.new_game()
+            engine.set_position(fen)
+            uci.set_silent_mode(True)
+            start = time.perf_counter()
+            try:
+                move = engine.search(depth_override=depth)
+            finally:
+                uci.set_silent_mode(silent)
+            position = BenchPosition(fen, move, engine.nodes, time.perf_counter() - start)
+            result.positions.append(position)
+            for technique in engine.searcher.pruning.techniques.values():
+                tried, cut = result.pruning.get(technique.name, (0, 0))
+                result.pruning[technique.name] = (tried + technique.nodes, cut + technique.cutoffs)
+            result.cutoffs.merge(engine.cutoff_stats)
+            report(f"Position {index}/{len(fens)}: {fen}")
+            report(f"  bestmove {move.uci() if move else '0000'} nodes {position.nodes} "
+                   f"time {position.seconds * 1000:.0f} ms "
+                   f"nps {int(position.nodes / max(position.seconds, 0.001))}")
+    finally:
+        engine.use_book = use_book
+        engine.new_game()
+
+    report(f"Depth: {depth}")
+    report(f"Total time (ms): {result.total_time * 1000:.0f}")
+    report(f"Time per position (ms): {result.total_time * 1000 / max(len(fens), 1):.0f}")
+    report(f"Nodes searched: {result.total_nodes}")
+    report(f"Nodes/second: {result.nps}")
+    report(f"Effective branching factor: {result.branching_factor:.2f}")
+    report("Pruning tried/cut: " + " ".join(
+        f"{name} {tried}/{cut}" for name, (tried, cut) in result.pruning.items()))
+    report(result.cutoffs.stats_string().capitalize())
+    report(f"Signature: {result.signature}")
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line bench: optional depth, --component kind=name and --setoption name=value."""
+    from .engine import SlowMateEngine
+
+    argv = sys.argv[1:] if argv is None else argv
+    depth = DEFAULT_BENCH_DEPTH
+    components = {}
+    options = []
+    args = iter(argv)
+    for arg in args:
+        if arg == "--component":
+            kind, _, name = next(args, "").partition("=")
+            components[kind] = name
+        elif arg == "--setoption":
+            options.append(next(args, "").partition("="))
+        else:
+            depth = int(arg)
+
+    engine = SlowMateEngine(components)
+    for name, _, value in options:
+        engine.uci.handle_command(f"setoption name {name} value {value}")
+    run_bench(engine, depth, report=print)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+SlowMate Chess Engine - Component Registry
+Named implementations of the swappable parts of the engine core
+Version: 1.0.0-BETA
+
+There is one engine core (engine.SlowMateEngine). Its evaluator, move
+ordering, transposition table, time manager and searcher variant are
+created from this registry by name, so UCI options can select them and
+two engines with different choices can be compared in one process. A fix
+to the core search reaches every combination.
+"""
+
+from typing import Callable, Dict, List
+
+from .core.enhanced_evaluate import EnhancedEvaluator
+from .core.time_manager import TimeManager, SimpleTimeManager
+from .search.enhanced import TranspositionTable
+from .search.ordering import StagedOrdering, SortedOrdering
+from .search.pruning import ForwardPruning
+from .search.smp import SharedTranspositionTable
+
+
+class Searcher:
+    """Interior-node variant of the core negamax.
+    
+    null_windows: search moves after the first with a null window and
+    re-search on fail high (PVS); otherwise every move gets the full
+    window (plain alpha-beta, as the v2.x engines searched).
+    pruning: the shallow-depth forward pruning settings and counters.
+    internal_iterative: what PV and cut nodes without a hash move do at
+    high depth: 'reduce' searches them one ply shallower (IIR), 'deepen'
+    first runs a shallower search of the node to get a hash move (IID),
+    'off' does neither.
+    """
+    
+    INTERNAL_ITERATIVE_MODES = ('reduce', 'deepen', 'off')
+    
+    def __init__(self, name: str, null_windows: bool):
+        self.name = name
+        self.null_windows = null_windows
+        self.pruning = ForwardPruning()
+        self.internal_iterative = 'reduce'
+
+
+class ComponentRegistry:
+    """Factories for the engine's swappable components, by kind and name."""
+    
+    def __init__(self):
+        self._factories: Dict[str, Dict[str, Callable]] = {}
+        self._defaults: Dict[str, str] = {}
+        
+    def register(self, kind: str, name: str, factory: Callable, default: bool = False) -> None:
+        """Register factory as implementation name of kind (the first one is the default)."""
+        self._factories.setdefault(kind, {})[name] = factory
+        if default or kind not in self._defaults:
+            self._defaults[kind] = name
+            
+    def kinds(self) -> List[str]:
+        """Registered component kinds."""
+        return list(self._factories)
+        
+    def names(self, kind: str) -> List[str]:
+        """Registered implementation names of kind."""
+        return list(self._factories[kind])
+        
+    def default(self, kind: str) -> str:
+        """Name of the default implementation of kind."""
+        return self._defaults[kind]
+        
+    def create(self, kind: str, name: str, *args):
+        """Create implementation name of kind (ValueError if unknown)."""
+        factories = self._factories.get(kind)
+        if factories is None:
+            raise ValueError(f"Unknown component kind: {kind}")
+        if name not in factories:
+            raise ValueError(f"Unknown {kind}: {name}")
+        return factories[name](*args)
+
+
+REGISTRY = ComponentRegistry()
+
+REGISTRY.register('searcher', 'pvs', lambda: Searcher('pvs', null_windows=True))
+REGISTRY.register('searcher', 'alphabeta', lambda: Searcher('alphabeta', null_windows=False))
+
+REGISTRY.register('evaluator', 'bitboard', lambda: EnhancedEvaluator('bitboard'))
+REGISTRY.register('evaluator', 'squares', lambda: EnhancedEvaluator('squares'))
+
+REGISTRY.register('move_ordering', 'staged', StagedOrdering)
+REGISTRY.register('move_ordering', 'sorted', SortedOrdering)
+
+# Transposition tables take the size in MB
+REGISTRY.register('tt', 'local', TranspositionTable)
+REGISTRY.register('tt', 'shared', SharedTranspositionTable)
+
+REGISTRY.register('time_manager', 'adaptive', TimeManager)
+REGISTRY.register('time_manager', 'simple', SimpleTimeManager)
@@ -7,6 +7,8 @@ Version: 1.0.0-BETA
 import chess
 import chess.polyglot
 
+from . import zobrist
+
 
 class Board:
     """Chess board representation with enhanced functionality."""
@@ -14,24 +16,80 @@ class Board:
     def __init__(self):
         """Initialize a new chess board with starting position."""
         self.board = chess.Board()
-        self._position_cache = {}  # Cache for evaluated positions
+        self.root_fen = chess.STARTING_FEN  # Position the move stack starts from
         self._phase = None  # Current game phase
+        self.zobrist_key = zobrist.compute_key(self.board)
+        self._key_history = []  # Keys of earlier positions (unmake + repetition)
+        self.pawn_key = zobrist.compute_pawn_key(self.board)  # Pawn-only key for the pawn hash
+        self._pawn_key_history = []
+        self.accumulator = None  # Incremental evaluation state (EvalAccumulator)
         
     def get_legal_moves(self):
         """Return list of legal moves in current position."""
         return list(self.board.legal_moves)
     
     def make_move(self, move):
-        """Make a move on the board."""
-        self.board.push(move)
+        """Make a move on the board, updating the Zobrist key incrementally."""
+        board = self.board
+        key = self.zobrist_key ^ zobrist.castling_key(board) ^ zobrist.ep_key(board) ^ zobrist.TURN_KEY
+        
+        pawn_key = self.pawn_key
+        
+        removed, added = zobrist.move_piece_changes(board, move)
+        for square, color, piece_type in removed:
+            key ^= zobrist.PIECE_KEYS[color][piece_type][square]
+            if piece_type == chess.PAWN:
+                pawn_key ^= zobrist.PIECE_KEYS[color][chess.PAWN][square]
+        for square, color, piece_type in added:
+            key ^= zobrist.PIECE_KEYS[color][piece_type][square]
+            if piece_type == chess.PAWN:
+                pawn_key ^= zobrist.PIECE_KEYS[color][chess.PAWN][square]
+        if self.accumulator is not None:
+            self.accumulator.update(removed, added)
+        
+        board.push(move)
+        self._key_history.append(self.zobrist_key)
+        self.zobrist_key = key ^ zobrist.castling_key(board) ^ zobrist.ep_key(board)
+        self._pawn_key_history.append(self.pawn_key)
+        self.pawn_key = pawn_key
         self._phase = None  # Reset phase cache
-        self._position_cache = {}  # Reset evaluation cache
         
     def unmake_move(self):
         """Take back the last move."""
         self.board.pop()
+        self.zobrist_key = self._key_history.pop()
+        self.pawn_key = self._pawn_key_history.pop()
+        if self.accumulator is not None:
+            self.accumulator.undo()
         self._phase = None  # Reset phase cache
-        self._position_cache = {}  # Reset evaluation cache
+    
+    def make_null_move(self):
+        """Pass the turn to the opponent (null move pruning)."""
+        key = self.zobrist_key ^ zobrist.ep_key(self.board) ^ zobrist.TURN_KEY
+        self.board.push(chess.Move.null())
+        self._key_history.append(self.zobrist_key)
+        self.zobrist_key = key
+    
+    def unmake_null_move(self):
+        """Take back a null move."""
+        self.board.pop()
+        self.zobrist_key = self._key_history.pop()
+    
+    def attach_accumulator(self, accumulator):
+        """Attach an incremental evaluation accumulator, synced to this position."""
+        self.accumulator = accumulator
+        if accumulator is not None:
+            accumulator.reset(self.board)
+    
+    def is_repetition(self):
+        """Check if the current position occurred before since the last irreversible move."""
+        history = self._key_history
+        limit = min(self.board.halfmove_clock, len(history))
+        key = self.zobrist_key
+        for distance in range(4, limit + 1, 2):
+            if history[-distance] == key:
+                return True
+        return False
         
     def is_game_over(self):
         """Check if the game is over."""
@@ -50,8 +108,14 @@ class Board:
     def set_fen(self, fen):
         """Set the board position from FEN string."""
         self.board.set_fen(fen)
+        self.root_fen = fen
+        self.zobrist_key = zobrist.compute_key(self.board)
+        self._key_history = []
+        self.pawn_key = zobrist.compute_pawn_key(self.board)
+        self._pawn_key_history = []
+        if self.accumulator is not None:
+            self.accumulator.reset(self.board)
         self._phase = None  # Reset phase cache
-        self._position_cache = {}  # Reset evaluation cache
     
     def get_phase(self):
         """Get the current game phase."""
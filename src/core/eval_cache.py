@@ -0,0 +1,76 @@
+"""
+SlowMate Chess Engine - Evaluation Cache Module
+Bounded LRU cache of static evaluations keyed by Zobrist hash
+Version: 1.0.0-BETA
+
+The cache belongs to the evaluator, not to a Board, so entries survive
+make/unmake, iterative-deepening iterations and moves of the game.
+"""
+
+from collections import OrderedDict
+from typing import Optional
+
+
+ENTRY_BYTES = 160  # Approximate cost of one OrderedDict entry (int key, float value)
+
+
+class EvalCache:
+    """Least-recently-used cache of static evaluation scores."""
+
+    def __init__(self, size_mb: int = 16):
+        """Create a cache of roughly size_mb megabytes (0 disables caching)."""
+        self._entries = OrderedDict()
+        self.capacity = 0
+        self.hits = 0
+        self.misses = 0
+        self.resize(size_mb)
+
+    def resize(self, size_mb: int) -> None:
+        """Change the capacity, evicting the least recently used entries if needed."""
+        self.size_mb = max(0, size_mb)
+        self.capacity = self.size_mb * 1024 * 1024 // ENTRY_BYTES
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        self._entries.clear()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Reset the hit/miss counters (once per search)."""
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: int) -> Optional[float]:
+        """Return the cached score for key, or None."""
+        score = self._entries.get(key)
+        if score is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return score
+
+    def put(self, key: int, score: float) -> None:
+        """Store a score, evicting the least recently used entry when full."""
+        if self.capacity == 0:
+            return
+        entries = self._entries
+        entries[key] = score
+        entries.move_to_end(key)
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def hit_rate(self) -> float:
+        """Fraction of probes answered from the cache."""
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+    def stats_string(self) -> str:
+        """Counters formatted for an info string."""
+        return (f"eval cache hits {self.hits} misses {self.misses} "
+                f"hitrate {self.hit_rate() * 100:.1f}% entries {len(self._entries)}")
@@ -101,9 +101,12 @@ class AdvancedOpeningBook:
             'tactical_awareness': 25   # Bonus for tactical possibilities
         }
     
-    def select_strategic_move(self, board: chess.Board, opponent_id: str = "V7P3R") -> Optional[str]:
+    def select_strategic_move(self, board: chess.Board, opponent_id: str = "V7P3R",
+                              deterministic: bool = False) -> Optional[str]:
         """Select opening move based on strategic considerations.
         
+        With deterministic=True the highest-weighted move is chosen instead
+        of a random one (reproducible fixed-node searches).
         Returns None if we're out of opening (move > 15) or no book move available.
         """
         # CRITICAL FIX: Only use opening book for first 15 moves (30 half-moves)
@@ -121,11 +124,14 @@ class AdvancedOpeningBook:
                 if len(moves_data) > 0:
                     if isinstance(moves_data[0], str):
                         # Old format - just return random move
+                        if deterministic:
+                            return moves_data[0]
                         return random.choice(moves_data)
                     elif isinstance(moves_data[0], dict):
                         # New format - use strategic selection
                         opponent_style = self._analyze_opponent_style(opponent_id)
-                        best_move = self._select_by_strategy(moves_data, opponent_style, board)
+                        best_move = self._select_by_strategy(moves_data, opponent_style, board,
+                                                             deterministic)
                         if best_move:
                             return best_move['move']
         
@@ -144,7 +150,8 @@ class AdvancedOpeningBook:
         else:
             return "unknown"
     
-    def _select_by_strategy(self, moves_data: List[Dict], opponent_style: str, board: chess.Board) -> Optional[Dict]:
+    def _select_by_strategy(self, moves_data: List[Dict], opponent_style: str, board: chess.Board,
+                            deterministic: bool = False) -> Optional[Dict]:
         """Select move based on strategic considerations against opponent."""
         # Weight adjustments based on opponent
         style_preferences = {
@@ -165,6 +172,10 @@ class AdvancedOpeningBook:
             
             adjusted_moves.append({**move_data, 'adjusted_weight': weight})
         
+        # Deterministic mode: highest adjusted weight, first listed on ties
+        if deterministic:
+            return max(adjusted_moves, key=lambda move: move['adjusted_weight']) if adjusted_moves else None
+        
         # Select based on weighted random choice
         total_weight = sum(move['adjusted_weight'] for move in adjusted_moves)
         if total_weight == 0:
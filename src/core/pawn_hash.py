@@ -0,0 +1,181 @@
+"""
+SlowMate Chess Engine - Pawn Hash Table Module
+Caches pawn-structure evaluation keyed by a pawn-only Zobrist key
+Version: 1.0.0-BETA
+
+Pawn structure rarely changes between sibling nodes, so the doubled,
+isolated and passed pawn score, the open/semi-open file masks and the king
+pawn shields are computed from bitboards once per pawn configuration and
+reused until the slot is overwritten.
+"""
+
+import chess
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+
+def _build_passed_masks() -> List[List[int]]:
+    """PASSED_MASKS[color][square]: squares ahead on the pawn's file and both neighbours."""
+    masks = [[0] * 64 for _ in chess.COLORS]
+    for square in chess.SQUARES:
+        file = chess.square_file(square)
+        rank = chess.square_rank(square)
+        files = 0
+        for check_file in (file - 1, file, file + 1):
+            if 0 <= check_file <= 7:
+                files |= chess.BB_FILES[check_file]
+        ahead_white = 0
+        for check_rank in range(rank + 1, 8):
+            ahead_white |= chess.BB_RANKS[check_rank]
+        ahead_black = 0
+        for check_rank in range(rank):
+            ahead_black |= chess.BB_RANKS[check_rank]
+        masks[chess.WHITE][square] = files & ahead_white
+        masks[chess.BLACK][square] = files & ahead_black
+    return masks
+
+
+def _build_shield_masks() -> List[List[Tuple[int, int]]]:
+    """SHIELD_MASKS[color][king_square]: (one rank ahead, two ranks ahead) on three files."""
+    masks = [[(0, 0)] * 64 for _ in chess.COLORS]
+    for square in chess.SQUARES:
+        file = chess.square_file(square)
+        rank = chess.square_rank(square)
+        files = 0
+        for check_file in (file - 1, file, file + 1):
+            if 0 <= check_file <= 7:
+                files |= chess.BB_FILES[check_file]
+        for color, direction in ((chess.WHITE, 1), (chess.BLACK, -1)):
+            near = far = 0
+            if 0 <= rank + direction <= 7:
+                near = files & chess.BB_RANKS[rank + direction]
+            if 0 <= rank + 2 * direction <= 7:
+                far = files & chess.BB_RANKS[rank + 2 * direction]
+            masks[color][square] = (near, far)
+    return masks
+
+
+PASSED_MASKS = _build_passed_masks()
+SHIELD_MASKS = _build_shield_masks()
+
+
+@dataclass
+class PawnEntry:
+    """Pawn structure data for one pawn configuration."""
+    key: int            # Pawn-only Zobrist key
+    white_pawns: int    # Bitboards the entry was computed from
+    black_pawns: int
+    score: int          # Doubled/isolated/passed pawn score (White's perspective)
+    passed: int         # Bitboard of passed pawns (both colors)
+    open_files: int     # Bit f set when file f has no pawns at all
+    semi_open: Tuple[int, int]  # [color]: bit f set when file f has no pawns of that color
+    shields: Dict[Tuple[bool, int], int] = field(default_factory=dict)
+
+    def shield(self, color: chess.Color, king_square: int) -> int:
+        """Pawn shield score for a king of the given color, cached per king square."""
+        cache_key = (color, king_square)
+        score = self.shields.get(cache_key)
+        if score is None:
+            pawns = self.white_pawns if color == chess.WHITE else self.black_pawns
+            near, far = SHIELD_MASKS[color][king_square]
+            score = 10 * chess.popcount(pawns & near) + 5 * chess.popcount(pawns & far)
+            self.shields[cache_key] = score
+        return score
+
+    def rook_file_score(self, file: int, color: chess.Color) -> int:
+        """Open file 20, semi-open file 10, closed file 0."""
+        if self.open_files >> file & 1:
+            return 20
+        if self.semi_open[color] >> file & 1:
+            return 10
+        return 0
+
+
+def compute_pawn_entry(board: chess.Board, key: int) -> PawnEntry:
+    """Evaluate the pawn structure of a position from its pawn bitboards."""
+    pawns_by_color = (board.pawns & board.occupied_co[chess.BLACK],
+                      board.pawns & board.occupied_co[chess.WHITE])
+    score = 0
+    passed = 0
+    semi_open = [0, 0]
+
+    for color in (chess.WHITE, chess.BLACK):
+        color_factor = 1 if color == chess.WHITE else -1
+        pawns = pawns_by_color[color]
+        opponent_pawns = pawns_by_color[not color]
+
+        files = [chess.popcount(pawns & file_mask) for file_mask in chess.BB_FILES]
+        for file_idx, pawn_count in enumerate(files):
+            if pawn_count == 0:
+                semi_open[color] |= 1 << file_idx
+                continue
+
+            # Doubled pawns penalty
+            if pawn_count > 1:
+                score += (pawn_count - 1) * -20 * color_factor
+
+            # Isolated pawns penalty
+            if (file_idx == 0 or files[file_idx - 1] == 0) and \
+               (file_idx == 7 or files[file_idx + 1] == 0):
+                score += -15 * color_factor
+
+        # Passed pawns bonus
+        for pawn in chess.scan_forward(pawns):
+            if not PASSED_MASKS[color][pawn] & opponent_pawns:
+                passed |= chess.BB_SQUARES[pawn]
+                rank = chess.square_rank(pawn)
+                bonus = (rank - 1) * 10 if color == chess.WHITE else (6 - rank) * 10
+                score += bonus * color_factor
+
+    return PawnEntry(
+        key=key,
+        white_pawns=pawns_by_color[chess.WHITE],
+        black_pawns=pawns_by_color[chess.BLACK],
+        score=score,
+        passed=passed,
+        open_files=semi_open[chess.WHITE] & semi_open[chess.BLACK],
+        semi_open=tuple(semi_open),
+    )
+
+
+class PawnHashTable:
+    """Fixed-size, always-replace pawn hash table."""
+
+    def __init__(self, size: int = 16384):
+        """Create a table with size slots (rounded down to a power of two)."""
+        self.size = 1 << max(0, size.bit_length() - 1)
+        self.mask = self.size - 1
+        self.slots: List[Optional[PawnEntry]] = [None] * self.size
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        self.slots = [None] * self.size
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Reset the hit/miss counters (once per search)."""
+        self.hits = 0
+        self.misses = 0
+
+    def probe(self, board: chess.Board, key: int) -> PawnEntry:
+        """Return the entry for this pawn structure, computing it on a miss."""
+        index = key & self.mask
+        entry = self.slots[index]
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        entry = compute_pawn_entry(board, key)
+        self.slots[index] = entry
+        return entry
+
+    def hit_rate(self) -> float:
+        """Fraction of probes answered from the table."""
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+    def stats_string(self) -> str:
+        """Counters formatted for an info string."""
+        return f"pawn hash hits {self.hits} misses {self.misses} hitrate {self.hit_rate() * 100:.1f}%"
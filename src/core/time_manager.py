@@ -3,10 +3,15 @@ Advanced Time Management System for SlowMate Chess Engine
 Version: 1.1.0
 """
 
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, List, Tuple
 import time
 import chess
 
+
+# Soft limit scale by best-move stability (completed iterations with the same best move);
+# index 0 means the best move just changed
+STABILITY_FACTORS = (1.3, 1.0, 0.85, 0.7, 0.6)
+
 class TimeManager:
     """Advanced time management system with dynamic allocation and phase awareness."""
     
@@ -34,12 +39,28 @@ class TimeManager:
             'tactical_opportunities': 1.25,  # Slightly increased for deeper tactical play
         }
         
+        # Soft/hard limits: the soft limit decides whether to start another
+        # iteration and moves with the search results, the hard limit aborts
+        self.move_overhead = 0.05      # Seconds kept back for communication lag
+        self.hard_limit_factor = 3.0   # Hard limit as a multiple of the soft limit
+        self.max_score_drop = 150      # Score drop (cp) giving the largest extension
+        self.ponder = False            # Pondering enabled (UCI Ponder option)
+        self.ponder_factor = 1.25      # Soft limit scale when we expect ponder hits
+        self.soft_limit: float = 0
+        self.hard_limit: float = 0
+        
+        # Time bank: seconds saved by skipping iterations that could not finish
+        self.time_bank: float = 0
+        self.bank_spend_fraction = 0.5  # Share of the bank one move may draw
+        self.start_search()
+        
     def start_new_game(self):
         """Reset time manager for a new game."""
         self.remaining_time = 0
         self.increment = 0
         self.moves_to_go = None
         self.nodes_searched = 0
+        self.time_bank = 0
         
     def set_time_controls(self, wtime: Optional[int], btime: Optional[int], 
                          winc: Optional[int], binc: Optional[int], 
@@ -280,6 +301,152 @@ class TimeManager:
         self.allocated_time = max(min_time, min(allocated_time, max_time))
         return self.allocated_time
         
+    def calculate_limits(self, board: chess.Board, ply: int) -> Tuple[float, float]:
+        """Calculate the soft and hard time limits for the current move.
+        
+        Parameters
+        ----------
+        board : chess.Board
+            Current position
+        ply : int
+            Current ply number
+            
+        Returns
+        -------
+        Tuple[float, float]
+            (soft limit, hard limit) in seconds
+        """
+        # The move time is the most this move may cost; a typical search
+        # stops well before it, at the soft limit
+        available = max(self.emergency_move_time, self.remaining_time - self.move_overhead)
+        move_time = self.calculate_move_time(board, ply)
+        
+        # Spend part of the banked time (never more than the clock still holds)
+        self.time_bank = min(self.time_bank, self.remaining_time * 0.25)
+        bonus = max(0.0, min(self.time_bank * self.bank_spend_fraction, available - move_time))
+        self.time_bank -= bonus
+        
+        self.hard_limit = min(move_time + bonus, available)
+        self.soft_limit = self.hard_limit / self.hard_limit_factor
+        if self.ponder:
+            # Ponder hits hand back part of the opponent's time, so spend a little more
+            self.soft_limit = min(self.soft_limit * self.ponder_factor, self.hard_limit)
+        return self.soft_limit, self.hard_limit
+        
+    def start_search(self):
+        """Forget the iteration history of the previous search."""
+        self.iteration_nodes: List[int] = []
+        self.iteration_times: List[float] = []
+        self.predictions: List[Tuple[float, float]] = []  # (predicted, actual) seconds
+        self.iterations_skipped = 0
+        self.iterations_aborted = 0
+        self.last_best_move: Optional[chess.Move] = None
+        self.last_score: Optional[int] = None
+        self.best_move_stability = 0
+        self.best_move_changes = 0
+        self.score_drop = 0
+        
+    def update_iteration(self, depth: int, best_move: chess.Move, score: int):
+        """Record the result of a completed iteration.
+        
+        Parameters
+        ----------
+        depth : int
+            Depth of the completed iteration
+        best_move : chess.Move
+            Best root move of the iteration
+        score : int
+            Root score of the iteration (centipawns, side to move)
+        """
+        if self.last_best_move is None or best_move == self.last_best_move:
+            self.best_move_stability += 1
+        else:
+            self.best_move_stability = 0
+            self.best_move_changes += 1
+        self.score_drop = 0 if self.last_score is None else max(0, self.last_score - score)
+        self.last_best_move = best_move
+        self.last_score = score
+        
+    def record_iteration(self, nodes: int, seconds: float, predicted: Optional[float] = None):
+        """Record the cost of a completed iteration.
+        
+        Parameters
+        ----------
+        nodes : int
+            Nodes searched by the iteration
+        seconds : float
+            Time the iteration took
+        predicted : Optional[float]
+            Time predict_next_iteration() expected, if there was a prediction
+        """
+        self.iteration_nodes.append(nodes)
+        self.iteration_times.append(seconds)
+        if predicted is not None:
+            self.predictions.append((predicted, seconds))
+        
+    def record_aborted_iteration(self, seconds: float, predicted: Optional[float] = None):
+        """Record an iteration stopped before it completed (its true cost is at least seconds)."""
+        self.iterations_aborted += 1
+        if predicted is not None:
+            self.predictions.append((predicted, seconds))
+        
+    def predict_next_iteration(self) -> Optional[float]:
+        """Predict how long the next iteration will take.
+        
+        The last iteration's time is multiplied by the effective branching
+        factor, the average node growth over the last two iterations.
+        
+        Returns
+        -------
+        Optional[float]
+            Predicted seconds, or None before two iterations have completed
+        """
+        nodes = self.iteration_nodes
+        if len(nodes) < 2:
+            return None
+        ratios = [later / earlier for earlier, later in zip(nodes[-3:-1], nodes[-2:]) if earlier > 0]
+        if not ratios:
+            return None
+        branching_factor = sum(ratios) / len(ratios)
+        return self.iteration_times[-1] * branching_factor
+        
+    def skip_iteration(self, saved: float):
+        """Record an iteration that was not started because it could not finish.
+        
+        Parameters
+        ----------
+        saved : float
+            Seconds of the soft limit left unused; they go into the time bank
+        """
+        self.iterations_skipped += 1
+        self.time_bank += max(0.0, saved)
+        
+    def prediction_stats_string(self) -> str:
+        """Prediction accuracy formatted for an info string."""
+        if self.predictions:
+            errors = [abs(predicted - actual) / max(actual, 0.001) for predicted, actual in self.predictions]
+            error = f"{sum(errors) / len(errors) * 100:.0f}%"
+        else:
+            error = "n/a"
+        return (f"iteration prediction checks {len(self.predictions)} mean error {error} "
+                f"skipped {self.iterations_skipped} aborted {self.iterations_aborted} bank {self.time_bank:.3f}s")
+        
+    def adjusted_soft_limit(self) -> float:
+        """Soft limit scaled by the iterations seen so far.
+        
+        A best move that has survived several iterations ends the search
+        early; a new best move or a falling root score buys more time. The
+        result never exceeds the hard limit.
+        
+        Returns
+        -------
+        float
+            Soft limit in seconds
+        """
+        stability_factor = STABILITY_FACTORS[min(self.best_move_stability, len(STABILITY_FACTORS) - 1)]
+        score_factor = 1.0 + min(self.score_drop, self.max_score_drop) / (2.0 * self.max_score_drop)
+        return min(self.soft_limit * stability_factor * score_factor, self.hard_limit)
+        
     def should_stop(self, nodes: int, elapsed: float) -> bool:
         """Determine if search should stop based on time usage.
         
@@ -316,3 +483,28 @@ class TimeManager:
             
         # Standard time management
         return elapsed >= self.allocated_time
+
+
+class SimpleTimeManager(TimeManager):
+    """The v2.2 allocation: a fixed share of the clock, no search feedback.
+    
+    Spends remaining / (moves_to_go + 10) plus most of the increment,
+    between 1% and 10% of the clock. The soft limit is half of that and
+    does not move with best-move stability or score drops.
+    """
+    
+    def calculate_limits(self, board: chess.Board, ply: int) -> Tuple[float, float]:
+        """Calculate the soft and hard time limits for the current move."""
+        remaining = self.remaining_time
+        moves_to_go = self.moves_to_go or 40
+        move_time = remaining / (moves_to_go + 10) + self.increment * 0.8
+        move_time = max(min(0.5, remaining * 0.01), min(move_time, remaining * 0.1, 10.0))
+        
+        available = max(self.emergency_move_time, remaining - self.move_overhead)
+        self.hard_limit = min(move_time, available)
+        self.soft_limit = self.hard_limit * 0.5
+        return self.soft_limit, self.hard_limit
+        
+    def adjusted_soft_limit(self) -> float:
+        """The soft limit, unchanged by the iterations seen so far."""
+        return self.soft_limit
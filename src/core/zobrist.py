@@ -0,0 +1,115 @@
+"""
+SlowMate Chess Engine - Zobrist Hashing Module
+64-bit position keys maintained incrementally on make/unmake
+Version: 1.0.0-BETA
+
+Keys use the polyglot random array, so a full recomputation with
+chess.polyglot.zobrist_hash() always matches the incrementally updated key.
+"""
+
+import chess
+import chess.polyglot
+
+
+_RANDOM = chess.polyglot.POLYGLOT_RANDOM_ARRAY
+
+# PIECE_KEYS[color][piece_type][square] (polyglot orders black before white)
+PIECE_KEYS = [
+    [None] + [_RANDOM[64 * ((piece_type - 1) * 2 + color):64 * ((piece_type - 1) * 2 + color) + 64]
+              for piece_type in chess.PIECE_TYPES]
+    for color in (chess.BLACK, chess.WHITE)
+]
+
+# Castling keys indexed by rook square of the clean castling rights
+_CASTLING_SQUARE_KEYS = (
+    (chess.BB_H1, _RANDOM[768]),
+    (chess.BB_A1, _RANDOM[769]),
+    (chess.BB_H8, _RANDOM[770]),
+    (chess.BB_A8, _RANDOM[771]),
+)
+EP_FILE_KEYS = _RANDOM[772:780]
+TURN_KEY = _RANDOM[780]
+
+_castling_key_cache = {}
+
+
+def compute_key(board: chess.Board) -> int:
+    """Compute the full Zobrist key of a position from scratch."""
+    return chess.polyglot.zobrist_hash(board)
+
+
+def compute_pawn_key(board: chess.Board) -> int:
+    """Compute the pawn-only Zobrist key (pawn placement keys of both colors)."""
+    key = 0
+    for color in chess.COLORS:
+        pawn_keys = PIECE_KEYS[color][chess.PAWN]
+        for square in chess.scan_forward(board.pawns & board.occupied_co[color]):
+            key ^= pawn_keys[square]
+    return key
+
+
+def castling_key(board: chess.Board) -> int:
+    """Zobrist contribution of the castling rights."""
+    rights = board.clean_castling_rights()
+    key = _castling_key_cache.get(rights)
+    if key is None:
+        key = 0
+        for square_mask, random_key in _CASTLING_SQUARE_KEYS:
+            if rights & square_mask:
+                key ^= random_key
+        _castling_key_cache[rights] = key
+    return key
+
+
+def ep_key(board: chess.Board) -> int:
+    """Zobrist contribution of the en passant square (polyglot rules)."""
+    ep_square = board.ep_square
+    if ep_square is None:
+        return 0
+
+    # Only hashed if a pawn of the side to move is ready to capture
+    if board.turn == chess.WHITE:
+        ep_mask = chess.shift_down(chess.BB_SQUARES[ep_square])
+    else:
+        ep_mask = chess.shift_up(chess.BB_SQUARES[ep_square])
+    ep_mask = chess.shift_left(ep_mask) | chess.shift_right(ep_mask)
+
+    if ep_mask & board.pawns & board.occupied_co[board.turn]:
+        return EP_FILE_KEYS[chess.square_file(ep_square)]
+    return 0
+
+
+def move_piece_changes(board: chess.Board, move: chess.Move):
+    """List the (square, color, piece_type) placements a move removes and adds.
+
+    Must be called before the move is pushed. Returns (removed, added).
+    """
+    color = board.turn
+    from_square = move.from_square
+    to_square = move.to_square
+    piece_type = board.piece_type_at(from_square)
+
+    removed = [(from_square, color, piece_type)]
+
+    if piece_type == chess.KING and board.is_castling(move):
+        rank = chess.square_rank(from_square)
+        if board.is_kingside_castling(move):
+            king_to, rook_to = chess.square(6, rank), chess.square(5, rank)
+            default_rook = chess.square(7, rank)
+        else:
+            king_to, rook_to = chess.square(2, rank), chess.square(3, rank)
+            default_rook = chess.square(0, rank)
+        # Chess960-style encoding moves the king onto its own rook
+        rook_from = to_square if board.rooks & board.occupied_co[color] & chess.BB_SQUARES[to_square] else default_rook
+        removed.append((rook_from, color, chess.ROOK))
+        return removed, [(king_to, color, chess.KING), (rook_to, color, chess.ROOK)]
+
+    captured_type = board.piece_type_at(to_square)
+    if captured_type:
+        removed.append((to_square, not color, captured_type))
+    elif piece_type == chess.PAWN and to_square == board.ep_square and board.is_en_passant(move):
+        capture_square = to_square - 8 if color == chess.WHITE else to_square + 8
+        removed.append((capture_square, not color, chess.PAWN))
+
+    added = [(to_square, color, move.promotion or piece_type)]
+    return removed, added
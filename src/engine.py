@@ -8,49 +8,97 @@ Also includes v3.3 mate detection fix in quiescence search.
 import chess
 import time
 import math
+import threading
 from typing import Optional, List, Tuple, Dict, Any
 
+from .components import REGISTRY
 from .core.board import Board
 from .core.moves import MoveGenerator
-from .core.enhanced_evaluate import EnhancedEvaluator
 from .core.opening_book import AdvancedOpeningBook
-from .search.enhanced import TranspositionTable, MoveOrderer, NodeType
+from .core.zobrist import compute_key
+from .search.enhanced import CutoffStats, MoveOrderer, NodeType
+from .search.picker import MovePicker, quiescence_moves
+from .search.limits import SearchLimits
+from .search.reductions import LateMoveReductions
+from .search.smp import SharedTranspositionTable, LazySMPPool
 from .uci.protocol_v2_2 import UCIProtocol
 
 
+MAX_PLY = 64  # Deepest ply the triangular PV table holds
+MATE_BOUND = 20000  # Scores beyond this are mate scores (mate is 30000 - ply)
+
+
 class SlowMateEngine:
     """SlowMate v3.3 - Mate Detection Fix for Competitive Play."""
     
-    def __init__(self):
-        """Initialize the production chess engine."""
+    def __init__(self, components: Optional[Dict[str, str]] = None, tt=None):
+        """Initialize the production chess engine.
+        
+        components maps a component kind (searcher, evaluator,
+        move_ordering, tt, time_manager) to a name registered in
+        src/components.py; kinds left out get the registry default.
+        tt is an already created hash table to use instead of a new one
+        (Lazy SMP helpers attach to the shared table this way).
+        """
+        self.components = {kind: REGISTRY.default(kind) for kind in REGISTRY.kinds()}
+        self.components.update(components or {})
         self.board = Board()
         self.move_generator = MoveGenerator(self.board)
-        self.evaluator = EnhancedEvaluator()
+        self.evaluator = REGISTRY.create('evaluator', self.components['evaluator'])
+        self.board.attach_accumulator(self.evaluator.create_accumulator())
         self.opening_book = AdvancedOpeningBook()  # v3.2: Enhanced opening book
-        self.tt = TranspositionTable(size_mb=64)
-        self.move_orderer = MoveOrderer()
+        self.tt = tt if tt is not None else REGISTRY.create('tt', self.components['tt'], 64)
+        self.move_orderer = MoveOrderer()  # Root move ordering
+        self.move_ordering = REGISTRY.create('move_ordering', self.components['move_ordering'])
+        self.searcher = REGISTRY.create('searcher', self.components['searcher'])
         self.uci = UCIProtocol(self)
         self.nodes = 0
+        self.qnodes = 0  # Quiescence nodes (included in nodes)
         self.max_depth = 6
         self.search_deadline = None
+        self.limits = SearchLimits(lambda: self.uci.stop_requested)
         self.last_score = None
         self.start_time = None
+        self.completed_depth = 0  # Deepest completed iteration of the last search (0 = book move)
         self.current_pv = []  # Principal variation line
+        self.multi_pv = 1  # Root lines searched and reported (UCI MultiPV)
+        self.use_book = True  # Play opening book moves (UCI OwnBook)
+        self.multipv_lines = []  # (score, pv) per line of the last completed iteration
+        
+        # Triangular PV table: row ply holds the best line from ply onwards
+        self.pv_table = [[None] * MAX_PLY for _ in range(MAX_PLY)]
+        self.pv_length = [0] * MAX_PLY
+        self.static_evals = [None] * (MAX_PLY + 1)  # Static eval by ply (None in check)
         
         # v3.0: Advanced search parameters
         self.aspiration_window = 50
         self.null_move_reduction = 2
-        self.late_move_reduction_threshold = 4
+        self.lmr = LateMoveReductions()  # Reduction table shared by every searcher
+        self.internal_iterative_depth = 4  # Shallowest node IIR/IID applies to
+        self.cutoff_stats = CutoffStats()  # First-move cutoff rate per depth
         self.quiescence_max_depth = 4
         
         # v3.0: History and killer move management
         self.history_table = {}
         self.killer_moves = [[] for _ in range(20)]
         self.counter_moves = {}
+        self.history_decay_shift = 1  # History scores are halved between moves
+        
+        # Time management: soft/hard limits for clock searches
+        self.time_manager = REGISTRY.create('time_manager', self.components['time_manager'])
+        self.time_managed = False  # Current search runs on the game clock
+        self.default_move_time = 2.0  # Seconds when a search has no limit at all
+        
+        # Pondering: the clock limits wait until ponderhit
+        self.pondering = False
+        self.ponderhit_pending = False  # ponderhit arrived before the ponder search started
+        self._ponder_lock = threading.Lock()
+        self.ponder_limits = (None, None)  # (soft, hard) seconds applied at ponderhit
         
-        # v3.0: Time management improvements
-        self.time_scaling_factor = 1.0
-        self.complexity_bonus = 0.0
+        # Lazy SMP: helper processes sharing the transposition table
+        self.threads = 1
+        self.smp_pool = None
+        self.root_move_rotation = 0  # Root move order perturbation (helpers)
         
     def get_version(self) -> str:
         """Return engine version."""
@@ -58,9 +106,15 @@ class SlowMateEngine:
         
     def new_game(self):
         """Reset the engine for a new game."""
-        self.board = Board()
-        self.move_generator = MoveGenerator(self.board)
-        self.tt = TranspositionTable(size_mb=64)
+        self.board.set_fen(chess.STARTING_FEN)
+        self.time_manager.start_new_game()
+        self._reset_search_state()
+        
+    def _reset_search_state(self):
+        """Forget everything earlier searches learned (hash tables, ordering tables)."""
+        self.tt.clear()
+        self.evaluator.pawn_hash.clear()
+        self.evaluator.eval_cache.clear()
         self.move_orderer = MoveOrderer()
         self.nodes = 0
         self.last_score = None
@@ -70,13 +124,137 @@ class SlowMateEngine:
         self.killer_moves = [[] for _ in range(20)]
         self.counter_moves.clear()
         
-    def set_position(self, position: str):
-        """Set the board position."""
-        if position == "startpos":
-            self.board = Board()
+    def _age_search_state(self):
+        """Carry ordering data over to the next move: halve history, drop killers.
+        
+        The TT keeps its entries; tt.new_search() starts a new generation.
+        """
+        history = self.history_table
+        for key in list(history):
+            score = history[key] >> self.history_decay_shift
+            if score:
+                history[key] = score
+            else:
+                del history[key]
+        self.killer_moves = [[] for _ in range(20)]
+        
+    def set_threads(self, threads: int):
+        """Set the number of search processes (1 = single-threaded search)."""
+        threads = max(1, threads)
+        if self.smp_pool:
+            self.smp_pool.shutdown()
+            self.smp_pool = None
+        
+        size_mb = self.tt.size_mb
+        if threads > 1:
+            # Helpers need the shared table whichever table was selected
+            if not isinstance(self.tt, SharedTranspositionTable):
+                self.tt = REGISTRY.create('tt', 'shared', size_mb)
+            self.smp_pool = LazySMPPool(threads - 1, self.tt, self.components)
+        elif self.components['tt'] != 'shared' and isinstance(self.tt, SharedTranspositionTable):
+            self.tt.close()
+            self.tt = REGISTRY.create('tt', self.components['tt'], size_mb)
+        self.threads = threads
+        
+    def set_component(self, kind: str, name: str):
+        """Swap the kind component for the registered implementation name.
+        
+        Call between searches. Sizes and settings carry over; the new
+        component starts without the old one's learned state. With
+        helper threads running, the hash table stays shared and the
+        helpers restart with the new choices.
+        """
+        component = None
+        if kind != 'tt':
+            component = REGISTRY.create(kind, name)
+        elif name not in REGISTRY.names('tt'):
+            raise ValueError(f"Unknown tt: {name}")
+        self.components[kind] = name
+        
+        if kind == 'evaluator':
+            component.eval_cache.resize(self.evaluator.eval_cache.size_mb)
+            self.evaluator = component
+            self.board.attach_accumulator(component.create_accumulator())
+        elif kind == 'time_manager':
+            component.ponder = self.time_manager.ponder
+            self.time_manager = component
+        elif kind == 'searcher':
+            component.pruning = self.searcher.pruning  # Pruning switches and margins
+            component.internal_iterative = self.searcher.internal_iterative
+            self.searcher = component
+        elif kind == 'tt':
+            if not self.smp_pool and name != self.tt_name():
+                size_mb = self.tt.size_mb
+                if isinstance(self.tt, SharedTranspositionTable):
+                    self.tt.close()
+                self.tt = REGISTRY.create('tt', name, size_mb)
+        else:
+            setattr(self, kind, component)
+        if self.smp_pool:
+            self.set_threads(self.threads)
+        
+    def tt_name(self) -> str:
+        """Registry name of the hash table in use."""
+        return 'shared' if isinstance(self.tt, SharedTranspositionTable) else 'local'
+        
+    def resize_hash(self, size_mb: int):
+        """Resize the transposition table (helpers reattach to the new table)."""
+        self.tt.resize(size_mb)
+        if self.smp_pool:
+            self.set_threads(self.threads)
+        
+    def search_settings(self) -> Dict[str, object]:
+        """Search settings UCI options change between searches (sent to Lazy SMP helpers)."""
+        return {
+            'pruning': self.searcher.pruning,  # Switches and margins
+            'lmr': self.lmr,
+            'internal_iterative': self.searcher.internal_iterative,
+            'internal_iterative_depth': self.internal_iterative_depth
+        }
+        
+    def apply_search_settings(self, settings: Dict[str, object]):
+        """Take over settings from another engine's search_settings()."""
+        self.searcher.pruning = settings['pruning']
+        self.lmr = settings['lmr']
+        self.searcher.internal_iterative = settings['internal_iterative']
+        self.internal_iterative_depth = settings['internal_iterative_depth']
+        
+    def set_multi_pv(self, lines: int):
+        """Set the number of root lines to search and report (1 = normal play)."""
+        self.multi_pv = max(1, lines)
+        
+    def resize_eval_cache(self, size_mb: int):
+        """Resize the static evaluation cache (0 disables it)."""
+        self.evaluator.eval_cache.resize(size_mb)
+        
+    def set_position(self, position: str, moves: Optional[List[chess.Move]] = None):
+        """Set the board to position ("startpos" or a FEN) followed by moves.
+        
+        In a game each new position extends the last one by a move or two,
+        so when the root is unchanged only the moves after the common
+        prefix are unmade and made; the board, its key history and the
+        evaluation accumulator are kept. Raises ValueError at the first
+        illegal move (the moves before it stay on the board).
+        """
+        root = chess.STARTING_FEN if position == "startpos" else position
+        moves = moves or []
+        played = self.board.board.move_stack
+        
+        if root == self.board.root_fen:
+            common = 0
+            limit = min(len(played), len(moves))
+            while common < limit and played[common] == moves[common]:
+                common += 1
+            for _ in range(len(played) - common):
+                self.board.unmake_move()
         else:
-            self.board.set_fen(position)
-        self.move_generator = MoveGenerator(self.board)
+            self.board.set_fen(root)
+            common = 0
+        
+        for move in moves[common:]:
+            if not self.board.board.is_legal(move):
+                raise ValueError(f"Illegal move: {move.uci()}")
+            self.board.make_move(move)
         
     def make_move(self, move: chess.Move):
         """Make a move on the board."""
@@ -87,31 +265,105 @@ class SlowMateEngine:
     def search(self, time_limit_ms: Optional[int] = None, depth_override: Optional[int] = None, *,
              wtime: Optional[int] = None, btime: Optional[int] = None,
              winc: Optional[int] = None, binc: Optional[int] = None,
-             moves_to_go: Optional[int] = None) -> Optional[chess.Move]:
+             moves_to_go: Optional[int] = None, nodes: Optional[int] = None,
+             infinite: bool = False, ponder: bool = False) -> Optional[chess.Move]:
         """
         Search for the best move using iterative deepening with enhanced time management.
         
+        time_limit_ms is a fixed move time; wtime/btime/winc/binc/moves_to_go
+        are the game clock, turned into soft and hard limits by the
+        TimeManager. A search limited only by depth_override or nodes runs
+        without a deadline, and with no limit at all it gets 2 seconds.
+        An infinite search runs until stopped through the UCI stop flag.
+        
+        A node-limited search is deterministic: it starts from cleared hash
+        and ordering tables, picks book moves without randomness and runs
+        without Lazy SMP helpers, so the same position and budget always
+        give the same best move, node count and PV.
+        
+        A ponder search runs like an infinite one on the position after the
+        expected reply; ponderhit() then starts the clock limits from that
+        moment without restarting the search.
+        
+        With multi_pv above 1 the book is skipped and every iteration
+        searches the best multi_pv root moves one after another, each line
+        excluding the moves of the lines above it; multipv_lines holds the
+        result.
+        
         Returns:
             The best move found, or None if no legal moves available
         """
+        with self._ponder_lock:
+            self.pondering = ponder and not self.ponderhit_pending
+            self.ponderhit_pending = False
+        fixed_nodes = nodes is not None
+        if fixed_nodes:
+            self._reset_search_state()
+        else:
+            self._age_search_state()
         self.nodes = 0
+        self.qnodes = 0
         self.last_score = None
+        self.completed_depth = 0
+        self.multipv_lines = []
         self.start_time = time.time()
         self.uci.stop_requested = False
-        
-        # Calculate time allocation
-        allocated_time = self._calculate_time_allocation(
-            wtime, btime, winc, binc, moves_to_go, time_limit_ms
-        )
-        self.search_deadline = self.start_time + allocated_time
-        
-        try:
-            self.uci._out(f"info string SlowMate v3.2 - Allocated time: {allocated_time:.3f}s")
-        except Exception:
+        self.tt.new_search()
+        self.evaluator.pawn_hash.reset_stats()
+        self.evaluator.eval_cache.reset_stats()
+        self.searcher.pruning.reset_stats()
+        self.cutoff_stats.reset()
+        self.time_manager.start_search()
+        
+        # Time limits: the soft limit decides whether another iteration
+        # starts, the hard limit aborts the iteration in flight
+        soft_time = hard_time = None
+        default_limits = False
+        self.time_managed = False
+        if infinite:
             pass
-        
-        # v3.2: Check opening book first
-        book_move = self.opening_book.select_strategic_move(self.board.board, "V7P3R")
+        elif time_limit_ms:
+            soft_time = hard_time = time_limit_ms / 1000.0  # Fixed move time may be used up
+        elif wtime or btime:
+            soft_time, hard_time = self._calculate_time_limits(wtime, btime, winc, binc, moves_to_go)
+            self.time_managed = True
+        elif not (depth_override or nodes):
+            default_limits = True
+            hard_time = self.default_move_time
+            soft_time = hard_time * 0.8
+        
+        # Determine search depth (searches on a clock go as deep as time allows)
+        if depth_override:
+            max_depth = depth_override
+        elif default_limits:
+            max_depth = self.max_depth
+        else:
+            max_depth = MAX_PLY - 1
+        
+        if ponder:
+            # Search without a deadline until ponderhit; the limits apply from then on
+            self.ponder_limits = (soft_time, hard_time)
+            if not depth_override:
+                max_depth = MAX_PLY - 1
+        self.limits.start(depth=max_depth, nodes=nodes, soft_time=soft_time,
+                          hard_time=hard_time, infinite=infinite or ponder,
+                          start_time=self.start_time)
+        if ponder and not self.pondering:
+            self.limits.ponderhit(*self.ponder_limits)  # ponderhit arrived before or during setup
+        self.search_deadline = self.limits.hard_deadline
+        
+        if hard_time is not None:
+            try:
+                self.uci._out(f"info string SlowMate v3.2 - Allocated time: soft {soft_time:.3f}s "
+                              f"hard {hard_time:.3f}s")
+            except Exception:
+                pass
+        
+        # v3.2: Check opening book first (not when analysing several lines)
+        book_move = None
+        if self.multi_pv == 1 and self.use_book:
+            book_move = self.opening_book.select_strategic_move(self.board.board, "V7P3R",
+                                                                deterministic=fixed_nodes)
         if book_move:
             try:
                 move = chess.Move.from_uci(book_move)
@@ -128,249 +380,262 @@ class SlowMateEngine:
         moves = self.move_generator.get_legal_moves()
         if not moves:
             return None
-            
+        
+        # Lazy SMP: helpers search the same root while we do (not in fixed-node mode)
+        use_helpers = self.smp_pool is not None and not fixed_nodes
+        if use_helpers:
+            self.smp_pool.start_search(self.board.board, max_depth, self.search_deadline,
+                                       self.search_settings())
+        
+        best_move, best_score, best_depth, best_pv = self._iterative_deepening(moves, max_depth)
+        
+        if use_helpers:
+            for depth, score, move, pv, nodes in self.smp_pool.stop_search():
+                self.nodes += nodes
+                # Prefer the deepest completed iteration; ties keep our own result.
+                # MultiPV keeps its own lines; the helpers only fill the TT.
+                if move in moves and depth > best_depth and self.multi_pv == 1:
+                    best_move, best_score, best_depth, best_pv = move, score, depth, pv
+            self.current_pv = best_pv
+            self.last_score = best_score
+        self.completed_depth = best_depth
+        
+        try:
+            self.uci._out(f"info string {self.evaluator.pawn_hash.stats_string()}")
+            self.uci._out(f"info string {self.evaluator.eval_cache.stats_string()}")
+            self.uci._out(f"info string {self.time_manager.prediction_stats_string()}")
+            self.uci._out(f"info string {self.cutoff_stats.stats_string()}")
+            self.uci._out(f"info string {self.searcher.pruning.stats_string()}")
+        except Exception:
+            pass
+                
+        return best_move
+    
+    def ponderhit(self):
+        """The opponent played the expected move: put the ponder search on the clock.
+        
+        A ponderhit before the ponder search has started is kept pending
+        and applied by search() once the limits are set.
+        """
+        with self._ponder_lock:
+            if not self.pondering:
+                self.ponderhit_pending = True
+                return
+            self.pondering = False
+        soft_time, hard_time = self.ponder_limits
+        if self.time_managed and soft_time is not None:
+            soft_time = self.time_manager.adjusted_soft_limit()  # Stability seen while pondering
+        self.limits.ponderhit(soft_time, hard_time)
+    
+    def get_ponder_move(self, best_move: chess.Move) -> Optional[chess.Move]:
+        """Expected reply to best_move: the second PV move, else the TT move after best_move."""
+        board = self.board.board.copy(stack=False)
+        if best_move not in board.legal_moves:
+            return None
+        board.push(best_move)
+        if len(self.current_pv) >= 2 and self.current_pv[0] == best_move:
+            ponder_move = self.current_pv[1]
+        else:
+            ponder_move = self.tt.probe_move(compute_key(board))
+        if ponder_move is not None and ponder_move in board.legal_moves:
+            return ponder_move
+        return None
+    
+    def _iterative_deepening(self, moves: List[chess.Move], max_depth: int,
+                             start_depth: int = 1) -> Tuple[chess.Move, int, int, List[chess.Move]]:
+        """Run iterative deepening on the root moves.
+        
+        Stops on self.limits, which must have been started for this search.
+        Returns (best_move, score, completed_depth, pv) of the last completed iteration.
+        """
         best_move = moves[0]  # Fallback move
         best_score = -30000
+        completed_depth = 0
         
-        # Determine search depth
-        max_depth = depth_override if depth_override else self.max_depth
-        if allocated_time >= 10:
-            max_depth = max(max_depth, 8)
-        elif allocated_time >= 5:
-            max_depth = max(max_depth, 7)
-        
-        # Iterative deepening search
-        for current_depth in range(1, max_depth + 1):
-            if self.uci.stop_requested:
+        for current_depth in range(start_depth, max_depth + 1):
+            if not self.limits.allows_depth(current_depth):
                 break
-                
-            alpha = -30000
-            beta = 30000
-            
-            # Aspiration windows for deeper searches
-            if current_depth >= 4 and self.last_score is not None:
-                alpha = self.last_score - self.aspiration_window
-                beta = self.last_score + self.aspiration_window
-            
-            iteration_best_move, iteration_best_score, iteration_pv = self._search_depth_with_pv(
-                current_depth, alpha, beta, moves
-            )
             
-            # Handle aspiration window failures
-            if (iteration_best_score <= alpha or iteration_best_score >= beta) and current_depth >= 4:
-                # Widen window and re-search
-                alpha = -30000
-                beta = 30000
-                iteration_best_move, iteration_best_score, iteration_pv = self._search_depth_with_pv(
-                    current_depth, alpha, beta, moves
+            # Do not start an iteration that is predicted to run past the hard deadline
+            predicted = self.time_manager.predict_next_iteration()
+            iteration_start = time.time()
+            if (predicted is not None and self.limits.hard_deadline is not None
+                    and iteration_start + predicted > self.limits.hard_deadline):
+                saved = 0.0
+                if self.time_managed and self.limits.soft_deadline is not None:
+                    saved = self.limits.soft_deadline - iteration_start
+                self.time_manager.skip_iteration(saved)
+                break
+            iteration_nodes = self.nodes
+            
+            if self.multi_pv > 1:
+                lines = self._search_multipv(current_depth, moves)
+                iteration_best_move = lines[0][1][0] if lines else None
+            else:
+                iteration_best_move, iteration_best_score, iteration_pv = self._search_root(
+                    current_depth, moves, self.last_score
                 )
+                lines = [(iteration_best_score, iteration_pv)]
             
             # Update best move if iteration completed
-            if not self.uci.stop_requested and iteration_best_move:
+            if self.limits.stopped:
+                self.time_manager.record_aborted_iteration(time.time() - iteration_start, predicted)
+            elif iteration_best_move:
+                self.time_manager.record_iteration(self.nodes - iteration_nodes,
+                                                   time.time() - iteration_start, predicted)
                 best_move = iteration_best_move
-                best_score = iteration_best_score
-                self.current_pv = iteration_pv
+                best_score, self.current_pv = lines[0]
+                completed_depth = current_depth
+                self.multipv_lines = lines
                 self.last_score = best_score
                 
                 try:
                     elapsed = time.time() - self.start_time
-                    nps = int(self.nodes / max(elapsed, 0.001))
-                    pv_string = " ".join([move.uci() for move in self.current_pv])
-                    self.uci._out(
-                        f"info depth {current_depth} score cp {best_score} "
-                        f"nodes {self.nodes} nps {nps} time {int(elapsed * 1000)} "
-                        f"pv {pv_string}"
-                    )
+                    nodes = self.nodes + (self.smp_pool.helper_nodes() if self.smp_pool else 0)
+                    nps = int(nodes / max(elapsed, 0.001))
+                    for index, (score, pv) in enumerate(lines, 1):
+                        multipv = f"multipv {index} " if self.multi_pv > 1 else ""
+                        pv_string = " ".join([move.uci() for move in pv])
+                        self.uci._out(
+                            f"info depth {current_depth} {multipv}score cp {score} "
+                            f"nodes {nodes} nps {nps} time {int(elapsed * 1000)} "
+                            f"hashfull {self.tt.hashfull()} pv {pv_string}"
+                        )
                 except Exception:
                     pass
+                
+                # Stable best moves end early; new best moves and score drops extend
+                if self.time_managed:
+                    self.time_manager.update_iteration(current_depth, best_move, best_score)
+                    self.limits.set_soft_time(self.time_manager.adjusted_soft_limit())
             
             # Time management: check if we should continue
-            elapsed = time.time() - self.start_time
-            if elapsed >= allocated_time * 0.8:  # Use 80% of allocated time
+            if self.limits.soft_expired():
                 break
                 
-        return best_move
-    
-    def _calculate_time_allocation(self, wtime: Optional[int], btime: Optional[int],
-                                 winc: Optional[int], binc: Optional[int],
-                                 moves_to_go: Optional[int], 
-                                 time_limit_ms: Optional[int]) -> float:
-        """Calculate optimal time allocation for the current move."""
-        if time_limit_ms:
-            return time_limit_ms / 1000.0
-            
-        # Default allocation if no time controls provided
-        if not wtime and not btime:
-            return 2.0
-            
-        # Get our remaining time and increment
-        our_time = wtime if self.board.board.turn == chess.WHITE else btime
-        our_inc = winc if self.board.board.turn == chess.WHITE else binc
-        
-        if not our_time:
-            return 2.0
-            
-        our_time /= 1000.0  # Convert to seconds
-        our_inc = (our_inc or 0) / 1000.0
-        
-        # Estimate moves remaining
-        game_length = len(self.board.board.move_stack)
-        estimated_moves_remaining = max(40 - game_length // 2, 15)
-        
-        if moves_to_go:
-            estimated_moves_remaining = min(estimated_moves_remaining, moves_to_go)
-        
-        # Basic time allocation: divide remaining time by estimated moves
-        base_time = our_time / estimated_moves_remaining + our_inc * 0.8
-        
-        # Complexity adjustments
-        position_complexity = self._evaluate_position_complexity()
-        if position_complexity > 0.7:
-            base_time *= 1.5  # Spend more time on complex positions
-        elif position_complexity < 0.3:
-            base_time *= 0.8  # Spend less time on simple positions
-            
-        # Ensure minimum and maximum bounds
-        base_time = max(0.1, min(base_time, our_time * 0.1))
-        
-        return base_time
+        return best_move, best_score, completed_depth, self.current_pv
     
-    def _evaluate_position_complexity(self) -> float:
-        """Evaluate the complexity of the current position (0.0 to 1.0)."""
+    def _calculate_time_limits(self, wtime: Optional[int], btime: Optional[int],
+                               winc: Optional[int], binc: Optional[int],
+                               moves_to_go: Optional[int]) -> Tuple[float, float]:
+        """Soft and hard time limits (seconds) for a search on the game clock."""
         board = self.board.board
-        complexity = 0.0
-        
-        # Material on board
-        total_material = sum(len(board.pieces(piece_type, color)) 
-                           for piece_type in chess.PIECE_TYPES 
-                           for color in chess.COLORS)
-        complexity += min(total_material / 32.0, 1.0) * 0.3
-        
-        # Number of legal moves
-        legal_moves = len(list(board.legal_moves))
-        complexity += min(legal_moves / 40.0, 1.0) * 0.4
-        
-        # Checks and tactics
-        if board.is_check():
-            complexity += 0.2
-        if any(board.is_capture(move) for move in board.legal_moves):
-            complexity += 0.1
-            
-        return min(complexity, 1.0)
+        self.time_manager.set_time_controls(wtime, btime, winc, binc, moves_to_go,
+                                            board.turn == chess.WHITE)
+        return self.time_manager.calculate_limits(board, board.ply())
+    
+    def _search_root(self, depth: int, moves: List[chess.Move], previous_score: Optional[int],
+                     first_move: Optional[chess.Move] = None,
+                     store_tt: bool = True) -> Tuple[Optional[chess.Move], int, List[chess.Move]]:
+        """Search the root moves at depth inside an aspiration window around previous_score."""
+        alpha = -30000
+        beta = 30000
+        
+        # Aspiration windows for deeper searches
+        if depth >= 4 and previous_score is not None:
+            alpha = previous_score - self.aspiration_window
+            beta = previous_score + self.aspiration_window
+        
+        best_move, best_score, pv = self._search_depth_with_pv(depth, alpha, beta, moves,
+                                                               first_move, store_tt)
+        
+        # Handle aspiration window failures
+        if (best_score <= alpha or best_score >= beta) and depth >= 4:
+            # Widen window and re-search
+            best_move, best_score, pv = self._search_depth_with_pv(depth, -30000, 30000, moves,
+                                                                   first_move, store_tt)
+        return best_move, best_score, pv
     
-    def _search_depth_with_pv(self, depth: int, alpha: int, beta: int, 
-                             moves: List[chess.Move]) -> Tuple[Optional[chess.Move], int, List[chess.Move]]:
-        """Search all moves at a given depth and collect principal variation."""
+    def _search_multipv(self, depth: int, moves: List[chess.Move]) -> List[Tuple[int, List[chess.Move]]]:
+        """Search the best multi_pv root lines at depth, best first.
+        
+        Line k searches the root moves not taken by lines 1..k-1 with its
+        own aspiration window around its score from the last iteration,
+        trying its last move first. Only the first line stores the root in
+        the TT, so the root entry keeps the overall best move. Returns the
+        lines found before the search was stopped.
+        """
+        lines = []
+        remaining = list(moves)
+        for index in range(min(self.multi_pv, len(moves))):
+            previous_score, first_move = None, None
+            if index < len(self.multipv_lines):
+                previous_score, previous_pv = self.multipv_lines[index]
+                if index > 0 and previous_pv[0] in remaining:
+                    first_move = previous_pv[0]
+            move, score, pv = self._search_root(depth, remaining, previous_score,
+                                                first_move, store_tt=index == 0)
+            if self.limits.stopped or move is None:
+                break
+            lines.append((score, list(pv)))
+            remaining.remove(move)
+        return lines
+    
+    def _search_depth_with_pv(self, depth: int, alpha: int, beta: int, moves: List[chess.Move],
+                              first_move: Optional[chess.Move] = None,
+                              store_tt: bool = True) -> Tuple[Optional[chess.Move], int, List[chess.Move]]:
+        """Search all root moves at a given depth (PVS) and return the principal variation.
+        
+        first_move is searched first instead of the TT move; store_tt=False
+        leaves the root TT entry alone (MultiPV lines after the first).
+        """
         best_move = None
         best_score = -30000
-        best_pv = []
+        original_alpha = alpha
+        self.pv_length[0] = 0
         
         # Order moves for better alpha-beta pruning
-        pos_key = hash(self.board.get_fen())
-        tt_entry = self.tt.lookup(pos_key, depth, alpha, beta)
-        tt_move = tt_entry[1] if tt_entry else None
+        pos_key = self.board.zobrist_key
+        tt_move = first_move or self.tt.probe_move(pos_key)
         
         ordered_moves = self.move_orderer.order_moves(
             self.board.board, moves, depth, tt_move,
             use_killer=True, prioritize_captures=True
         )
         
-        for i, move in enumerate(ordered_moves):
-            if self.uci.stop_requested:
-                break
-                
-            # Validate move legality
-            if move not in moves:
-                continue
-                
-            self.board.make_move(move)
-            
-            # Late move reduction for non-critical moves
-            reduction = 0
-            if (depth >= 3 and i >= self.late_move_reduction_threshold 
-                and not self.board.board.is_check() 
-                and not self.board.board.is_capture(move)):
-                reduction = 1
-            
-            score, child_pv = self._negamax_with_pv(depth - 1 - reduction, -beta, -alpha)
-            score = -score
-            
-            # Re-search if reduction failed high
-            if reduction > 0 and score > alpha:
-                score, child_pv = self._negamax_with_pv(depth - 1, -beta, -alpha)
-                score = -score
-            
-            self.board.unmake_move()
-            
-            if score > best_score:
-                best_score = score
-                best_move = move
-                best_pv = [move] + child_pv
-                alpha = max(alpha, score)
-                
-            if alpha >= beta:
-                # Update killer moves and history
-                if not self.board.board.is_capture(move):
-                    self._update_killer_move(move, depth)
-                    self._update_history(move, depth)
-                break
-                
-        # Store in transposition table
-        if best_move:
-            node_type = NodeType.EXACT
-            if best_score <= alpha:
-                node_type = NodeType.UPPER
-            elif best_score >= beta:
-                node_type = NodeType.LOWER
-            self.tt.store(pos_key, depth, best_score, node_type, best_move)
-            
-        return best_move, best_score, best_pv
-
-    def _search_depth(self, depth: int, alpha: int, beta: int, 
-                     moves: List[chess.Move]) -> Tuple[Optional[chess.Move], int]:
-        """Search all moves at a given depth."""
-        best_move = None
-        best_score = -30000
-        
-        # Order moves for better alpha-beta pruning
-        pos_key = hash(self.board.get_fen())
-        tt_entry = self.tt.lookup(pos_key, depth, alpha, beta)
-        tt_move = tt_entry[1] if tt_entry else None
+        root_in_check = self.board.board.is_check()
+        self.static_evals[0] = None
         
-        ordered_moves = self.move_orderer.order_moves(
-            self.board.board, moves, depth, tt_move,
-            use_killer=True, prioritize_captures=True
-        )
+        # Lazy SMP helpers perturb the order behind the first move
+        if self.root_move_rotation and len(ordered_moves) > 2:
+            shift = self.root_move_rotation % (len(ordered_moves) - 1)
+            ordered_moves = [ordered_moves[0]] + ordered_moves[1 + shift:] + ordered_moves[1:1 + shift]
         
         for i, move in enumerate(ordered_moves):
-            if self.uci.stop_requested:
+            if self.limits.stopped:
                 break
                 
             # Validate move legality
             if move not in moves:
                 continue
                 
+            quiet = not (move.promotion or self.board.board.is_capture(move))
             self.board.make_move(move)
             
-            # Late move reduction for non-critical moves
-            reduction = 0
-            if (depth >= 3 and i >= self.late_move_reduction_threshold 
-                and not self.board.board.is_check() 
-                and not self.board.board.is_capture(move)):
-                reduction = 1
-            
-            score = -self._negamax(depth - 1 - reduction, -beta, -alpha)
-            
-            # Re-search if reduction failed high
-            if reduction > 0 and score > alpha:
-                score = -self._negamax(depth - 1, -beta, -alpha)
+            if i == 0:
+                score = -self._negamax(depth - 1, -beta, -alpha, 1)
+            else:
+                # Late move reduction for quiet moves that don't give check
+                reduction = 0
+                if quiet and not root_in_check and not self.board.board.is_check():
+                    history = self.history_table.get((move.from_square, move.to_square), 0)
+                    reduction = self.lmr.reduction(depth, i + 1, beta - alpha > 1, True, history)
+                
+                # Null window first; re-search when the move might beat alpha
+                score = -self._negamax(depth - 1 - reduction, -alpha - 1, -alpha, 1, True)
+                if reduction > 0 and score > alpha:
+                    score = -self._negamax(depth - 1, -alpha - 1, -alpha, 1, True)
+                if alpha < score < beta:
+                    score = -self._negamax(depth - 1, -beta, -alpha, 1)
             
             self.board.unmake_move()
             
             if score > best_score:
                 best_score = score
                 best_move = move
-                alpha = max(alpha, score)
+                if score > alpha:
+                    alpha = score
+                    self._update_pv(0, move)
                 
             if alpha >= beta:
                 # Update killer moves and history
@@ -380,178 +645,197 @@ class SlowMateEngine:
                 break
                 
         # Store in transposition table
-        if best_move:
+        if best_move and store_tt and not self.limits.stopped:
             node_type = NodeType.EXACT
-            if best_score <= alpha:
+            if best_score <= original_alpha:
                 node_type = NodeType.UPPER
             elif best_score >= beta:
                 node_type = NodeType.LOWER
             self.tt.store(pos_key, depth, best_score, node_type, best_move)
-            
-        return best_move, best_score
+        
+        if best_move and self.pv_length[0] == 0:
+            return best_move, best_score, [best_move]  # Failed low: no move beat alpha
+        return best_move, best_score, self.pv_table[0][:self.pv_length[0]]
     
-    def _negamax_with_pv(self, depth: int, alpha: int, beta: int) -> Tuple[int, List[chess.Move]]:
-        """Enhanced negamax search with principal variation collection."""
+    def _negamax(self, depth: int, alpha: int, beta: int, ply: int = 1,
+                 cut_node: bool = False) -> int:
+        """Principal variation search (negamax with null windows for non-PV moves).
+        
+        PV nodes (beta - alpha > 1) record their best line in the triangular
+        PV table at row ply. cut_node marks a null-window node expected to
+        fail high (a later move's null-window search, or the first child of
+        an expected fail-low node).
+        """
+        # Stop check: the clock and stop flag are only read every limits.interval nodes
+        if self.nodes >= self.limits.next_check and self.limits.poll(self.nodes):
+            return 0
         self.nodes += 1
+        self.pv_length[ply] = ply
+        pv_node = beta - alpha > 1
         
-        # Time management check
-        if self.uci.stop_requested:
-            return 0, []
-        if self.search_deadline and time.time() > self.search_deadline:
-            self.uci.stop_requested = True
-            return 0, []
+        # Draw by repetition
+        if self.board.is_repetition():
+            return 0
             
-        # Transposition table lookup
-        pos_key = hash(self.board.get_fen())
-        tt_entry = self.tt.lookup(pos_key, depth, alpha, beta)
-        if tt_entry:
-            return tt_entry[0], []
+        # Transposition table lookup (PV nodes keep searching to extend the PV)
+        pos_key = self.board.zobrist_key
+        null_windows = self.searcher.null_windows
+        if not pv_node:
+            tt_entry = self.tt.lookup(pos_key, depth, alpha, beta)
+            if tt_entry:
+                return tt_entry[0]
             
-        # Quiescence search at leaf nodes
-        if depth <= 0:
-            return self._quiescence_search(alpha, beta, self.quiescence_max_depth), []
+        # Quiescence search at leaf nodes (and at the PV table's depth limit)
+        if depth <= 0 or ply >= MAX_PLY - 1:
+            return self._quiescence_search(alpha, beta, self.quiescence_max_depth, ply)
+        
+        board = self.board.board
+        in_check = board.is_check()
+        
+        # Static eval for pruning and for LMR's improving flag (none in check)
+        static_eval = None
+        if not in_check:
+            static_eval = int(self.evaluator.evaluate(self.board, terminal_checked=True))
+        self.static_evals[ply] = static_eval
+        earlier_eval = self.static_evals[ply - 2] if ply >= 2 else None
+        improving = static_eval is None or earlier_eval is None or static_eval > earlier_eval
+        
+        # Shallow-depth forward pruning (non-PV nodes not in check, no mate scores)
+        pruning = self.searcher.pruning
+        futile = None  # None: futility pruning not tried at this node
+        late_move_limit = None
+        if (not pv_node and not in_check and depth <= pruning.max_depth
+                and -MATE_BOUND < alpha and beta < MATE_BOUND):
+            # Reverse futility: so far above beta that the opponent can't catch up
+            technique = pruning.reverse_futility
+            if technique.applies(depth):
+                technique.nodes += 1
+                if static_eval - technique.margin * depth >= beta:
+                    technique.cutoffs += 1
+                    return static_eval - technique.margin * depth
+            
+            # Razoring: far below alpha, quiescence only has to confirm the fail low
+            technique = pruning.razoring
+            if technique.applies(depth):
+                technique.nodes += 1
+                if static_eval + technique.margin * depth <= alpha:
+                    score = self._quiescence_search(alpha, alpha + 1, self.quiescence_max_depth, ply)
+                    if score <= alpha:
+                        technique.cutoffs += 1
+                        return score
+            
+            # Futility: quiet moves can't lift this static eval above alpha
+            technique = pruning.futility
+            if technique.applies(depth):
+                futile = static_eval + technique.margin * depth <= alpha
+            
+            # Late-move pruning: quiet moves this late in the order rarely matter
+            technique = pruning.late_move
+            if technique.applies(depth):
+                late_move_limit = technique.margin + depth * depth
             
         # Null move pruning
-        if (depth >= 3 and not self.board.board.is_check() 
+        if (not pv_node and depth >= 3 and not in_check 
             and self._has_non_pawn_material()):
-            self.board.board.push(chess.Move.null())
-            null_score, _ = self._negamax_with_pv(depth - 1 - self.null_move_reduction, -beta, -alpha)
-            null_score = -null_score
-            self.board.board.pop()
+            self.board.make_null_move()
+            null_score = -self._negamax(depth - 1 - self.null_move_reduction, -beta, -beta + 1,
+                                        ply + 1, not cut_node)
+            self.board.unmake_null_move()
             
             if null_score >= beta:
-                return beta, []
-        
-        # Get and order moves
-        moves = self.move_generator.get_legal_moves()
-        if not moves:
-            if self.board.board.is_check():
-                return -20000 + self.nodes, []  # Checkmate (prefer shorter mates)
-            return 0, []  # Stalemate
-            
-        tt_move = tt_entry[1] if tt_entry else None
-        ordered_moves = self.move_orderer.order_moves(
-            self.board.board, moves, depth, tt_move
-        )
+                return beta
         
+        # No hash move at a PV or cut node: search it a ply shallower (IIR), or
+        # search shallower first so the TT holds a move to try first (IID)
+        mode = self.searcher.internal_iterative
+        if (mode != 'off' and (pv_node or cut_node) and depth >= self.internal_iterative_depth
+                and self.tt.probe_move(pos_key) is None):
+            if mode == 'reduce':
+                depth -= 1
+            else:
+                self._negamax(depth - 2, alpha, beta, ply, cut_node)
+                self.pv_length[ply] = ply  # The shallow search's line is not the PV
+        
+        # Moves come from the move ordering component (staged picker by default)
+        extension = 1 if in_check else 0  # Check extension
+        original_alpha = alpha
         best_score = -30000
         best_move = None
-        best_pv = []
+        moves_searched = 0
         
-        for i, move in enumerate(ordered_moves):
-            if self.uci.stop_requested:
+        for move in self.move_ordering.moves(self, pos_key, depth):
+            if self.limits.stopped:
                 break
-                
-            # Check extension
-            extension = 0
-            if self.board.board.is_check():
-                extension = 1
+            
+            quiet = not (move.promotion or board.is_capture(move))
+            
+            # Skip quiet moves in futile nodes and beyond the late-move limit
+            # (both techniques are tried and counted per quiet move)
+            if moves_searched and quiet and (futile is not None or late_move_limit is not None):
+                technique = None
+                if futile is not None:
+                    pruning.futility.nodes += 1
+                    if futile:
+                        technique = pruning.futility
+                if technique is None and late_move_limit is not None:
+                    pruning.late_move.nodes += 1
+                    if moves_searched >= late_move_limit:
+                        technique = pruning.late_move
+                if technique is not None and not board.gives_check(move):
+                    technique.cutoffs += 1
+                    continue
                 
             self.board.make_move(move)
-            score, child_pv = self._negamax_with_pv(depth - 1 + extension, -beta, -alpha)
-            score = -score
+            new_depth = depth - 1 + extension
+            if moves_searched == 0:
+                score = -self._negamax(new_depth, -beta, -alpha, ply + 1, not pv_node and not cut_node)
+            else:
+                # Late quiet moves that don't give check are searched reduced first
+                reduction = 0
+                if quiet and not in_check and not board.is_check():
+                    history = self.history_table.get((move.from_square, move.to_square), 0)
+                    reduction = self.lmr.reduction(depth, moves_searched + 1, pv_node,
+                                                   improving, history)
+                
+                # PVS uses a null window, plain alpha-beta the full window
+                window = -alpha - 1 if null_windows else -beta
+                score = -self._negamax(new_depth - reduction, window, -alpha, ply + 1, True)
+                if reduction and score > alpha:
+                    # Verification: the reduced search beat alpha, search to full depth
+                    score = -self._negamax(new_depth, window, -alpha, ply + 1, True)
+                if null_windows and alpha < score < beta:
+                    # Fail high on a null window in a PV node: re-search with the full window
+                    score = -self._negamax(new_depth, -beta, -alpha, ply + 1)
             self.board.unmake_move()
+            moves_searched += 1
             
             if score > best_score:
                 best_score = score
                 best_move = move
-                best_pv = [move] + child_pv
-                alpha = max(alpha, score)
+                if score > alpha:
+                    alpha = score
+                    if pv_node:
+                        self._update_pv(ply, move)
                 
             if alpha >= beta:
+                self.cutoff_stats.record(depth, moves_searched == 1)
                 # Update move ordering data
                 if not self.board.board.is_capture(move):
                     self._update_killer_move(move, depth)
                     self._update_history(move, depth)
+                    self._update_counter_move(move)
                 break
-                
-        # Store in transposition table
-        if best_move:
-            node_type = NodeType.EXACT
-            if best_score <= alpha:
-                node_type = NodeType.UPPER
-            elif best_score >= beta:
-                node_type = NodeType.LOWER
-            self.tt.store(pos_key, depth, best_score, node_type, best_move)
-            
-        return best_score, best_pv
-
-    def _negamax(self, depth: int, alpha: int, beta: int) -> int:
-        """Enhanced negamax search with pruning and extensions."""
-        self.nodes += 1
-        
-        # Time management check
-        if self.uci.stop_requested:
-            return 0
-        if self.search_deadline and time.time() > self.search_deadline:
-            self.uci.stop_requested = True
-            return 0
-            
-        # Transposition table lookup
-        pos_key = hash(self.board.get_fen())
-        tt_entry = self.tt.lookup(pos_key, depth, alpha, beta)
-        if tt_entry:
-            return tt_entry[0]
-            
-        # Quiescence search at leaf nodes
-        if depth <= 0:
-            return self._quiescence_search(alpha, beta, self.quiescence_max_depth)
-            
-        # Null move pruning
-        if (depth >= 3 and not self.board.board.is_check() 
-            and self._has_non_pawn_material()):
-            self.board.board.push(chess.Move.null())
-            null_score = -self._negamax(depth - 1 - self.null_move_reduction, -beta, -alpha)
-            self.board.board.pop()
-            
-            if null_score >= beta:
-                return beta
         
-        # Get and order moves
-        moves = self.move_generator.get_legal_moves()
-        if not moves:
-            if self.board.board.is_check():
+        if moves_searched == 0 and not self.limits.stopped:
+            if in_check:
                 # v3.3: Mate distance scoring - prefer shorter mates
-                return -30000 + (self.max_depth - depth)
+                return -30000 + ply
             return 0  # Stalemate
-            
-        tt_move = tt_entry[1] if tt_entry else None
-        ordered_moves = self.move_orderer.order_moves(
-            self.board.board, moves, depth, tt_move
-        )
-        
-        best_score = -30000
-        best_move = None
-        
-        for i, move in enumerate(ordered_moves):
-            if self.uci.stop_requested:
-                break
-                
-            # Check extension
-            extension = 0
-            if self.board.board.is_check():
-                extension = 1
-                
-            self.board.make_move(move)
-            score = -self._negamax(depth - 1 + extension, -beta, -alpha)
-            self.board.unmake_move()
-            
-            if score > best_score:
-                best_score = score
-                best_move = move
-                alpha = max(alpha, score)
-                
-            if alpha >= beta:
-                # Update move ordering data
-                if not self.board.board.is_capture(move):
-                    self._update_killer_move(move, depth)
-                    self._update_history(move, depth)
-                break
                 
         # Store in transposition table
-        if best_move:
+        if best_move and not self.limits.stopped:
             node_type = NodeType.EXACT
-            if best_score <= alpha:
+            if best_score <= original_alpha:
                 node_type = NodeType.UPPER
             elif best_score >= beta:
                 node_type = NodeType.LOWER
@@ -559,74 +843,90 @@ class SlowMateEngine:
             
         return best_score
     
-    def _quiescence_search(self, alpha: int, beta: int, depth: int) -> int:
-        """Quiescence search with mate detection (v3.3 critical fix)."""
-        self.nodes += 1
+    def _update_pv(self, ply: int, move: chess.Move):
+        """Make move followed by the child's line the PV at ply."""
+        pv_table = self.pv_table
+        row = pv_table[ply]
+        child_row = pv_table[ply + 1]
+        row[ply] = move
+        child_length = self.pv_length[ply + 1]
+        for index in range(ply + 1, child_length):
+            row[index] = child_row[index]
+        self.pv_length[ply] = max(child_length, ply + 1)
+    
+    def _quiescence_search(self, alpha: int, beta: int, depth: int, ply: int = 1) -> int:
+        """Quiescence search over captures, with mate detection (v3.3 critical fix).
         
-        # v3.3 CRITICAL FIX: Check for checkmate/stalemate FIRST
-        legal_moves = self.move_generator.get_legal_moves()
-        if not legal_moves:
-            if self.board.board.is_check():
-                return -30000 + self.nodes  # Checkmate
-            return 0  # Stalemate
+        Not in check, only captures and queen promotions are generated, plus
+        quiet checks at the first quiescence ply. In check every evasion is
+        searched, so a mate is always found; stalemate is left to the main
+        search. Results go to the TT at depth 0.
+        """
+        if self.nodes >= self.limits.next_check and self.limits.poll(self.nodes):
+            return 0
+        self.nodes += 1
+        self.qnodes += 1
         
-        # Evaluate current position
-        stand_pat = int(self.evaluator.evaluate(self.board))
+        pos_key = self.board.zobrist_key
+        tt_entry = self.tt.lookup(pos_key, 0, alpha, beta)
+        if tt_entry:
+            return tt_entry[0]
+        tt_move = self.tt.probe_move(pos_key)
         
-        # v3.3: Check extension - extend search when in check (forcing)
-        in_check = self.board.board.is_check()
-        if in_check and depth <= 0:
-            depth = 1  # Extend to resolve check
+        board = self.board.board
+        in_check = board.is_check()
+        original_alpha = alpha
         
-        if depth <= 0 and not in_check:
-            return stand_pat
+        if in_check:
+            # v3.3: Check extension - extend search when in check (forcing)
+            depth = max(depth, 1)
+            moves = ((0, move) for move in MovePicker(board, tt_move, history=self.history_table))
+        else:
+            # The search owns terminal detection: not in check means no mate here
+            stand_pat = int(self.evaluator.evaluate(self.board, terminal_checked=True))
+            if depth <= 0 or stand_pat >= beta:
+                return stand_pat
+            alpha = max(alpha, stand_pat)
+            moves = quiescence_moves(board, tt_move, checks=depth == self.quiescence_max_depth)
         
-        if stand_pat >= beta:
-            return stand_pat
+        best_move = None
+        moves_searched = 0
+        for capture_value, move in moves:
+            if self.limits.stopped:
+                break
             
-        alpha = max(alpha, stand_pat)
-        
-        # v3.3: Consider captures AND checking moves (mate threats)
-        moves = [move for move in legal_moves 
-                if self.board.board.is_capture(move) or self.board.board.gives_check(move)]
-        
-        if not moves:
-            return stand_pat
+            if not in_check and board.is_capture(move):
+                # SEE pruning: skip captures that lose material
+                if capture_value < 0:
+                    continue
+                # Delta pruning: skip captures that can't improve alpha
+                if stand_pat + capture_value + 200 < alpha:  # 200cp margin
+                    continue
             
-        # Order captures by SEE (Static Exchange Evaluation)
-        moves.sort(key=lambda m: self._see_capture_value(m), reverse=True)
-        
-        for move in moves:
-            if self.uci.stop_requested:
-                break
-                
-            # Delta pruning: skip captures that can't improve alpha
-            capture_value = self._see_capture_value(move)
-            if stand_pat + capture_value + 200 < alpha:  # 200cp margin
-                continue
-                
             self.board.make_move(move)
-            score = -self._quiescence_search(-beta, -alpha, depth - 1)
+            score = -self._quiescence_search(-beta, -alpha, depth - 1, ply + 1)
             self.board.unmake_move()
+            moves_searched += 1
             
-            if score >= beta:
-                return beta
-            alpha = max(alpha, score)
-            
+            if score > alpha:
+                alpha = score
+                best_move = move
+                if score >= beta:
+                    alpha = beta
+                    break
+        
+        if in_check and moves_searched == 0 and not self.limits.stopped:
+            return -30000 + ply  # Checkmate
+        
+        if not self.limits.stopped:
+            node_type = NodeType.UPPER
+            if alpha >= beta:
+                node_type = NodeType.LOWER
+            elif alpha > original_alpha:
+                node_type = NodeType.EXACT
+            self.tt.store(pos_key, 0, alpha, node_type, best_move)
         return alpha
     
-    def _see_capture_value(self, move: chess.Move) -> int:
-        """Static Exchange Evaluation for captures."""
-        board = self.board.board
-        if not board.is_capture(move):
-            return 0
-            
-        captured_piece = board.piece_at(move.to_square)
-        if not captured_piece:
-            return 0
-            
-        return self.evaluator.piece_values.get(captured_piece.piece_type, 0)
-    
     def _has_non_pawn_material(self) -> bool:
         """Check if current side has non-pawn material."""
         board = self.board.board
@@ -637,6 +937,12 @@ class SlowMateEngine:
                 return True
         return False
     
+    def _update_counter_move(self, move: chess.Move):
+        """Remember move as the refutation of the opponent's previous move."""
+        board = self.board.board
+        if board.move_stack:
+            self.counter_moves[board.peek()] = move
+    
     def _update_killer_move(self, move: chess.Move, depth: int):
         """Update killer move table."""
         if depth < len(self.killer_moves):
@@ -668,7 +974,13 @@ class SlowMateEngine:
             'version': '3.0',
             'author': 'SlowMate Team',
             'nodes': self.nodes,
+            'depth': self.completed_depth,
+            'components': dict(self.components),
             'evaluation': self.last_score,
             'tt_size': self.tt.size,
-            'tt_entries': len(self.tt.table)
+            'tt_entries': self.tt.entries_used(),
+            'pawn_hash_hits': self.evaluator.pawn_hash.hits,
+            'pawn_hash_misses': self.evaluator.pawn_hash.misses,
+            'eval_cache_hits': self.evaluator.eval_cache.hits,
+            'eval_cache_misses': self.evaluator.eval_cache.misses
         }
@@ -5,6 +5,7 @@ Based on stable v0.2.01 architecture
 """
 
 import chess
+from array import array
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
@@ -25,8 +26,29 @@ class TTEntry:
     move: Optional[chess.Move]  # Best move found
     age: int        # Search iteration when entry was stored
 
+# Packed entry layout (one 64-bit word next to the 64-bit key):
+#   bits  0-15  move (from | to << 6 | promotion << 12), 0 = no move
+#   bits 16-31  score + SCORE_OFFSET
+#   bits 32-39  depth + DEPTH_OFFSET
+#   bits 40-41  node type
+#   bits 42-49  generation
+# An all-zero data word marks an empty slot (the score offset keeps used slots non-zero).
+# The key slot holds key ^ data ("lockless hashing"): a slot written concurrently
+# by another search process fails verification instead of returning torn data.
+SCORE_OFFSET = 32768
+DEPTH_OFFSET = 16
+_NODE_TYPES = (NodeType.EXACT, NodeType.UPPER, NodeType.LOWER)
+
 class TranspositionTable:
-    """Enhanced transposition table with aging and replacement scheme."""
+    """Fixed-size bucketed transposition table packed into flat arrays.
+    
+    Entries live in two preallocated unsigned 64-bit arrays (keys and packed
+    data) grouped into clusters of CLUSTER_SIZE slots. Store and lookup touch a
+    single cluster, so both are O(1) and the table never needs an eviction pass.
+    """
+    
+    ENTRY_BYTES = 16   # 8-byte key + 8-byte packed data
+    CLUSTER_SIZE = 4
     
     def __init__(self, size_mb: int = 64):
         """Initialize transposition table.
@@ -34,44 +56,149 @@ class TranspositionTable:
         Args:
             size_mb: Size in megabytes (default: 64)
         """
-        self.size = (size_mb * 1024 * 1024) // 32  # Entries per MB
-        self.table: Dict[int, TTEntry] = {}
+        self.resize(size_mb)
+        
+    def resize(self, size_mb: int) -> None:
+        """Reallocate the table so that it uses exactly size_mb megabytes."""
+        cluster_bytes = self.ENTRY_BYTES * self.CLUSTER_SIZE
+        self.size_mb = size_mb
+        self.num_clusters = max(1, (size_mb * 1024 * 1024) // cluster_bytes)
+        self.size = self.num_clusters * self.CLUSTER_SIZE
+        self.clear()
+        
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.keys, self.data = self._allocate(self.size)
         self.age = 0
         
+    def _allocate(self, size: int):
+        """Create zeroed key and data arrays with size slots each."""
+        return array('Q', bytes(8 * size)), array('Q', bytes(8 * size))
+        
+    def new_search(self) -> None:
+        """Advance the generation so entries from older searches get replaced first."""
+        self.age = (self.age + 1) & 0xFF
+        
+    def memory_bytes(self) -> int:
+        """Bytes used by the entry arrays."""
+        return (self.keys.itemsize + self.data.itemsize) * self.size
+        
     def store(self, key: int, depth: int, score: int, node_type: NodeType,
               move: Optional[chess.Move] = None) -> None:
         """Store a position in the table."""
-        if len(self.table) >= self.size:
-            # Simple cleanup - remove 10% oldest entries
-            sorted_entries = sorted(self.table.items(), 
-                                 key=lambda x: x[1].age)
-            for k, _ in sorted_entries[:self.size // 10]:
-                del self.table[k]
-                
-        self.table[key] = TTEntry(
-            key=key,
-            depth=depth,
-            score=score,
-            node_type=node_type,
-            move=move,
-            age=self.age
-        )
+        keys = self.keys
+        data = self.data
+        base = (key % self.num_clusters) * self.CLUSTER_SIZE
+        
+        # Pick the slot: same position, else empty, else shallowest/oldest entry
+        replace = base
+        replace_value = None
+        for index in range(base, base + self.CLUSTER_SIZE):
+            entry = data[index]
+            if entry == 0:
+                replace = index
+                break
+            if keys[index] ^ entry == key:
+                entry_depth = ((entry >> 32) & 0xFF) - DEPTH_OFFSET
+                entry_age = (entry >> 42) & 0xFF
+                if depth + 2 < entry_depth and entry_age == self.age and node_type != NodeType.EXACT:
+                    return  # Keep the much deeper result from this search
+                if move is None:
+                    move_bits = entry & 0xFFFF
+                    if move_bits:
+                        move = self._decode_move(move_bits)
+                replace = index
+                break
+            entry_depth = ((entry >> 32) & 0xFF) - DEPTH_OFFSET
+            age_distance = (self.age - ((entry >> 42) & 0xFF)) & 0xFF
+            value = entry_depth - 8 * age_distance
+            if replace_value is None or value < replace_value:
+                replace = index
+                replace_value = value
+        
+        move_bits = 0
+        if move:
+            move_bits = move.from_square | (move.to_square << 6) | ((move.promotion or 0) << 12)
+        score = max(-SCORE_OFFSET + 1, min(SCORE_OFFSET - 1, score))
+        depth = max(-DEPTH_OFFSET, min(0xFF - DEPTH_OFFSET, depth))
+        
+        packed = (move_bits
+                  | ((score + SCORE_OFFSET) << 16)
+                  | ((depth + DEPTH_OFFSET) << 32)
+                  | (node_type.value << 40)
+                  | (self.age << 42))
+        data[replace] = packed
+        keys[replace] = key ^ packed
         
     def lookup(self, key: int, depth: int, alpha: int, beta: int) -> Optional[Tuple[int, Optional[chess.Move]]]:
         """Lookup a position in the table."""
-        entry = self.table.get(key)
-        if not entry:
+        keys = self.keys
+        data = self.data
+        base = (key % self.num_clusters) * self.CLUSTER_SIZE
+        for index in range(base, base + self.CLUSTER_SIZE):
+            entry = data[index]
+            if entry == 0 or keys[index] ^ entry != key:
+                continue
+            
+            if ((entry >> 32) & 0xFF) - DEPTH_OFFSET >= depth:
+                score = ((entry >> 16) & 0xFFFF) - SCORE_OFFSET
+                node_type = (entry >> 40) & 0x3
+                if node_type == NodeType.EXACT.value:
+                    return score, self._decode_move(entry & 0xFFFF)
+                elif node_type == NodeType.UPPER.value and score <= alpha:
+                    return alpha, self._decode_move(entry & 0xFFFF)
+                elif node_type == NodeType.LOWER.value and score >= beta:
+                    return beta, self._decode_move(entry & 0xFFFF)
             return None
             
-        if entry.depth >= depth:
-            if entry.node_type == NodeType.EXACT:
-                return entry.score, entry.move
-            elif entry.node_type == NodeType.UPPER and entry.score <= alpha:
-                return alpha, entry.move
-            elif entry.node_type == NodeType.LOWER and entry.score >= beta:
-                return beta, entry.move
-                
         return None
+        
+    def probe(self, key: int) -> Optional[TTEntry]:
+        """Return the stored entry for a position regardless of depth or bounds."""
+        base = (key % self.num_clusters) * self.CLUSTER_SIZE
+        for index in range(base, base + self.CLUSTER_SIZE):
+            entry = self.data[index]
+            if entry and self.keys[index] ^ entry == key:
+                return TTEntry(
+                    key=key,
+                    depth=((entry >> 32) & 0xFF) - DEPTH_OFFSET,
+                    score=((entry >> 16) & 0xFFFF) - SCORE_OFFSET,
+                    node_type=_NODE_TYPES[(entry >> 40) & 0x3],
+                    move=self._decode_move(entry & 0xFFFF),
+                    age=(entry >> 42) & 0xFF
+                )
+        return None
+        
+    def probe_move(self, key: int) -> Optional[chess.Move]:
+        """Return only the stored best move for a position (for move ordering)."""
+        base = (key % self.num_clusters) * self.CLUSTER_SIZE
+        for index in range(base, base + self.CLUSTER_SIZE):
+            entry = self.data[index]
+            if entry and self.keys[index] ^ entry == key:
+                return self._decode_move(entry & 0xFFFF)
+        return None
+        
+    def entries_used(self) -> int:
+        """Number of occupied slots."""
+        return sum(1 for entry in self.data if entry)
+        
+    def hashfull(self) -> int:
+        """Permille of sampled slots filled during the current search (UCI hashfull)."""
+        sample = min(1000, self.size)
+        used = 0
+        for index in range(sample):
+            entry = self.data[index]
+            if entry and (entry >> 42) & 0xFF == self.age:
+                used += 1
+        return used * 1000 // sample
+        
+    @staticmethod
+    def _decode_move(move_bits: int) -> Optional[chess.Move]:
+        """Unpack a 16-bit move."""
+        if not move_bits:
+            return None
+        promotion = move_bits >> 12
+        return chess.Move(move_bits & 0x3F, (move_bits >> 6) & 0x3F, promotion or None)
 
 class MoveOrderer:
     """Advanced move ordering system."""
@@ -187,3 +314,39 @@ class MoveOrderer:
             chess.KING: 20000
         }
         return values[piece_type]
+
+class CutoffStats:
+    """Beta cutoffs per depth and how many came from the first move searched."""
+    
+    def __init__(self):
+        self.cutoffs: Dict[int, int] = {}
+        self.first_move: Dict[int, int] = {}
+        
+    def reset(self) -> None:
+        """Reset the counters (once per search)."""
+        self.cutoffs.clear()
+        self.first_move.clear()
+        
+    def record(self, depth: int, first: bool) -> None:
+        """Count a cutoff at depth, made by the first move if first."""
+        self.cutoffs[depth] = self.cutoffs.get(depth, 0) + 1
+        if first:
+            self.first_move[depth] = self.first_move.get(depth, 0) + 1
+            
+    def merge(self, other: 'CutoffStats') -> None:
+        """Add other's counters to these (bench totals)."""
+        for depth, count in other.cutoffs.items():
+            self.cutoffs[depth] = self.cutoffs.get(depth, 0) + count
+        for depth, count in other.first_move.items():
+            self.first_move[depth] = self.first_move.get(depth, 0) + count
+            
+    def first_move_rate(self, depth: int) -> float:
+        """Share of the cutoffs at depth made by the first move (0.0 without cutoffs)."""
+        cutoffs = self.cutoffs.get(depth, 0)
+        return self.first_move.get(depth, 0) / cutoffs if cutoffs else 0.0
+        
+    def stats_string(self) -> str:
+        """First-move cutoff percentage per depth, formatted for an info string."""
+        parts = [f"d{depth} {self.first_move_rate(depth) * 100:.1f}% of {self.cutoffs[depth]}"
+                 for depth in sorted(self.cutoffs)]
+        return "first-move cutoffs " + (" ".join(parts) if parts else "none")
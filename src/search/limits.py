@@ -0,0 +1,118 @@
+"""
+SlowMate Chess Engine - Search Limits Module
+One controller for every way a search can be told to stop
+Version: 1.0.0-BETA
+
+Reading the clock and the UCI stop flag at every node costs a few percent
+of search time in Python, so the search only compares its node counter
+against next_check. poll() then reads the clock and the external stop
+flag, and schedules the next poll so that roughly CHECK_PERIOD seconds
+pass between clock reads at the measured nodes/sec. Stop latency stays
+around a millisecond whatever the speed of the machine.
+"""
+
+import time
+from typing import Callable, Optional
+
+
+class SearchLimits:
+    """Node, depth and time limits of one search, polled every few nodes."""
+
+    CHECK_PERIOD = 0.001    # Target seconds between clock reads
+    INITIAL_INTERVAL = 16   # Nodes before the first poll (no speed measured yet)
+    MAX_INTERVAL = 4096
+
+    def __init__(self, stop_signal: Optional[Callable[[], bool]] = None):
+        """stop_signal returns True when the search must stop from outside (UCI stop)."""
+        self.stop_signal = stop_signal
+        self.start(infinite=True)
+
+    def start(self, *, depth: Optional[int] = None, nodes: Optional[int] = None,
+              soft_time: Optional[float] = None, hard_time: Optional[float] = None,
+              infinite: bool = False, start_time: Optional[float] = None) -> None:
+        """Begin a new search.
+
+        depth: deepest iteration to start
+        nodes: node budget; the search stops exactly at this count
+        soft_time: seconds after which no new iteration is started
+        hard_time: seconds after which the running iteration is aborted
+        infinite: ignore the time limits until stopped from outside
+        """
+        self.start_time = time.time() if start_time is None else start_time
+        self.clock_start = self.start_time  # Origin of the deadlines (moved by ponderhit)
+        self.depth = depth
+        self.nodes = nodes
+        self.infinite = infinite
+        self.soft_deadline = None
+        self.hard_deadline = None
+        if not infinite:
+            if soft_time is not None:
+                self.soft_deadline = self.start_time + soft_time
+            if hard_time is not None:
+                self.hard_deadline = self.start_time + hard_time
+        self.stopped = False
+        self.polls = 0
+        self.interval = self.INITIAL_INTERVAL
+        self.next_check = self._schedule(0)
+
+    def _schedule(self, nodes: int) -> int:
+        """Node count of the next poll; never past the node budget."""
+        next_check = nodes + self.interval
+        if self.nodes is not None and next_check > self.nodes:
+            next_check = self.nodes
+        return next_check
+
+    def poll(self, nodes: int) -> bool:
+        """Check every limit; returns True (and stays stopped) when the search must end.
+
+        Called when the node counter reaches next_check.
+        """
+        if self.stopped:
+            return True
+        self.polls += 1
+        if self.nodes is not None and nodes >= self.nodes:
+            return self.stop()
+        if self.stop_signal is not None and self.stop_signal():
+            return self.stop()
+
+        now = time.time()
+        if self.hard_deadline is not None and now >= self.hard_deadline:
+            return self.stop()
+
+        # Retune the interval to the average speed so far
+        elapsed = now - self.start_time
+        if elapsed > 0:
+            interval = int(nodes / elapsed * self.CHECK_PERIOD)
+            self.interval = max(1, min(interval, self.MAX_INTERVAL))
+        self.next_check = self._schedule(nodes)
+        return False
+
+    def stop(self) -> bool:
+        """Stop the search now; every later poll returns True."""
+        self.stopped = True
+        self.next_check = 0  # Every node polls from now on and returns at once
+        return True
+
+    def ponderhit(self, soft_time: Optional[float], hard_time: Optional[float]) -> None:
+        """Put a running infinite (ponder) search on the clock, counting from now."""
+        self.clock_start = time.time()
+        self.soft_deadline = None if soft_time is None else self.clock_start + soft_time
+        self.hard_deadline = None if hard_time is None else self.clock_start + hard_time
+        self.infinite = False
+
+    def set_soft_time(self, soft_time: float) -> None:
+        """Move the soft deadline (time management feedback between iterations)."""
+        if not self.infinite:
+            self.soft_deadline = self.clock_start + soft_time
+
+    def elapsed(self) -> float:
+        """Seconds since the search started."""
+        return time.time() - self.start_time
+
+    def soft_expired(self) -> bool:
+        """True when there is no time to start another iteration."""
+        return self.soft_deadline is not None and time.time() >= self.soft_deadline
+
+    def allows_depth(self, depth: int) -> bool:
+        """True when an iteration at depth may be started."""
+        return not self.stopped and (self.depth is None or depth <= self.depth)
@@ -0,0 +1,84 @@
+"""
+SlowMate Chess Engine - Move Ordering Components
+Interior-node move ordering strategies for the engine core
+Version: 1.0.0-BETA
+
+Both strategies read the same ordering data the engine keeps (TT move,
+killers, counter moves, history) and differ only in how the moves are
+produced: StagedOrdering generates them stage by stage through the
+MovePicker, SortedOrdering scores and sorts every legal move up front as
+the v2.2 engine did.
+"""
+
+from typing import Iterable, List
+
+import chess
+
+from .picker import MovePicker
+
+
+class StagedOrdering:
+    """Lazy staged ordering: moves are generated only as far as the node needs."""
+
+    name = "staged"
+
+    def moves(self, engine, pos_key: int, depth: int) -> Iterable[chess.Move]:
+        """Moves of the engine's current position, best candidates first."""
+        board = engine.board.board
+        killers = engine.killer_moves[depth] if depth < len(engine.killer_moves) else None
+        counter_move = engine.counter_moves.get(board.peek()) if board.move_stack else None
+        return MovePicker(board, engine.tt.probe_move(pos_key), killers, counter_move,
+                          engine.history_table)
+
+
+class SortedOrdering:
+    """v2.2 ordering: every legal move scored and sorted before the first is searched."""
+
+    name = "sorted"
+
+    # MVV-LVA piece values (centipawns)
+    PIECE_VALUES = {
+        chess.PAWN: 100,
+        chess.KNIGHT: 300,
+        chess.BISHOP: 300,
+        chess.ROOK: 500,
+        chess.QUEEN: 900,
+        chess.KING: 10000
+    }
+
+    def moves(self, engine, pos_key: int, depth: int) -> List[chess.Move]:
+        """Moves of the engine's current position, best candidates first."""
+        board = engine.board.board
+        tt_move = engine.tt.probe_move(pos_key)
+        killers = engine.killer_moves[depth] if depth < len(engine.killer_moves) else []
+        counter_move = engine.counter_moves.get(board.peek()) if board.move_stack else None
+        history = engine.history_table
+
+        scored_moves = []
+        for move in board.legal_moves:
+            score = 0
+            if move == tt_move:
+                score += 10000
+            if board.is_capture(move):
+                score += self._mvv_lva(board, move)
+            if move.promotion:
+                score += 8000 + (move.promotion - 1) * 100
+            if board.gives_check(move):
+                score += 500
+            if move in killers:
+                score += 300 - killers.index(move) * 50
+            score += min(history.get((move.from_square, move.to_square), 0), 200)
+            if move == counter_move:
+                score += 250
+            scored_moves.append((move, score))
+
+        scored_moves.sort(key=lambda item: item[1], reverse=True)
+        return [move for move, _ in scored_moves]
+
+    def _mvv_lva(self, board: chess.Board, move: chess.Move) -> int:
+        """Most Valuable Victim - Least Valuable Attacker score of a capture."""
+        victim = board.piece_at(move.to_square)
+        victim_value = self.PIECE_VALUES[victim.piece_type] if victim else self.PIECE_VALUES[chess.PAWN]
+        attacker = board.piece_at(move.from_square)
+        attacker_value = self.PIECE_VALUES[attacker.piece_type] if attacker else 100
+        return victim_value * 10 - attacker_value
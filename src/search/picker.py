@@ -0,0 +1,135 @@
+"""
+SlowMate Chess Engine - Staged Move Picker
+Lazy, stage-by-stage move generation for interior search nodes
+Version: 1.0.0-BETA
+
+Most nodes cut off after the first move or two, so moves are generated and
+scored one stage at a time: the hash move (no generation at all), then
+winning and equal captures and queen promotions by MVV-LVA, then killers
+and the counter move, then the remaining quiet moves sorted by history, and
+last the captures that lose material by SEE.
+
+Quiescence nodes that are not in check use quiescence_moves() instead:
+captures and queen promotions only, plus quiet checks when asked.
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import chess
+
+from .see import see, see_ge
+
+
+# MVV-LVA piece ranks (same scale as MoveOrderer._mvv_lva)
+_MVV_LVA_VALUES = [0, 1, 2, 2, 3, 4, 5]
+
+
+class MovePicker:
+    """Iterates the legal moves of a position in staged order."""
+
+    STAGE_TT = 0
+    STAGE_CAPTURES = 1
+    STAGE_KILLERS = 2
+    STAGE_QUIETS = 3
+    STAGE_BAD_CAPTURES = 4
+
+    def __init__(self, board: chess.Board, tt_move: Optional[chess.Move] = None,
+                 killers: Optional[List[chess.Move]] = None,
+                 counter_move: Optional[chess.Move] = None,
+                 history: Optional[Dict[Tuple[int, int], int]] = None):
+        """Prepare a picker; nothing is generated until iteration reaches a stage."""
+        self.board = board
+        self.tt_move = tt_move
+        self.killers = killers or []
+        self.counter_move = counter_move
+        self.history = history if history is not None else {}
+        self.stage = self.STAGE_TT
+
+    def _is_tactical(self, move: chess.Move) -> bool:
+        """Moves that belong to the capture stage."""
+        return move.promotion == chess.QUEEN or self.board.is_capture(move)
+
+    def _capture_score(self, move: chess.Move) -> int:
+        """MVV-LVA score; queen promotions rank like capturing a queen."""
+        board = self.board
+        victim = board.piece_type_at(move.to_square)
+        if victim is None and board.is_en_passant(move):
+            victim = chess.PAWN
+        attacker = board.piece_type_at(move.from_square)
+        score = _MVV_LVA_VALUES[victim] * 10 - _MVV_LVA_VALUES[attacker] if victim else 0
+        if move.promotion == chess.QUEEN:
+            score += _MVV_LVA_VALUES[chess.QUEEN] * 10
+        return score
+
+    def __iter__(self) -> Iterator[chess.Move]:
+        board = self.board
+        searched = []
+
+        # Stage 1: hash move, if it is legal here
+        tt_move = self.tt_move
+        if tt_move is not None and board.is_legal(tt_move):
+            searched.append(tt_move)
+            yield tt_move
+
+        # Stage 2: captures and queen promotions, most valuable victim first;
+        # captures that lose material (SEE < 0) wait until after the quiets
+        self.stage = self.STAGE_CAPTURES
+        tacticals = list(board.generate_legal_captures())
+        tacticals.extend(move for move in board.generate_legal_moves(board.pawns, chess.BB_BACKRANKS)
+                         if move.promotion == chess.QUEEN and not board.is_capture(move))
+        tacticals.sort(key=self._capture_score, reverse=True)
+        bad_captures = []
+        for move in tacticals:
+            if move in searched:
+                continue
+            if not see_ge(board, move):
+                bad_captures.append(move)
+                continue
+            yield move
+
+        # Stage 3: killer moves, then the counter move to the opponent's last move
+        self.stage = self.STAGE_KILLERS
+        refutations = list(self.killers)
+        if self.counter_move is not None:
+            refutations.append(self.counter_move)
+        for move in refutations:
+            if move in searched or self._is_tactical(move) or not board.is_legal(move):
+                continue
+            searched.append(move)
+            yield move
+
+        # Stage 4: remaining quiet moves by history score
+        self.stage = self.STAGE_QUIETS
+        history = self.history
+        quiets = [move for move in board.generate_legal_moves(
+                      chess.BB_ALL, chess.BB_ALL & ~board.occupied_co[not board.turn])
+                  if move not in searched and not self._is_tactical(move)]
+        quiets.sort(key=lambda move: history.get((move.from_square, move.to_square), 0), reverse=True)
+        yield from quiets
+
+        # Stage 5: losing captures
+        self.stage = self.STAGE_BAD_CAPTURES
+        yield from bad_captures
+
+
+def quiescence_moves(board: chess.Board, tt_move: Optional[chess.Move] = None,
+                     checks: bool = False) -> List[Tuple[int, chess.Move]]:
+    """(SEE value, move) pairs for a quiescence node that is not in check, best first.
+
+    Captures and queen promotions are ordered by SEE, the hash move first
+    if it is one of them. With checks, the quiet moves that give check
+    follow with a value of 0. Losing captures stay in the list for the
+    caller to prune.
+    """
+    tacticals = list(board.generate_legal_captures())
+    tacticals.extend(move for move in board.generate_legal_moves(board.pawns, chess.BB_BACKRANKS)
+                     if move.promotion == chess.QUEEN and not board.is_capture(move))
+    scored = [(see(board, move), move) for move in tacticals]
+    scored.sort(key=lambda item: (item[1] == tt_move, item[0]), reverse=True)
+
+    if checks:
+        quiet_targets = chess.BB_ALL & ~board.occupied
+        for move in board.generate_legal_moves(chess.BB_ALL, quiet_targets):
+            if move.promotion is None and board.gives_check(move):
+                scored.append((0, move))
+    return scored
@@ -0,0 +1,75 @@
+"""
+SlowMate Chess Engine - Shallow-Depth Forward Pruning
+Reverse futility, razoring, futility and late-move pruning settings and counters
+Version: 1.0.0-BETA
+
+Each technique applies only at non-PV nodes that are not in check, up to
+its own maximum depth. Margins are in centipawns per ply of remaining
+depth, except late-move pruning, whose margin is the number of moves
+searched before quiet moves are skipped (margin + depth * depth). Every
+technique counts where it was tried and what it cut, so its effect can
+be measured with bench by switching it off. Reverse futility and
+razoring count nodes tried and nodes cut off; futility and late-move
+pruning count quiet moves tried and quiet moves skipped.
+"""
+
+from typing import Dict, List
+
+
+class PruningTechnique:
+    """Switch, margin and counters of one forward-pruning technique."""
+
+    def __init__(self, name: str, margin: int, max_depth: int, enabled: bool = True):
+        self.name = name
+        self.margin = margin
+        self.max_depth = max_depth
+        self.enabled = enabled
+        self.nodes = 0    # Nodes (futility, late-move: quiet moves) where it was tried
+        self.cutoffs = 0  # Of those, the ones cut off (or skipped) by it
+
+    def applies(self, depth: int) -> bool:
+        """Whether the technique is on and depth is shallow enough for it."""
+        return self.enabled and depth <= self.max_depth
+
+    def reset_stats(self) -> None:
+        """Reset the counters (once per search)."""
+        self.nodes = 0
+        self.cutoffs = 0
+
+
+class ForwardPruning:
+    """The searcher's shallow-depth pruning layer."""
+
+    def __init__(self):
+        self.reverse_futility = PruningTechnique('reverse_futility', margin=120, max_depth=3)
+        self.razoring = PruningTechnique('razoring', margin=300, max_depth=2)
+        self.futility = PruningTechnique('futility', margin=150, max_depth=2)
+        self.late_move = PruningTechnique('late_move', margin=3, max_depth=3)
+        self.techniques: Dict[str, PruningTechnique] = {
+            technique.name: technique
+            for technique in (self.reverse_futility, self.razoring, self.futility, self.late_move)
+        }
+        self.max_depth = max(technique.max_depth for technique in self.techniques.values())
+
+    def names(self) -> List[str]:
+        """Technique names, in the order they are tried."""
+        return list(self.techniques)
+
+    def technique(self, name: str) -> PruningTechnique:
+        """The technique called name (ValueError if unknown)."""
+        if name not in self.techniques:
+            raise ValueError(f"Unknown pruning technique: {name}")
+        return self.techniques[name]
+
+    def reset_stats(self) -> None:
+        """Reset every technique's counters (once per search)."""
+        for technique in self.techniques.values():
+            technique.reset_stats()
+
+    def stats_string(self) -> str:
+        """Counters formatted for an info string."""
+        parts = []
+        for technique in self.techniques.values():
+            state = f"{technique.nodes}/{technique.cutoffs}" if technique.enabled else "off"
+            parts.append(f"{technique.name} {state}")
+        return "pruning tried/cut " + " ".join(parts)
@@ -0,0 +1,54 @@
+"""
+SlowMate Chess Engine - Late Move Reductions
+Logarithmic reduction table with history, PV and improving adjustments
+Version: 1.0.0-BETA
+
+The base reduction for a quiet move grows with the log of the remaining
+depth times the log of its place in the move order, so late moves at
+high depth lose the most. It is then adjusted per move: one ply less in
+PV nodes, one ply more when the side to move's static eval is not
+improving on two plies ago, and up to two plies less for moves with a
+good history score. A reduced move that beats alpha is verified with a
+full-depth re-search by the caller.
+"""
+
+import math
+from typing import List
+
+
+MAX_DEPTH = 64
+MAX_MOVES = 64
+
+
+def _build_table(base: float, divisor: float) -> List[List[int]]:
+    """TABLE[depth][move_number] = base + ln(depth) * ln(move_number) / divisor, truncated."""
+    table = [[0] * MAX_MOVES for _ in range(MAX_DEPTH)]
+    for depth in range(1, MAX_DEPTH):
+        for move_number in range(1, MAX_MOVES):
+            table[depth][move_number] = int(base + math.log(depth) * math.log(move_number) / divisor)
+    return table
+
+
+class LateMoveReductions:
+    """Reduction lookup shared by every searcher variant."""
+
+    def __init__(self, base: float = 0.75, divisor: float = 2.25,
+                 min_depth: int = 3, history_scale: int = 64):
+        self.table = _build_table(base, divisor)
+        self.min_depth = min_depth          # Shallower nodes are not reduced
+        self.history_scale = history_scale  # History points per ply of reduction saved
+
+    def reduction(self, depth: int, move_number: int, pv_node: bool, improving: bool,
+                  history: int) -> int:
+        """Plies to take off the search of the move_number-th move (1-based) at depth."""
+        if depth < self.min_depth:
+            return 0
+        reduction = self.table[min(depth, MAX_DEPTH - 1)][min(move_number, MAX_MOVES - 1)]
+        if pv_node:
+            reduction -= 1
+        if not improving:
+            reduction += 1
+        reduction -= min(2, history // self.history_scale)
+
+        # The reduced search keeps at least one ply before quiescence
+        return max(0, min(reduction, depth - 2))
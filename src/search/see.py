@@ -0,0 +1,80 @@
+"""
+SlowMate Chess Engine - Static Exchange Evaluation
+Swap-list SEE on attacker/defender bitboards
+Version: 1.0.0-BETA
+
+Both sides recapture on the target square with their least valuable
+attacker. Attackers are recomputed against the shrinking occupancy after
+every capture, so sliders x-raying through a piece that has just captured
+join the exchange. Pins are ignored.
+"""
+
+import chess
+
+
+# Exchange values indexed by piece type (same scale as the evaluator)
+SEE_VALUES = [0, 100, 320, 330, 500, 900, 20000]
+
+
+def see(board: chess.Board, move: chess.Move) -> int:
+    """Expected material balance of a capture sequence started by move (side to move's view)."""
+    from_square = move.from_square
+    to_square = move.to_square
+    attacker_type = board.piece_type_at(from_square)
+    if attacker_type is None:
+        return 0
+
+    occupied = board.occupied ^ chess.BB_SQUARES[from_square]
+    victim_type = board.piece_type_at(to_square)
+    if victim_type is None and attacker_type == chess.PAWN and board.is_en_passant(move):
+        victim_type = chess.PAWN
+        occupied ^= chess.BB_SQUARES[to_square - 8 if board.turn == chess.WHITE else to_square + 8]
+
+    gain = SEE_VALUES[victim_type] if victim_type else 0
+    if move.promotion:
+        gain += SEE_VALUES[move.promotion] - SEE_VALUES[chess.PAWN]
+        attacker_type = move.promotion
+    occupied |= chess.BB_SQUARES[to_square]
+
+    gains = [gain]
+    on_square = SEE_VALUES[attacker_type]  # Value of the piece that can be captured next
+    side = not board.turn
+
+    while True:
+        attackers = board.attackers_mask(side, to_square, occupied) & occupied
+        if not attackers:
+            break
+
+        # Least valuable attacker
+        for piece_type in chess.PIECE_TYPES:
+            candidates = attackers & board.pieces_mask(piece_type, side)
+            if candidates:
+                break
+
+        # The king may only recapture when the square is no longer defended
+        if piece_type == chess.KING and board.attackers_mask(not side, to_square, occupied) & occupied:
+            break
+
+        gains.append(on_square - gains[-1])
+        occupied ^= chess.BB_SQUARES[chess.lsb(candidates)]
+        on_square = SEE_VALUES[piece_type]
+        side = not side
+
+    # Either side may stop capturing when continuing would lose material
+    while len(gains) > 1:
+        last = gains.pop()
+        gains[-1] = -max(-gains[-1], last)
+    return gains[0]
+
+
+def see_ge(board: chess.Board, move: chess.Move, threshold: int = 0) -> bool:
+    """True when see(board, move) >= threshold, skipping the swap loop when it cannot matter."""
+    if threshold <= 0 and not move.promotion:
+        attacker_type = board.piece_type_at(move.from_square)
+        victim_type = board.piece_type_at(move.to_square)
+        if victim_type is None and board.is_en_passant(move):
+            victim_type = chess.PAWN
+        if attacker_type and victim_type and \
+                SEE_VALUES[victim_type] - SEE_VALUES[attacker_type] >= threshold:
+            return True  # Even losing the capturing piece keeps the balance above threshold
+    return see(board, move) >= threshold
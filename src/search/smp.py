@@ -0,0 +1,231 @@
+"""
+SlowMate Chess Engine - Lazy SMP Search Module
+Multi-process search sharing one transposition table
+Version: 1.0.0-BETA
+
+Threads cannot search in parallel under the GIL, so helpers are separate
+processes. Every helper runs the engine's normal iterative deepening on the
+same root with a different starting depth and root move order, and all of
+them read and write one transposition table in shared memory. The main
+process keeps searching itself and picks the deepest completed result.
+"""
+
+import atexit
+import multiprocessing
+import queue
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import chess
+
+from .enhanced import TranspositionTable
+
+
+class SharedTranspositionTable(TranspositionTable):
+    """Transposition table whose slot arrays live in multiprocessing shared memory."""
+
+    def __init__(self, size_mb: int = 64, name: Optional[str] = None):
+        """Create a new shared table, or attach to an existing one by name."""
+        self._shm = None
+        self._views = ()
+        self._owner = name is None
+        self._attach_name = name
+        super().__init__(size_mb)
+        atexit.register(self.close)
+
+    @property
+    def name(self) -> str:
+        """Shared memory block name used by helpers to attach."""
+        return self._shm.name
+
+    def resize(self, size_mb: int) -> None:
+        """Reallocate the shared block; attached helpers must reattach."""
+        self.close()
+        super().resize(size_mb)
+
+    def clear(self) -> None:
+        """Remove all entries (in place, so attached helpers see it)."""
+        if self._shm is None:
+            super().clear()
+            return
+        self._shm.buf[:] = bytes(self._shm.size)
+        self.age = 0
+
+    def _allocate(self, size: int):
+        """Map key and data slot arrays onto the shared memory block."""
+        nbytes = 16 * size
+        if self._owner:
+            self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        else:
+            self._shm = shared_memory.SharedMemory(name=self._attach_name)
+        block = self._shm.buf[:nbytes]
+        words = block.cast('Q')
+        keys, data = words[:size], words[size:]
+        self._views = (data, keys, words, block)
+        return keys, data
+
+    def close(self) -> None:
+        """Release the mapping (and the block itself when we created it)."""
+        if self._shm is None:
+            return
+        self.keys = self.data = None
+        for view in self._views:
+            view.release()
+        self._views = ()
+        shm, self._shm = self._shm, None
+        try:
+            shm.close()
+            if self._owner:
+                shm.unlink()
+        except (BufferError, FileNotFoundError):
+            pass
+
+
+def _helper_main(helper_id: int, tt_name: str, tt_size_mb: int, components, job_queue,
+                 result_queue, stop_event, node_counts) -> None:
+    """Helper process loop: wait for a root position, search it, report the result."""
+    from ..engine import SlowMateEngine
+
+    engine = SlowMateEngine(dict(components, tt='shared'),
+                            tt=SharedTranspositionTable(tt_size_mb, name=tt_name))
+    engine.uci.set_silent_mode(True)
+    engine.root_move_rotation = helper_id
+    depth_offset = helper_id % 2  # Half of the helpers start one ply deeper
+
+    while True:
+        job = job_queue.get()
+        if job is None:
+            break
+        search_id, fen, move_ucis, max_depth, deadline, tt_age, settings = job
+
+        # Usually the previous job's position plus a move or two
+        engine.set_position(fen, [chess.Move.from_uci(move_uci) for move_uci in move_ucis])
+        engine.apply_search_settings(settings)  # Pruning, reductions and IIR as on the main engine
+        engine.tt.age = tt_age
+        engine._age_search_state()
+        engine.nodes = 0
+        engine.last_score = None
+        engine.start_time = time.time()
+        engine.search_deadline = deadline
+        engine.uci.stop_requested = False
+        engine.time_manager.start_search()
+        engine.limits.start(depth=max_depth, start_time=engine.start_time,
+                            hard_time=deadline - engine.start_time if deadline else None)
+        node_counts[helper_id] = 0
+
+        # Forward the shared stop flag and publish node counts while searching
+        def monitor():
+            while not stop_event.wait(0.01):
+                node_counts[helper_id] = engine.nodes
+            engine.uci.stop_requested = True
+        monitor_thread = threading.Thread(target=monitor, daemon=True)
+        monitor_thread.start()
+
+        result = (None, 0, 0, [])
+        moves = engine.move_generator.get_legal_moves()
+        if moves:
+            start_depth = min(1 + depth_offset, max_depth)
+            result = engine._iterative_deepening(moves, max_depth, start_depth=start_depth)
+        stop_event.wait()
+        monitor_thread.join()
+        node_counts[helper_id] = engine.nodes
+
+        best_move, best_score, depth, pv = result
+        result_queue.put((search_id, helper_id, depth, best_score,
+                          best_move.uci() if best_move else None,
+                          [move.uci() for move in pv], engine.nodes))
+
+    engine.tt.close()
+
+
+class LazySMPPool:
+    """Pool of helper search processes sharing a transposition table."""
+
+    def __init__(self, num_helpers: int, tt: SharedTranspositionTable,
+                 components: Optional[Dict[str, str]] = None):
+        """Start num_helpers helper processes attached to the shared table.
+
+        components are the engine's component choices; helpers search
+        with the same ones.
+        """
+        self.num_helpers = num_helpers
+        self.tt = tt
+        self.search_id = 0
+        self.searching = False
+
+        context = multiprocessing.get_context()
+        self.stop_event = context.Event()
+        self.stop_event.set()
+        self.result_queue = context.Queue()
+        self.node_counts = context.Array('q', num_helpers, lock=False)
+        self.job_queues = []
+        self.processes = []
+        for helper_id in range(num_helpers):
+            job_queue = context.Queue()
+            process = context.Process(
+                target=_helper_main,
+                args=(helper_id, tt.name, tt.size_mb, dict(components or {}), job_queue,
+                      self.result_queue, self.stop_event, self.node_counts),
+                daemon=True
+            )
+            process.start()
+            self.job_queues.append(job_queue)
+            self.processes.append(process)
+        atexit.register(self.shutdown)
+
+    def start_search(self, board: chess.Board, max_depth: int, deadline: Optional[float],
+                     settings: Dict[str, object]) -> None:
+        """Start all helpers on the given root position with the main engine's search_settings()."""
+        self.search_id += 1
+        self.searching = True
+        for helper_id in range(self.num_helpers):
+            self.node_counts[helper_id] = 0
+        self.stop_event.clear()
+
+        root = board.root()
+        move_ucis = [move.uci() for move in board.move_stack]
+        job = (self.search_id, root.fen(), move_ucis, max_depth, deadline, self.tt.age, settings)
+        for job_queue in self.job_queues:
+            job_queue.put(job)
+
+    def helper_nodes(self) -> int:
+        """Nodes searched by all helpers in the current search."""
+        return sum(self.node_counts)
+
+    def stop_search(self, timeout: float = 2.0) -> List[Tuple[int, int, Optional[chess.Move], List[chess.Move], int]]:
+        """Stop the helpers and collect their (depth, score, move, pv, nodes) results."""
+        if not self.searching:
+            return []
+        self.stop_event.set()
+        self.searching = False
+
+        results = []
+        deadline = time.time() + timeout
+        while len(results) < self.num_helpers:
+            try:
+                message = self.result_queue.get(timeout=max(0.0, deadline - time.time()))
+            except queue.Empty:
+                break
+            search_id, _, depth, score, move_uci, pv_ucis, nodes = message
+            if search_id != self.search_id:
+                continue  # Late report from an abandoned search
+            move = chess.Move.from_uci(move_uci) if move_uci else None
+            results.append((depth, score, move, [chess.Move.from_uci(uci) for uci in pv_ucis], nodes))
+        return results
+
+    def shutdown(self) -> None:
+        """Stop all helpers and terminate their processes."""
+        self.stop_event.set()
+        for job_queue in self.job_queues:
+            try:
+                job_queue.put(None)
+            except (ValueError, OSError):
+                pass
+        for process in self.processes:
+            process.join(timeout=1.0)
+            if process.is_alive():
+                process.terminate()
+        self.processes = []
+        self.job_queues = []
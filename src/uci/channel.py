@@ -0,0 +1,137 @@
+"""
+SlowMate Chess Engine - UCI Channel Module
+Reader and writer threads between the GUI's pipes and the protocol
+Version: 1.0.0-BETA
+
+The GUI may be slow to read our output and is free to send commands at
+any time. A blocking print() would make the search wait on the pipe, and
+a blocking input() loop runs commands only between reads. The reader
+thread queues commands (and can act on urgent ones at once); the writer
+thread owns stdout and the debug log, so the search only ever appends to
+a queue.
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, List, Optional, TextIO
+
+
+class UCIReader:
+    """Reads UCI commands on a dedicated thread into the commands queue."""
+
+    def __init__(self, stream: TextIO, on_line: Optional[Callable[[str], None]] = None):
+        """on_line runs on the reader thread for every command before it is queued.
+
+        None is queued at end of input.
+        """
+        self.stream = stream
+        self.on_line = on_line
+        self.commands = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="uci-reader", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        try:
+            for line in self.stream:
+                line = line.strip()
+                if not line:
+                    continue
+                if self.on_line is not None:
+                    self.on_line(line)
+                self.commands.put(line)
+        except (OSError, ValueError):
+            pass  # Input closed under us: treat as end of input
+        finally:
+            self.commands.put(None)
+
+
+class UCIWriter:
+    """Writes UCI output and the debug log on a dedicated thread.
+
+    send() only queues the line. info lines are collected and written
+    together at most once per info_interval seconds; any other line
+    (readyok, bestmove, ...) goes out at once, after the info lines
+    queued before it, so the order never changes. The debug log stays
+    open and is flushed with each batch.
+    """
+
+    _OUT, _LOG, _OPEN_LOG, _CLOSE = range(4)
+
+    def __init__(self, stream: TextIO, info_interval: float = 0.0):
+        self.stream = stream
+        self.info_interval = info_interval
+        self.log_file = None
+        self.writes = 0  # Batches written to the stream
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="uci-writer", daemon=True)
+        self.thread.start()
+
+    def send(self, message: str) -> None:
+        """Queue one line of output."""
+        self.queue.put((self._OUT, message))
+
+    def log(self, line: str) -> None:
+        """Queue one line for the debug log (ignored until open_log)."""
+        self.queue.put((self._LOG, line))
+
+    def open_log(self, path: str) -> None:
+        """Append the debug log to path from now on."""
+        self.queue.put((self._OPEN_LOG, path))
+
+    def close(self, timeout: float = 1.0) -> None:
+        """Write everything queued, close the log and end the thread."""
+        self.queue.put((self._CLOSE, None))
+        self.thread.join(timeout)
+
+    def _run(self):
+        pending = []
+        last_write = 0.0
+        closing = False
+        while not closing:
+            timeout = None
+            if pending:
+                timeout = max(0.0, last_write + self.info_interval - time.monotonic())
+            try:
+                items = [self.queue.get(timeout=timeout)]
+            except queue.Empty:
+                items = []  # The info interval has passed
+            while True:  # Take whatever else is queued: one write for the lot
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            urgent = not items
+            for kind, value in items:
+                if kind == self._OUT:
+                    pending.append(value)
+                    if not value.startswith("info"):
+                        urgent = True
+                elif kind == self._LOG:
+                    if self.log_file is not None:
+                        self.log_file.write(value + "\n")
+                elif kind == self._OPEN_LOG:
+                    if self.log_file is None:
+                        self.log_file = open(value, 'a')
+                else:
+                    closing = urgent = True
+
+            if pending and (urgent or time.monotonic() - last_write >= self.info_interval):
+                self._write(pending)
+                pending = []
+                last_write = time.monotonic()
+            if self.log_file is not None:
+                self.log_file.flush()
+
+        if self.log_file is not None:
+            self.log_file.close()
+            self.log_file = None
+
+    def _write(self, lines: List[str]):
+        try:
+            self.stream.write("\n".join(lines) + "\n")
+            self.stream.flush()
+            self.writes += 1
+        except (OSError, ValueError):
+            pass  # GUI went away; nothing useful to do with the output
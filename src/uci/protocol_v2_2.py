@@ -7,16 +7,33 @@ import chess
 import threading
 import time
 import sys
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, TextIO
 
-# Import TranspositionTable for hash option
-try:
-    from slowmate.search.enhanced import TranspositionTable
-except ImportError:
-    # Fallback if import fails
-    class TranspositionTable:
-        def __init__(self, size_mb=64):
-            self.size_mb = size_mb
+from .channel import UCIReader, UCIWriter
+from ..bench import DEFAULT_BENCH_DEPTH, run_bench
+from ..components import REGISTRY
+
+
+DEBUG_LOG_FILE = 'slowmate_uci_debug.log'
+
+# UCI combo options selecting the engine core's components (src/components.py)
+COMPONENT_OPTIONS = {
+    'Searcher': 'searcher',
+    'Evaluator': 'evaluator',
+    'MoveOrdering': 'move_ordering',
+    'HashTable': 'tt',
+    'TimeManager': 'time_manager'
+}
+
+# UCI check options switching the searcher's forward pruning techniques;
+# each also has a <name>Margin spin option (src/search/pruning.py)
+PRUNING_OPTIONS = {
+    'ReverseFutility': 'reverse_futility',
+    'Razoring': 'razoring',
+    'Futility': 'futility',
+    'LateMovePruning': 'late_move'
+}
+PRUNING_MARGIN_MAX = 1000
 
 
 class UCIProtocol:
@@ -27,8 +44,19 @@ class UCIProtocol:
         self.engine = engine
         self.stop_requested = False
         self.debug_mode = False
+        self.silent_mode = False
         self.position_set = False
         self.search_thread = None
+        # Set when bestmove may be sent; ponder and infinite searches wait for stop/ponderhit
+        self.bestmove_allowed = threading.Event()
+        
+        # run() moves I/O to reader/writer threads; handle_command alone prints directly
+        self.writer = None
+        self.commands = None
+        self.running = False
+        self.debug_log = None  # Debug log handle without a writer thread
+        self.debug_log_lock = threading.Lock()
+        self.writer_log_open = False
         
         # v2.2 ENHANCEMENT: UCI options
         self.options = {
@@ -39,6 +67,20 @@ class UCIProtocol:
                 'max': 1024,
                 'value': 64
             },
+            'Threads': {
+                'type': 'spin',
+                'default': 1,
+                'min': 1,
+                'max': 64,
+                'value': 1
+            },
+            'EvalCache': {
+                'type': 'spin',
+                'default': 16,
+                'min': 0,
+                'max': 1024,
+                'value': 16
+            },
             'MultiPV': {
                 'type': 'spin', 
                 'default': 1,
@@ -46,6 +88,13 @@ class UCIProtocol:
                 'max': 5,
                 'value': 1
             },
+            'InfoInterval': {
+                'type': 'spin',
+                'default': 50,
+                'min': 0,
+                'max': 1000,
+                'value': 50
+            },
             'Ponder': {
                 'type': 'check',
                 'default': False,
@@ -53,11 +102,46 @@ class UCIProtocol:
             },
             'OwnBook': {
                 'type': 'check',
-                'default': False,
-                'value': False
+                'default': True,
+                'value': True
             }
         }
         
+        # Component choices, defaulting to the engine's configuration
+        if hasattr(engine, 'set_component'):
+            for option_name, kind in COMPONENT_OPTIONS.items():
+                self.options[option_name] = {
+                    'type': 'combo',
+                    'default': engine.components[kind],
+                    'vars': REGISTRY.names(kind),
+                    'value': engine.components[kind]
+                }
+        
+        # Forward pruning switches and margins, defaulting to the searcher's settings
+        if hasattr(engine, 'searcher'):
+            for option_name, technique_name in PRUNING_OPTIONS.items():
+                technique = engine.searcher.pruning.technique(technique_name)
+                self.options[option_name] = {
+                    'type': 'check',
+                    'default': technique.enabled,
+                    'value': technique.enabled
+                }
+                self.options[f"{option_name}Margin"] = {
+                    'type': 'spin',
+                    'default': technique.margin,
+                    'min': 0,
+                    'max': PRUNING_MARGIN_MAX,
+                    'value': technique.margin
+                }
+            
+            # What to do at PV and cut nodes without a hash move
+            self.options['InternalIterative'] = {
+                'type': 'combo',
+                'default': engine.searcher.internal_iterative,
+                'vars': list(engine.searcher.INTERNAL_ITERATIVE_MODES),
+                'value': engine.searcher.internal_iterative
+            }
+        
         # v2.2 ENHANCEMENT: Performance tracking
         self.search_stats = {
             'positions_analyzed': 0,
@@ -68,21 +152,48 @@ class UCIProtocol:
     
     def _out(self, message: str):
         """Send message to UCI interface."""
+        if self.silent_mode:
+            return
         try:
-            print(message, flush=True)
+            if self.writer is not None:
+                self.writer.send(message)  # Never waits on the GUI
+            else:
+                print(message, flush=True)
             if self.debug_mode:
-                with open('slowmate_uci_debug.log', 'a') as f:
-                    f.write(f"OUT: {message}\n")
+                self._log(f"OUT: {message}")
         except Exception:
             pass  # Fail silently to avoid UCI protocol disruption
     
+    def _log(self, line: str):
+        """Append a line to the debug log (kept open, buffered)."""
+        if self.writer is not None:
+            if not self.writer_log_open:
+                self.writer.open_log(DEBUG_LOG_FILE)
+                self.writer_log_open = True
+            self.writer.log(line)
+            return
+        with self.debug_log_lock:
+            if self.debug_log is None:
+                self.debug_log = open(DEBUG_LOG_FILE, 'a')
+            self.debug_log.write(line + "\n")
+    
+    def _close_log(self):
+        """Flush and close the direct debug log handle."""
+        with self.debug_log_lock:
+            if self.debug_log is not None:
+                self.debug_log.close()
+                self.debug_log = None
+    
+    def set_silent_mode(self, silent: bool = True) -> None:
+        """Enable/disable silent mode (tests and Lazy SMP helper processes)."""
+        self.silent_mode = silent
+    
     def _debug(self, message: str):
         """Send debug message if debug mode is enabled."""
         if self.debug_mode:
             try:
                 self._out(f"info string DEBUG: {message}")
-                with open('slowmate_uci_debug.log', 'a') as f:
-                    f.write(f"DEBUG: {message}\n")
+                self._log(f"DEBUG: {message}")
             except Exception:
                 pass
     
@@ -90,8 +201,7 @@ class UCIProtocol:
         """Handle incoming UCI command."""
         try:
             if self.debug_mode:
-                with open('slowmate_uci_debug.log', 'a') as f:
-                    f.write(f"IN: {command}\n")
+                self._log(f"IN: {command}")
             
             parts = command.strip().split()
             if not parts:
@@ -121,6 +231,8 @@ class UCIProtocol:
                 self._handle_ponderhit()
             elif cmd == "quit":
                 self._handle_quit()
+            elif cmd == "bench":
+                self._handle_bench(parts)
             else:
                 self._debug(f"Unknown command: {command}")
                 
@@ -139,6 +251,9 @@ class UCIProtocol:
                 self._out(f"option name {option_name} type spin default {option_data['default']} min {option_data['min']} max {option_data['max']}")
             elif option_data['type'] == 'check':
                 self._out(f"option name {option_name} type check default {option_data['default']}")
+            elif option_data['type'] == 'combo':
+                choices = " ".join(f"var {name}" for name in option_data['vars'])
+                self._out(f"option name {option_name} type combo default {option_data['default']} {choices}")
         
         self._out("uciok")
     
@@ -147,6 +262,8 @@ class UCIProtocol:
         if len(parts) > 1:
             self.debug_mode = parts[1].lower() == "on"
             self._debug(f"Debug mode: {'ON' if self.debug_mode else 'OFF'}")
+            if not self.debug_mode:
+                self._close_log()
     
     def _handle_isready(self):
         """Handle isready command."""
@@ -174,17 +291,82 @@ class UCIProtocol:
                         # v2.2 ENHANCEMENT: Process option changes
                         if option_name == "Hash":
                             hash_size = int(option_value)
+                            hash_size = max(self.options[option_name]['min'],
+                                            min(hash_size, self.options[option_name]['max']))
                             self.options[option_name]['value'] = hash_size
-                            if hasattr(self.engine, 'tt'):
-                                self.engine.tt = TranspositionTable(size_mb=hash_size)
+                            if hasattr(self.engine, 'resize_hash'):
+                                self.engine.resize_hash(hash_size)
+                            elif hasattr(self.engine, 'tt'):
+                                self.engine.tt.resize(hash_size)
                             self._debug(f"Hash size set to {hash_size} MB")
                         
+                        elif option_name == "Threads":
+                            threads = max(self.options[option_name]['min'],
+                                          min(int(option_value), self.options[option_name]['max']))
+                            self.options[option_name]['value'] = threads
+                            if hasattr(self.engine, 'set_threads'):
+                                self.engine.set_threads(threads)
+                            self._debug(f"Threads set to {threads}")
+                        
+                        elif option_name == "EvalCache":
+                            cache_size = max(self.options[option_name]['min'],
+                                             min(int(option_value), self.options[option_name]['max']))
+                            self.options[option_name]['value'] = cache_size
+                            if hasattr(self.engine, 'resize_eval_cache'):
+                                self.engine.resize_eval_cache(cache_size)
+                            self._debug(f"Eval cache size set to {cache_size} MB")
+                        
                         elif option_name == "MultiPV":
-                            self.options[option_name]['value'] = int(option_value)
-                            self._debug(f"MultiPV set to {option_value}")
+                            lines = max(self.options[option_name]['min'],
+                                        min(int(option_value), self.options[option_name]['max']))
+                            self.options[option_name]['value'] = lines
+                            if hasattr(self.engine, 'set_multi_pv'):
+                                self.engine.set_multi_pv(lines)
+                            self._debug(f"MultiPV set to {lines}")
+                        
+                        elif option_name == "InfoInterval":
+                            interval = max(self.options[option_name]['min'],
+                                           min(int(option_value), self.options[option_name]['max']))
+                            self.options[option_name]['value'] = interval
+                            if self.writer is not None:
+                                self.writer.info_interval = interval / 1000.0
+                            self._debug(f"Info interval set to {interval} ms")
+                        
+                        elif option_name in COMPONENT_OPTIONS:
+                            if option_value not in self.options[option_name]['vars']:
+                                self._debug(f"Unknown {option_name}: {option_value}")
+                            else:
+                                self.engine.set_component(COMPONENT_OPTIONS[option_name], option_value)
+                                self.options[option_name]['value'] = option_value
+                                self._debug(f"{option_name} set to {option_value}")
+                        
+                        elif option_name in PRUNING_OPTIONS:
+                            enabled = option_value.lower() == "true"
+                            self.options[option_name]['value'] = enabled
+                            self.engine.searcher.pruning.technique(PRUNING_OPTIONS[option_name]).enabled = enabled
+                            self._debug(f"{option_name} set to {option_value}")
+                        
+                        elif option_name.endswith("Margin") and option_name[:-6] in PRUNING_OPTIONS:
+                            margin = max(self.options[option_name]['min'],
+                                         min(int(option_value), self.options[option_name]['max']))
+                            self.options[option_name]['value'] = margin
+                            self.engine.searcher.pruning.technique(PRUNING_OPTIONS[option_name[:-6]]).margin = margin
+                            self._debug(f"{option_name} set to {margin}")
+                        
+                        elif option_name == "InternalIterative":
+                            if option_value not in self.options[option_name]['vars']:
+                                self._debug(f"Unknown {option_name}: {option_value}")
+                            else:
+                                self.engine.searcher.internal_iterative = option_value
+                                self.options[option_name]['value'] = option_value
+                                self._debug(f"{option_name} set to {option_value}")
                         
                         elif option_name in ["Ponder", "OwnBook"]:
                             self.options[option_name]['value'] = option_value.lower() == "true"
+                            if option_name == "Ponder" and hasattr(self.engine, 'time_manager'):
+                                self.engine.time_manager.ponder = self.options[option_name]['value']
+                            elif option_name == "OwnBook" and hasattr(self.engine, 'use_book'):
+                                self.engine.use_book = self.options[option_name]['value']
                             self._debug(f"{option_name} set to {option_value}")
                         
                         else:
@@ -220,12 +402,12 @@ class UCIProtocol:
                 return
             
             if parts[1] == "startpos":
-                self.engine.set_position("startpos")
+                position = "startpos"
                 moves_start = 2
             elif parts[1] == "fen":
                 # Find where FEN ends and moves begin
                 fen_parts = []
-                moves_start = 2
+                moves_start = len(parts)
                 for i in range(2, len(parts)):
                     if parts[i] == "moves":
                         moves_start = i
@@ -233,8 +415,7 @@ class UCIProtocol:
                     fen_parts.append(parts[i])
                 
                 if fen_parts:
-                    fen = " ".join(fen_parts)
-                    self.engine.set_position(fen)
+                    position = " ".join(fen_parts)
                 else:
                     self._debug("Invalid FEN in position command")
                     return
@@ -242,20 +423,22 @@ class UCIProtocol:
                 self._debug(f"Invalid position command: {' '.join(parts)}")
                 return
             
-            # Apply moves if present
+            # Parse moves if present
+            moves = []
             if moves_start < len(parts) and parts[moves_start] == "moves":
                 for move_str in parts[moves_start + 1:]:
                     try:
-                        move = chess.Move.from_uci(move_str)
-                        if move in self.engine.board.board.legal_moves:
-                            self.engine.make_move(move)
-                        else:
-                            self._debug(f"Illegal move: {move_str}")
-                            break
-                    except Exception as e:
+                        moves.append(chess.Move.from_uci(move_str))
+                    except ValueError as e:
                         self._debug(f"Move parsing error: {move_str} - {e}")
                         break
             
+            # The engine only applies the moves that differ from its current position
+            try:
+                self.engine.set_position(position, moves)
+            except ValueError as e:
+                self._debug(str(e))
+            
             self.position_set = True
             self._debug(f"Position set: {self.engine.board.get_fen()}")
             
@@ -278,6 +461,12 @@ class UCIProtocol:
             
             # Start search in separate thread
             self.stop_requested = False
+            if hasattr(self.engine, 'ponderhit_pending'):
+                self.engine.ponderhit_pending = False  # Only a ponderhit after this go counts
+            if search_params.get("ponder") or search_params.get("infinite"):
+                self.bestmove_allowed.clear()
+            else:
+                self.bestmove_allowed.set()
             self.search_thread = threading.Thread(
                 target=self._search_thread,
                 args=(search_params,),
@@ -349,25 +538,23 @@ class UCIProtocol:
         try:
             start_time = time.time()
             
-            # Calculate time allocation
-            time_limit = None
-            depth_limit = None
-            
-            if "movetime" in search_params:
-                time_limit = search_params["movetime"]
-            elif "depth" in search_params:
-                depth_limit = search_params["depth"]
-            elif not search_params.get("infinite", False):
-                # Calculate time from time control
-                time_limit = self._calculate_time_limit(search_params)
-            
-            # Perform search
+            # Perform search (the engine turns the go limits into its stop conditions)
             best_move = self.engine.search(
-                time_limit_ms=time_limit,
-                depth_override=depth_limit,
-                **search_params
+                time_limit_ms=search_params.get("movetime"),
+                depth_override=search_params.get("depth"),
+                wtime=search_params.get("wtime"),
+                btime=search_params.get("btime"),
+                winc=search_params.get("winc"),
+                binc=search_params.get("binc"),
+                moves_to_go=search_params.get("movestogo"),
+                nodes=search_params.get("nodes"),
+                infinite=search_params.get("infinite", False),
+                ponder=search_params.get("ponder", False)
             )
             
+            # UCI: a ponder or infinite search that ends early still waits for stop or ponderhit
+            self.bestmove_allowed.wait()
+            
             # Calculate search statistics
             elapsed_time = time.time() - start_time
             self.search_stats['positions_analyzed'] += 1
@@ -376,9 +563,15 @@ class UCIProtocol:
             if hasattr(self.engine, 'nodes'):
                 self.search_stats['nodes_per_second'] = int(self.engine.nodes / max(elapsed_time, 0.001))
             
-            # Send best move
-            if best_move and not self.stop_requested:
-                self._out(f"bestmove {best_move.uci()}")
+            # Send best move (after a stop, the best move of the last completed iteration)
+            if best_move:
+                ponder_move = None
+                if hasattr(self.engine, 'get_ponder_move'):
+                    ponder_move = self.engine.get_ponder_move(best_move)
+                if ponder_move:
+                    self._out(f"bestmove {best_move.uci()} ponder {ponder_move.uci()}")
+                else:
+                    self._out(f"bestmove {best_move.uci()}")
                 self._debug(f"Search completed: {best_move.uci()} in {elapsed_time:.3f}s, {self.engine.nodes} nodes")
             else:
                 # Emergency fallback
@@ -403,46 +596,10 @@ class UCIProtocol:
             except:
                 self._out("bestmove 0000")
     
-    def _calculate_time_limit(self, search_params: Dict[str, Any]) -> Optional[int]:
-        """v2.2 ENHANCEMENT: Advanced time limit calculation."""
-        is_white = self.engine.board.board.turn == chess.WHITE
-        
-        our_time = search_params.get('wtime' if is_white else 'btime', 0)
-        our_increment = search_params.get('winc' if is_white else 'binc', 0)
-        moves_to_go = search_params.get('movestogo', 40)
-        
-        if our_time <= 0:
-            return None
-        
-        # Basic time allocation: divide remaining time by expected moves
-        base_allocation = our_time / (moves_to_go + 5)  # Conservative
-        
-        # Add most of the increment
-        base_allocation += our_increment * 0.8
-        
-        # Position complexity adjustment (if available)
-        if hasattr(self.engine, 'position_complexity'):
-            complexity_factor = 1.0
-            if self.engine.critical_position:
-                complexity_factor = 1.5
-            elif self.engine.position_complexity > 40:
-                complexity_factor = 1.2
-            elif self.engine.position_complexity < 20:
-                complexity_factor = 0.8
-            
-            base_allocation *= complexity_factor
-        
-        # Safety limits
-        max_time = our_time * 0.1  # Never use more than 10%
-        min_time = max(100, our_time * 0.01)  # At least 100ms or 1%
-        
-        allocated_time = max(min_time, min(base_allocation, max_time))
-        
-        return int(allocated_time)
-    
     def _handle_stop(self):
         """Handle stop command."""
         self.stop_requested = True
+        self.bestmove_allowed.set()
         
         # Wait for search thread to finish
         if self.search_thread and self.search_thread.is_alive():
@@ -452,36 +609,75 @@ class UCIProtocol:
     
     def _handle_ponderhit(self):
         """Handle ponderhit command."""
-        # Convert ponder search to normal search
-        # For now, just continue the current search
+        # Convert ponder search to normal search: the search keeps its tree
+        # and iterations, only the clock limits start now
+        if hasattr(self.engine, 'ponderhit'):
+            self.engine.ponderhit()
+        self.bestmove_allowed.set()
         self._debug("Ponder hit - converting to normal search")
     
+    def _handle_bench(self, parts):
+        """Handle bench [depth]: fixed-depth search of the bench suite (not UCI)."""
+        self._handle_stop()
+        depth = DEFAULT_BENCH_DEPTH
+        if len(parts) > 1:
+            try:
+                depth = max(1, int(parts[1]))
+            except ValueError:
+                self._debug(f"Invalid bench depth: {parts[1]}")
+                return
+        run_bench(self.engine, depth, report=lambda line: self._out(f"info string {line}"))
+        self.position_set = False  # The bench leaves the engine on a new game
+    
     def _handle_quit(self):
         """Handle quit command."""
         self._handle_stop()
+        if getattr(self.engine, 'smp_pool', None):
+            self.engine.smp_pool.shutdown()
         self._debug("Engine shutting down")
-        try:
-            sys.exit(0)
-        except:
-            pass
+        self.running = False  # Ends run()
+        self._close_log()
+    
+    def _on_input(self, command: str):
+        """Reader thread: act on urgent commands before they are queued."""
+        if command.split()[0].lower() in ("stop", "quit"):
+            self.stop_requested = True  # The search sees it at its next poll
     
-    def run(self):
-        """Main UCI loop."""
+    def interrupt(self):
+        """Stop the search and end run() (signal handlers)."""
+        self.stop_requested = True
+        self.bestmove_allowed.set()
+        if self.commands is not None:
+            self.commands.put(None)
+    
+    def run(self, input_stream: Optional[TextIO] = None, output_stream: Optional[TextIO] = None):
+        """Main UCI loop.
+        
+        A reader thread feeds commands to this thread and a writer thread
+        sends the output, so neither the search nor command handling waits
+        on the GUI's pipes. stop takes effect on the reader thread as soon
+        as it arrives; isready is answered once the commands before it are
+        handled, which a running search does not delay.
+        """
+        self.writer = UCIWriter(output_stream or sys.stdout,
+                                self.options['InfoInterval']['value'] / 1000.0)
+        self.commands = UCIReader(input_stream or sys.stdin, self._on_input).commands
+        self.running = True
         self._debug("SlowMate v2.2 UCI interface started")
         
         try:
-            while True:
-                try:
-                    line = input().strip()
-                    if line:
-                        self.handle_command(line)
-                except EOFError:
-                    break
-                except KeyboardInterrupt:
-                    break
-                except Exception as e:
-                    self._debug(f"Input error: {e}")
+            while self.running:
+                command = self.commands.get()
+                if command is None:
+                    break  # End of input
+                self.handle_command(command)
+        except KeyboardInterrupt:
+            pass
         except Exception as e:
             self._debug(f"UCI loop error: {e}")
         finally:
             self._debug("UCI interface shutting down")
+            self.running = False
+            writer, self.writer = self.writer, None
+            writer.close()
+            self.writer_log_open = False
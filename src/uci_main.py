@@ -8,6 +8,7 @@ Can be used as a standalone script or imported for testing.
 import sys
 import os
 import signal
+import multiprocessing
 from typing import Optional
 
 # Add the parent directory to the path to import slowmate modules
@@ -31,7 +32,8 @@ class UCIMain:
         """Initialize the chess engine and UCI protocol."""
         try:
             self.engine = SlowMateEngine()
-            self.uci = UCIProtocol(self.engine)
+            # The engine polls its own protocol's stop flag, so drive that one
+            self.uci = getattr(self.engine, 'uci', None) or UCIProtocol(self.engine)
             self.uci.debug_mode = self.debug_mode
             return True
         except Exception as e:
@@ -48,29 +50,8 @@ class UCIMain:
         signal.signal(signal.SIGTERM, self._signal_handler)
         
         try:
-            while self.running:
-                try:
-                    command = input().strip()
-                    if not command:
-                        continue
-                        
-                    if command == "quit":
-                        self.running = False
-                        break
-                        
-                    if self.uci:
-                        self.uci.handle_command(command)
-                    
-                except EOFError:
-                    # End of input stream
-                    break
-                except KeyboardInterrupt:
-                    # Ctrl+C pressed
-                    break
-                except Exception as e:
-                    if self.debug_mode:
-                        print(f"info string Command error: {e}", flush=True)
-                        
+            # Reader/writer threads: commands and output never wait on each other
+            self.uci.run()
         except Exception as e:
             if self.debug_mode:
                 print(f"info string UCI loop error: {e}", flush=True)
@@ -81,7 +62,7 @@ class UCIMain:
         """Handle system signals for graceful shutdown."""
         self.running = False
         if self.uci:
-            self.uci.stop_requested = True
+            self.uci.interrupt()
             
     def _cleanup(self):
         """Clean up resources before exit."""
@@ -112,8 +93,15 @@ class UCIMain:
 
 def main():
     """Main entry point for the UCI interface."""
+    # Lazy SMP helper processes must start cleanly from frozen executables
+    multiprocessing.freeze_support()
     debug_mode = False
-    
+
+    # 'bench [depth]' runs the benchmark instead of the UCI loop
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        from slowmate.bench import main as bench_main
+        sys.exit(bench_main(sys.argv[2:]))
+
     # Check for debug flag
     if len(sys.argv) > 1 and sys.argv[1] == "--debug":
         debug_mode = True
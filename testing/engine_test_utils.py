@@ -0,0 +1,27 @@
+"""
+Shared fixtures for the SlowMate engine tests
+A common middlegame position and a test case that records the engine's
+UCI output
+"""
+
+import sys
+import os
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.engine import SlowMateEngine
+
+
+# Italian game middlegame with both sides developed and castled
+MIDDLEGAME_FEN = "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 6 8"
+
+
+class EngineOutputTestCase(unittest.TestCase):
+    """Test case with a fresh engine whose UCI output lines collect in self.output."""
+
+    def setUp(self):
+        self.engine = SlowMateEngine()
+        self.output = []
+        self.engine.uci._out = self.output.append
@@ -0,0 +1,78 @@
+"""
+Evaluator Backend Microbenchmark for SlowMate Chess Engine
+Times the positional terms of the "squares" and "bitboard" EnhancedEvaluator
+backends on positions sampled from the PGNs in games/.
+
+Usage:
+    python testing/evaluator_benchmark.py [positions]
+"""
+
+import sys
+import os
+import glob
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+import chess.pgn
+from src.core.board import Board
+from src.core.enhanced_evaluate import EnhancedEvaluator
+
+
+GAMES_DIR = os.path.join(os.path.dirname(__file__), '..', 'games')
+
+
+def sample_positions(count: int):
+    """Collect up to count Boards, every 3rd ply of the games in games/."""
+    positions = []
+    for pgn_path in sorted(glob.glob(os.path.join(GAMES_DIR, '*.pgn'))):
+        with open(pgn_path, encoding='latin-1') as pgn_file:
+            while len(positions) < count:
+                game = chess.pgn.read_game(pgn_file)
+                if game is None:
+                    break
+                board = Board()
+                for ply, move in enumerate(game.mainline_moves()):
+                    board.make_move(move)
+                    if ply % 3 == 0 and len(positions) < count:
+                        snapshot = Board()
+                        snapshot.board = board.board.copy()
+                        snapshot.pawn_key = board.pawn_key
+                        positions.append(snapshot)
+    return positions
+
+
+def time_backend(backend: str, positions, repeat: int = 3) -> float:
+    """Best-of-repeat seconds for one pass of positional terms over all positions."""
+    evaluator = EnhancedEvaluator(backend=backend)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for board in positions:
+            evaluator._evaluate_positional_terms(board.board, board.pawn_key)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    positions = sample_positions(count)
+
+    print(f"Evaluator benchmark: {len(positions)} positions, positional terms")
+    print("-" * 60)
+
+    results = {}
+    for backend in ("squares", "bitboard"):
+        elapsed = time_backend(backend, positions)
+        results[backend] = elapsed
+        rate = int(len(positions) / max(elapsed, 1e-9))
+        print(f"{backend:<10} time {elapsed:7.3f}s  evals/sec {rate:>8}")
+
+    print("-" * 60)
+    print(f"Speedup: {results['squares'] / max(results['bitboard'], 1e-9):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,7 @@ import io
 import sys
 from contextlib import contextmanager
 from slowmate.engine import SlowMateEngine
-from slowmate.uci.protocol import UCIProtocol
+from slowmate.uci.protocol_v2_2 import UCIProtocol
 
 class TestUCIProtocol(unittest.TestCase):
     def setUp(self):
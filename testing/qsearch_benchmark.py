@@ -0,0 +1,92 @@
+"""
+Quiescence Search Benchmark for SlowMate Chess Engine
+Compares quiescence nodes/sec when the evaluator re-detects checkmate and
+stalemate at every stand-pat (the old behaviour) against the search owning
+terminal detection (terminal_checked=True).
+
+Usage:
+    python testing/qsearch_benchmark.py [depth] [repeat]
+"""
+
+import sys
+import os
+import io
+import time
+import contextlib
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.bench import BENCH_FENS
+from src.engine import SlowMateEngine
+
+
+class RecheckingEvaluator:
+    """Evaluator wrapper that ignores terminal_checked, as before the change."""
+
+    def __init__(self, evaluator):
+        self.evaluator = evaluator
+
+    def evaluate(self, board, terminal_checked: bool = False) -> float:
+        return self.evaluator.evaluate(board)
+
+    def __getattr__(self, name):
+        return getattr(self.evaluator, name)
+
+
+def run_qsearch(recheck: bool, depth: int):
+    """Search every bench position to depth; returns (qnodes, seconds in quiescence)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = SlowMateEngine()
+    engine.uci.set_silent_mode(True)
+    engine.use_book = False
+    if recheck:
+        engine.evaluator = RecheckingEvaluator(engine.evaluator)
+
+    # Time only the outermost quiescence calls
+    quiescence = engine._quiescence_search
+    timing = {'elapsed': 0.0, 'active': False}
+
+    def timed_quiescence(*args):
+        if timing['active']:
+            return quiescence(*args)
+        timing['active'] = True
+        start = time.perf_counter()
+        try:
+            return quiescence(*args)
+        finally:
+            timing['elapsed'] += time.perf_counter() - start
+            timing['active'] = False
+
+    engine._quiescence_search = timed_quiescence
+    qnodes = 0
+    for fen in BENCH_FENS:
+        engine.new_game()
+        engine.set_position(fen)
+        engine.search(depth_override=depth)
+        qnodes += engine.qnodes
+    return qnodes, timing['elapsed']
+
+
+def main():
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    print(f"Quiescence benchmark: {len(BENCH_FENS)} positions, depth {depth}, best of {repeat}")
+    print("-" * 60)
+
+    rates = {}
+    for label, recheck in (("recheck", True), ("search", False)):
+        best = float('inf')
+        for _ in range(repeat):
+            qnodes, elapsed = run_qsearch(recheck, depth)
+            best = min(best, elapsed)
+        rates[label] = qnodes / max(best, 1e-9)
+        print(f"{label:<8} qnodes {qnodes:>7}  time {best:7.3f}s  qnodes/sec {int(rates[label]):>8}")
+
+    print("-" * 60)
+    print(f"Speedup: {rates['search'] / max(rates['recheck'], 1e-9):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
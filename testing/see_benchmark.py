@@ -0,0 +1,97 @@
+"""
+SEE Quiescence Benchmark for SlowMate Chess Engine
+Searches a small tactical suite (Win At Chess positions) to a fixed depth
+with the old victim-value capture ordering and with SEE ordering and
+pruning, and compares quiescence nodes and solve rate.
+
+Usage:
+    python testing/see_benchmark.py [depth]
+"""
+
+import sys
+import os
+import io
+import time
+import contextlib
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from src.engine import SlowMateEngine
+
+
+# (FEN, best move in SAN) from the Win At Chess suite
+TACTICAL_SUITE = [
+    ("2rr3k/pp3pp1/1nnqbN1p/3pN3/2pP4/2P3Q1/PPB4P/R4RK1 w - - 0 1", "Qg6"),
+    ("8/7p/5k2/5p2/p1p2P2/Pr1pPK2/1P1R3P/8 b - - 0 1", "Rxb2"),
+    ("5rk1/1ppb3p/p1pb4/6q1/3P1p1r/2P1R2P/PP1BQ1P1/5RKN w - - 0 1", "Rg3"),
+    ("r1bq2rk/pp3pbp/2p1p1pQ/7P/3P4/2PB1N2/PP3PPR/2KR4 w - - 0 1", "Qxh7+"),
+    ("5k2/6pp/p1qN4/1p1p4/3P4/2PKP2Q/PP3r2/3R4 b - - 0 1", "Qc4+"),
+    ("7k/p7/1R5K/6r1/6p1/6P1/8/8 w - - 0 1", "Rb7"),
+    ("rnbqkb1r/pppp1ppp/8/4P3/6n1/7P/PPPNPPP1/R1BQKBNR b KQkq - 0 1", "Ne3"),
+    ("r4q1k/p2bR1rp/2p2Q1N/5p2/5p2/2P5/PP3PPP/R5K1 w - - 0 1", "Rf7"),
+    ("3q1rk1/p4pp1/2pb3p/3p4/6Pr/1PNQ4/P1PB1PP1/4RRK1 b - - 0 1", "Bh2+"),
+    ("2br2k1/2q3rn/p2NppQ1/2p1P3/Pp5R/4P3/1P3PPP/3R2K1 w - - 0 1", "Rxh7"),
+    ("r1b1kb1r/3q1ppp/pBp1pn2/8/Np3P2/5B2/PPP3PP/R2Q1RK1 w kq - 0 1", "Bxc6"),
+    ("4k1r1/2p3r1/1pR1p3/3pP2p/3P2qP/P4N2/1PQ4P/5R1K b - - 0 1", "Qxf3+"),
+]
+
+
+class VictimValueEngine(SlowMateEngine):
+    """Engine with the pre-SEE capture value (victim only, so nothing is SEE-pruned)."""
+
+    def _see_capture_value(self, move: chess.Move) -> int:
+        board = self.board.board
+        if not board.is_capture(move):
+            return 0
+        captured_piece = board.piece_at(move.to_square)
+        if not captured_piece:
+            return 0
+        return self.evaluator.piece_values.get(captured_piece.piece_type, 0)
+
+
+def run_suite(engine_class, depth: int):
+    """Search every suite position to depth; return (solved, qnodes, nodes, seconds)."""
+    solved = qnodes = nodes = 0
+    elapsed = 0.0
+    for fen, best_san in TACTICAL_SUITE:
+        engine = engine_class()
+        engine.board.set_fen(fen)
+        engine.search_deadline = None
+        engine.uci.stop_requested = False
+        moves = engine.move_generator.get_legal_moves()
+
+        start = time.time()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for current_depth in range(1, depth + 1):
+                best_move, _, _ = engine._search_depth_with_pv(current_depth, -30000, 30000, moves)
+        elapsed += time.time() - start
+
+        board = chess.Board(fen)
+        if best_move is not None and best_move == board.parse_san(best_san):
+            solved += 1
+        qnodes += engine.qnodes
+        nodes += engine.nodes
+    return solved, qnodes, nodes, elapsed
+
+
+def main():
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    print(f"SEE benchmark: {len(TACTICAL_SUITE)} tactical positions, depth {depth}")
+    print("-" * 70)
+
+    results = {}
+    for label, engine_class in [("victim value", VictimValueEngine), ("SEE", SlowMateEngine)]:
+        solved, qnodes, nodes, elapsed = run_suite(engine_class, depth)
+        results[label] = qnodes
+        print(f"{label:<13} solved {solved:>2}/{len(TACTICAL_SUITE)}  qnodes {qnodes:>8}  "
+              f"nodes {nodes:>8}  time {elapsed:7.2f}s")
+
+    print("-" * 70)
+    print(f"Quiescence nodes: {results['SEE'] / max(results['victim value'], 1):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Test Suite for SlowMate Bench
+Checks that the bench suite is valid, that the node signature is
+reproducible and ignores the opening book, and that the UCI bench command
+reports the totals
+"""
+
+import sys
+import os
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from src.bench import BENCH_FENS, run_bench
+from src.engine import SlowMateEngine
+
+
+SHORT_SUITE = BENCH_FENS[:4]
+
+
+class TestBench(unittest.TestCase):
+    def make_engine(self):
+        engine = SlowMateEngine()
+        engine.uci._out = lambda message: None
+        return engine
+
+    def test_suite_positions_are_playable(self):
+        self.assertGreaterEqual(len(BENCH_FENS), 50)
+        self.assertEqual(len(set(BENCH_FENS)), len(BENCH_FENS))
+        for fen in BENCH_FENS:
+            board = chess.Board(fen)
+            self.assertTrue(board.is_valid(), fen)
+            self.assertFalse(board.is_game_over(), fen)
+
+    def test_signature_is_reproducible(self):
+        first = run_bench(self.make_engine(), 2, SHORT_SUITE)
+        # A used engine gives the same signature as a fresh one
+        engine = self.make_engine()
+        engine.set_position(BENCH_FENS[5])
+        engine.search(depth_override=2)
+        second = run_bench(engine, 2, SHORT_SUITE)
+        self.assertEqual(first.signature, second.signature)
+        self.assertEqual([p.best_move for p in first.positions],
+                         [p.best_move for p in second.positions])
+        self.assertEqual(first.signature, sum(p.nodes for p in first.positions))
+
+    def test_book_is_skipped(self):
+        engine = self.make_engine()
+        result = run_bench(engine, 1, [chess.STARTING_FEN])
+        self.assertGreater(result.positions[0].nodes, 0)
+        self.assertTrue(engine.use_book)
+
+    def test_own_book_option_matches_engine(self):
+        engine = self.make_engine()
+        output = []
+        engine.uci._out = output.append
+        engine.uci.handle_command("uci")
+        self.assertIn(f"option name OwnBook type check default {engine.use_book}", output)
+        engine.uci.handle_command("setoption name OwnBook value false")
+        self.assertFalse(engine.use_book)
+
+    def test_uci_bench_command(self):
+        engine = self.make_engine()
+        output = []
+        engine.uci._out = output.append
+        engine.uci.handle_command("bench 1")
+        self.assertEqual(sum(line.startswith("info string Position ") for line in output),
+                         len(BENCH_FENS))
+        self.assertTrue(any(line.startswith("info string Nodes/second: ") for line in output))
+        self.assertTrue(output[-1].startswith("info string Signature: "))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Differential Test for the SlowMate Bitboard Evaluator Backend
+Replays the PGNs in games/ and checks every positional term and the final
+score of the bitboard backend against the square-scanning backend
+"""
+
+import sys
+import os
+import glob
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+import chess.pgn
+from src.core.board import Board
+from src.core.enhanced_evaluate import EnhancedEvaluator
+from src.core.zobrist import compute_pawn_key
+
+
+GAMES_DIR = os.path.join(os.path.dirname(__file__), '..', 'games')
+POSITION_STRIDE = 5  # Terms are compared on every Nth ply
+
+
+def iter_games():
+    for pgn_path in sorted(glob.glob(os.path.join(GAMES_DIR, '*.pgn'))):
+        with open(pgn_path, encoding='latin-1') as pgn_file:
+            while True:
+                game = chess.pgn.read_game(pgn_file)
+                if game is None:
+                    break
+                yield game
+
+
+class TestBitboardEvaluator(unittest.TestCase):
+    def setUp(self):
+        self.bitboard = EnhancedEvaluator(backend="bitboard")
+        self.squares = EnhancedEvaluator(backend="squares")
+
+    def assertTermsIdentical(self, b: chess.Board):
+        fen = b.fen()
+        entry = self.bitboard.pawn_hash.probe(b, compute_pawn_key(b))
+        self.assertEqual(self.bitboard._evaluate_opening_principles_bitboard(b),
+                         self.squares._evaluate_opening_principles(b), fen)
+        self.assertEqual(entry.score, self.squares._evaluate_pawn_structure(b), fen)
+        self.assertEqual(self.bitboard._evaluate_king_safety_bitboard(b, entry),
+                         self.squares._evaluate_king_safety(b), fen)
+        self.assertEqual(self.bitboard._evaluate_piece_activity_bitboard(b, entry),
+                         self.squares._evaluate_piece_activity(b), fen)
+        self.assertEqual(self.bitboard._evaluate_center_and_mobility_bitboard(b),
+                         (self.squares._evaluate_center_control(b), self.squares._evaluate_mobility(b)), fen)
+
+    def test_terms_and_scores_identical_over_games(self):
+        compared = 0
+        for game in iter_games():
+            board = Board()
+            board.set_fen(game.board().fen())
+            board.attach_accumulator(self.bitboard.create_accumulator())
+            for ply, move in enumerate(game.mainline_moves()):
+                board.make_move(move)
+                if ply % POSITION_STRIDE == 0:
+                    self.assertTermsIdentical(board.board)
+                    self.assertEqual(self.bitboard.evaluate(board), self.squares.evaluate(board),
+                                     board.get_fen())
+                    compared += 1
+        self.assertGreater(compared, 1000)
+
+    def test_special_positions(self):
+        """Kings off the back rank, castled kings, early queens and promoted pieces."""
+        fens = [
+            "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPPKPPP/RNBQ1BNR b kq - 1 2",
+            "r1bq1rk1/pppp1ppp/2n2n2/2b1p3/2B1P3/2N2N2/PPPP1PPP/R1BQ1RK1 w - - 6 5",
+            "rnb1kbnr/pppp1ppp/8/4p3/4P2q/8/PPPP1PPP/RNBQKBNR w KQkq - 1 2",
+            "rnb1kbnr/pppp1ppp/8/4p3/4P1Pq/5N2/PPPP1P1P/RNBQKB1R b KQkq - 0 3",
+            "2k5/8/8/8/8/8/8/QQK4q w - - 0 1",
+            "4k3/P7/8/8/8/8/7p/4K3 w - - 0 1",
+        ]
+        for fen in fens:
+            board = Board()
+            board.set_fen(fen)
+            self.assertTermsIdentical(board.board)
+            self.assertEqual(self.bitboard.evaluate(board), self.squares.evaluate(board), fen)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            EnhancedEvaluator(backend="nnue")
+
+
+if __name__ == '__main__':
+    unittest.main()
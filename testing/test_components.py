@@ -0,0 +1,113 @@
+"""
+Test Suite for SlowMate Engine Components
+Checks that every component combination of the engine core searches legal
+moves, that UCI options swap components, and that the v2.x engines are
+configurations of the same core
+"""
+
+import sys
+import os
+import itertools
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from src.components import REGISTRY
+from src.engine import SlowMateEngine
+from src.engine_v2_1 import SlowMateEngine as EngineV21
+from src.engine_v2_2 import SlowMateEngine as EngineV22
+from src.search.ordering import StagedOrdering, SortedOrdering
+from engine_test_utils import MIDDLEGAME_FEN
+
+
+class TestComponents(unittest.TestCase):
+    def make_engine(self, components=None, engine_class=SlowMateEngine):
+        engine = engine_class(components)
+        engine.uci._out = lambda message: None
+        return engine
+
+    def test_defaults(self):
+        engine = self.make_engine()
+        self.assertEqual(engine.components, {
+            'searcher': 'pvs', 'evaluator': 'bitboard', 'move_ordering': 'staged',
+            'tt': 'local', 'time_manager': 'adaptive'
+        })
+        self.assertIsInstance(engine.move_ordering, StagedOrdering)
+
+    def test_unknown_component(self):
+        with self.assertRaises(ValueError):
+            SlowMateEngine({'searcher': 'mtdf'})
+        engine = self.make_engine()
+        with self.assertRaises(ValueError):
+            engine.set_component('tt', 'disk')
+        self.assertEqual(engine.components['tt'], 'local')
+
+    def test_all_search_combinations(self):
+        # The searcher, evaluator and ordering combinations all find legal moves
+        board = chess.Board(MIDDLEGAME_FEN)
+        for searcher, evaluator, ordering in itertools.product(
+                REGISTRY.names('searcher'), REGISTRY.names('evaluator'),
+                REGISTRY.names('move_ordering')):
+            engine = self.make_engine({'searcher': searcher, 'evaluator': evaluator,
+                                       'move_ordering': ordering})
+            engine.set_position(MIDDLEGAME_FEN)
+            move = engine.search(depth_override=2)
+            self.assertIn(move, board.legal_moves, (searcher, evaluator, ordering))
+
+    def test_searchers_agree_on_score(self):
+        # PVS and full-window alpha-beta return the same score at fixed depth
+        scores = []
+        for searcher in ('pvs', 'alphabeta'):
+            engine = self.make_engine({'searcher': searcher})
+            engine.set_position(MIDDLEGAME_FEN)
+            engine.search(depth_override=3)
+            scores.append(engine.last_score)
+        self.assertEqual(scores[0], scores[1])
+
+    def test_sorted_ordering_puts_tt_move_first(self):
+        engine = self.make_engine({'move_ordering': 'sorted'})
+        engine.set_position(MIDDLEGAME_FEN)
+        engine.search(depth_override=2)
+        pos_key = engine.board.zobrist_key
+        tt_move = engine.tt.probe_move(pos_key)
+        moves = engine.move_ordering.moves(engine, pos_key, 2)
+        self.assertEqual(moves[0], tt_move)
+        self.assertEqual(len(moves), engine.board.board.legal_moves.count())
+
+    def test_uci_option_swaps_component(self):
+        engine = self.make_engine()
+        output = []
+        engine.uci._out = output.append
+        engine.uci.handle_command("uci")
+        self.assertIn("option name MoveOrdering type combo default staged var staged var sorted",
+                      output)
+        engine.uci.handle_command("setoption name MoveOrdering value sorted")
+        engine.uci.handle_command("setoption name Evaluator value squares")
+        self.assertIsInstance(engine.move_ordering, SortedOrdering)
+        self.assertEqual(engine.evaluator.backend, 'squares')
+        self.assertIs(engine.board.accumulator.evaluator, engine.evaluator)
+        engine.uci.handle_command("setoption name Searcher value quantum")
+        self.assertEqual(engine.components['searcher'], 'pvs')
+
+    def test_time_manager_swap_keeps_ponder(self):
+        engine = self.make_engine()
+        engine.time_manager.ponder = True
+        engine.set_component('time_manager', 'simple')
+        self.assertEqual(type(engine.time_manager).__name__, 'SimpleTimeManager')
+        self.assertTrue(engine.time_manager.ponder)
+
+    def test_v2_engines_share_the_core(self):
+        for engine_class, max_depth in ((EngineV22, 6), (EngineV21, 4)):
+            engine = self.make_engine(engine_class=engine_class)
+            self.assertIsInstance(engine, SlowMateEngine)
+            self.assertEqual(engine.components['searcher'], 'alphabeta')
+            self.assertEqual(engine.components['move_ordering'], 'sorted')
+            self.assertEqual(engine.max_depth, max_depth)
+        engine = self.make_engine({'searcher': 'pvs'}, engine_class=EngineV22)
+        self.assertEqual(engine.components['searcher'], 'pvs')
+
+
+if __name__ == '__main__':
+    unittest.main()
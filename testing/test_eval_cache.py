@@ -0,0 +1,92 @@
+"""
+Test Suite for SlowMate Evaluation Cache
+Validates LRU eviction, hit statistics and that cached evaluations match
+uncached ones across moves and game-length buckets
+"""
+
+import sys
+import os
+import io
+import contextlib
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from src.core.board import Board
+from src.core.enhanced_evaluate import EnhancedEvaluator
+from src.core.eval_cache import EvalCache, ENTRY_BYTES
+from src.engine import SlowMateEngine
+
+
+class TestEvalCache(unittest.TestCase):
+    def test_lru_eviction(self):
+        cache = EvalCache(1)
+        cache.capacity = 3
+        for key in (1, 2, 3):
+            cache.put(key, float(key))
+        self.assertEqual(cache.get(1), 1.0)  # 1 becomes most recently used
+        cache.put(4, 4.0)
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.get(3), 3.0)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_resize_and_disable(self):
+        cache = EvalCache(1)
+        self.assertEqual(cache.capacity, 1024 * 1024 // ENTRY_BYTES)
+        for key in range(100):
+            cache.put(key, 0.0)
+        cache.resize(0)
+        self.assertEqual(len(cache), 0)
+        cache.put(1, 1.0)
+        self.assertIsNone(cache.get(1))
+
+    def test_cached_scores_match_uncached(self):
+        """Knight shuffles return to the same position in different game-length buckets."""
+        evaluator = EnhancedEvaluator()
+        reference = EnhancedEvaluator()
+        reference.eval_cache.resize(0)
+        board = Board()
+        board.attach_accumulator(evaluator.create_accumulator())
+        shuffle = ["g1f3", "g8f6", "f3g1", "f6g8"]
+        for ply in range(40):
+            board.make_move(chess.Move.from_uci(shuffle[ply % 4]))
+            for _ in range(2):
+                self.assertEqual(evaluator.evaluate(board), reference.evaluate(board), ply)
+        # Same position at ply 4, 8, ... is cached once per game-length bucket
+        self.assertGreater(evaluator.eval_cache.hits, 40)
+        self.assertEqual(len(evaluator.eval_cache), 4 * 3)
+
+    def test_static_score_does_not_hide_terminal_result(self):
+        evaluator = EnhancedEvaluator()
+        for fen, expected in [("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1", 0),  # Stalemate
+                              ("7k/6Q1/6K1/8/8/8/8/8 b - - 0 1", 20000)]:  # Black is mated
+            board = Board()
+            board.set_fen(fen)
+            board.attach_accumulator(evaluator.create_accumulator())
+            static = evaluator.evaluate(board, terminal_checked=True)
+            self.assertNotEqual(static, expected, fen)
+            self.assertEqual(evaluator.evaluate(board), expected, fen)
+            self.assertEqual(evaluator.evaluate(board, terminal_checked=True), static, fen)
+
+    def test_cache_survives_across_searches(self):
+        engine = SlowMateEngine()
+        engine.uci.set_silent_mode(True)
+        engine.set_position("r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 6 8")
+        engine.search(depth_override=2)
+        first_misses = engine.evaluator.eval_cache.misses
+        engine.search(depth_override=2)
+        self.assertGreater(engine.evaluator.eval_cache.hits, 0)
+        self.assertLess(engine.evaluator.eval_cache.misses, first_misses)
+
+    def test_uci_option_resizes_cache(self):
+        engine = SlowMateEngine()
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine.uci._handle_setoption("setoption name EvalCache value 2".split())
+        self.assertEqual(engine.evaluator.eval_cache.size_mb, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
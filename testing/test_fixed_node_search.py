@@ -0,0 +1,50 @@
+"""
+Test Suite for SlowMate Fixed-Node Search
+Node-limited searches must be reproducible: same best move, node count and
+PV on every run, whatever was searched before
+"""
+
+import sys
+import os
+import io
+import contextlib
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from src.engine import SlowMateEngine
+from engine_test_utils import MIDDLEGAME_FEN
+
+OTHER_FEN = "r1bq1rk1/pp3ppp/2n1pn2/3p4/1bPP4/2N1PN2/PP3PPP/R2QKB1R w KQ - 0 8"
+
+
+class TestFixedNodeSearch(unittest.TestCase):
+    def run_search(self, engine: SlowMateEngine, fen: str, nodes: int):
+        engine.set_position(fen)
+        with contextlib.redirect_stdout(io.StringIO()):
+            move = engine.search(nodes=nodes)
+        return move, engine.nodes, list(engine.current_pv)
+
+    def test_repeated_runs_match(self):
+        engine = SlowMateEngine()
+        first = self.run_search(engine, MIDDLEGAME_FEN, 4000)
+        self.run_search(engine, OTHER_FEN, 3000)  # Leaves TT, history and killers behind
+        second = self.run_search(engine, MIDDLEGAME_FEN, 4000)
+        self.assertEqual(first, second)
+        self.assertEqual(first[1], 4000)
+
+    def test_fresh_engines_match(self):
+        first = self.run_search(SlowMateEngine(), OTHER_FEN, 3000)
+        second = self.run_search(SlowMateEngine(), OTHER_FEN, 3000)
+        self.assertEqual(first, second)
+
+    def test_book_move_is_deterministic(self):
+        engine = SlowMateEngine()
+        moves = {self.run_search(engine, chess.STARTING_FEN, 1000)[0] for _ in range(10)}
+        self.assertEqual(len(moves), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
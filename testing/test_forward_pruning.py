@@ -0,0 +1,72 @@
+"""
+Test Suite for SlowMate Forward Pruning
+Checks that each shallow-depth pruning technique counts its tries and
+cutoffs, can be switched off and retuned through UCI options, and keeps
+its settings when the searcher component is swapped
+"""
+
+import sys
+import os
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from src.search.pruning import ForwardPruning
+from src.uci.protocol_v2_2 import PRUNING_OPTIONS
+from engine_test_utils import EngineOutputTestCase, MIDDLEGAME_FEN
+
+
+class TestForwardPruning(EngineOutputTestCase):
+    def search(self, depth: int = 3):
+        self.engine.new_game()
+        self.engine.set_position(MIDDLEGAME_FEN)
+        move = self.engine.search(depth_override=depth)
+        self.assertIn(move, chess.Board(MIDDLEGAME_FEN).legal_moves)
+        return self.engine.nodes
+
+    def test_every_technique_prunes(self):
+        self.search()
+        for technique in self.engine.searcher.pruning.techniques.values():
+            self.assertGreater(technique.nodes, 0, technique.name)
+            self.assertGreater(technique.cutoffs, 0, technique.name)
+            self.assertLessEqual(technique.cutoffs, technique.nodes, technique.name)
+        stats = [line for line in self.output if line.startswith("info string pruning ")]
+        self.assertEqual(len(stats), 1)
+        self.assertIn("late_move ", stats[0])
+
+    def test_switching_off(self):
+        pruned_nodes = self.search()
+        for option_name in PRUNING_OPTIONS:
+            self.engine.uci.handle_command(f"setoption name {option_name} value false")
+        unpruned_nodes = self.search()
+        self.assertGreater(unpruned_nodes, pruned_nodes)
+        for technique in self.engine.searcher.pruning.techniques.values():
+            self.assertFalse(technique.enabled)
+            self.assertEqual((technique.nodes, technique.cutoffs), (0, 0))
+        self.assertIn("futility off", self.output[-1])
+
+    def test_margin_option(self):
+        self.engine.uci.handle_command("setoption name FutilityMargin value 90")
+        self.assertEqual(self.engine.searcher.pruning.futility.margin, 90)
+        self.engine.uci.handle_command("setoption name FutilityMargin value 5000")
+        self.assertEqual(self.engine.searcher.pruning.futility.margin, 1000)
+
+        self.engine.uci.handle_command("uci")
+        self.assertIn("option name LateMovePruning type check default True", self.output)
+        self.assertIn("option name RazoringMargin type spin default 300 min 0 max 1000",
+                      self.output)
+
+    def test_settings_survive_searcher_swap(self):
+        self.engine.uci.handle_command("setoption name Razoring value false")
+        self.engine.set_component('searcher', 'alphabeta')
+        self.assertFalse(self.engine.searcher.pruning.razoring.enabled)
+
+    def test_unknown_technique(self):
+        with self.assertRaises(ValueError):
+            ForwardPruning().technique('probcut')
+
+
+if __name__ == '__main__':
+    unittest.main()
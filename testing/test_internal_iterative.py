@@ -0,0 +1,84 @@
+"""
+Test Suite for SlowMate Internal Iterative Reductions/Deepening
+Checks what the searcher does at PV and cut nodes without a hash move,
+the InternalIterative UCI option and the first-move cutoff statistics
+"""
+
+import sys
+import os
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from src.bench import BENCH_FENS, run_bench
+from src.search.enhanced import CutoffStats
+from engine_test_utils import EngineOutputTestCase, MIDDLEGAME_FEN
+
+
+class TestCutoffStats(unittest.TestCase):
+    def test_first_move_rate(self):
+        stats = CutoffStats()
+        self.assertEqual(stats.stats_string(), "first-move cutoffs none")
+        self.assertEqual(stats.first_move_rate(3), 0.0)
+        for first in (True, True, True, False):
+            stats.record(3, first)
+        stats.record(1, True)
+        self.assertEqual(stats.first_move_rate(3), 0.75)
+        self.assertEqual(stats.stats_string(), "first-move cutoffs d1 100.0% of 1 d3 75.0% of 4")
+
+        other = CutoffStats()
+        other.record(3, False)
+        stats.merge(other)
+        self.assertEqual(stats.first_move_rate(3), 0.6)
+        stats.reset()
+        self.assertEqual(stats.cutoffs, {})
+
+
+class TestInternalIterative(EngineOutputTestCase):
+    def negamax_nodes(self, mode: str) -> int:
+        """Nodes of a depth-4 PV search from an empty hash table."""
+        self.engine.searcher.internal_iterative = mode
+        self.engine.new_game()
+        self.engine.set_position(MIDDLEGAME_FEN)
+        self.engine.nodes = 0
+        self.engine._negamax(4, -30000, 30000)
+        return self.engine.nodes
+
+    def test_modes_without_hash_move(self):
+        full = self.negamax_nodes('off')
+        self.assertLess(self.negamax_nodes('reduce'), full)
+        self.assertNotEqual(self.negamax_nodes('deepen'), full)
+        self.assertIsNotNone(self.engine.tt.probe_move(self.engine.board.zobrist_key))
+
+    def test_uci_option(self):
+        self.assertEqual(self.engine.searcher.internal_iterative, 'reduce')
+        self.engine.uci.handle_command("setoption name InternalIterative value deepen")
+        self.assertEqual(self.engine.searcher.internal_iterative, 'deepen')
+        self.engine.uci.handle_command("setoption name InternalIterative value sideways")
+        self.assertEqual(self.engine.searcher.internal_iterative, 'deepen')
+
+        self.engine.set_component('searcher', 'alphabeta')
+        self.assertEqual(self.engine.searcher.internal_iterative, 'deepen')
+
+        self.engine.uci.handle_command("uci")
+        self.assertIn("option name InternalIterative type combo default reduce "
+                      "var reduce var deepen var off", self.output)
+
+    def test_search_reports_cutoffs(self):
+        self.engine.set_position(MIDDLEGAME_FEN)
+        move = self.engine.search(depth_override=3)
+        self.assertIn(move, chess.Board(MIDDLEGAME_FEN).legal_moves)
+        stats = [line for line in self.output if line.startswith("info string first-move cutoffs ")]
+        self.assertEqual(len(stats), 1)
+        self.assertIn(" d1 ", stats[0])
+
+    def test_bench_totals(self):
+        self.engine.uci.set_silent_mode(True)
+        result = run_bench(self.engine, 3, BENCH_FENS[:2])
+        self.assertGreater(sum(result.cutoffs.cutoffs.values()), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Test Suite for SlowMate Lazy SMP Search
+Validates the shared-memory transposition table and helper process search
+"""
+
+import sys
+import os
+import pickle
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from src.engine import SlowMateEngine
+from src.search.enhanced import NodeType, TranspositionTable
+from src.search.smp import SharedTranspositionTable
+
+
+class TestSharedTranspositionTable(unittest.TestCase):
+    def test_attached_table_sees_entries(self):
+        owner = SharedTranspositionTable(size_mb=1)
+        helper = SharedTranspositionTable(size_mb=1, name=owner.name)
+        try:
+            self.assertEqual(owner.memory_bytes(), 1024 * 1024)
+            move = chess.Move.from_uci("d2d4")
+            owner.store(424242, 6, 35, NodeType.EXACT, move)
+            self.assertEqual(helper.lookup(424242, 6, -30000, 30000), (35, move))
+
+            owner.clear()
+            self.assertIsNone(helper.probe(424242))
+        finally:
+            helper.close()
+            owner.close()
+
+    def test_torn_entry_is_rejected(self):
+        tt = SharedTranspositionTable(size_mb=1)
+        try:
+            tt.store(777, 3, 10, NodeType.EXACT, None)
+            index = (777 % tt.num_clusters) * tt.CLUSTER_SIZE
+            tt.data[index] ^= 1 << 20  # Simulate a half-written slot
+            self.assertIsNone(tt.probe(777))
+        finally:
+            tt.close()
+
+    def test_engine_uses_given_table(self):
+        owner = SharedTranspositionTable(size_mb=1)
+        helper_table = SharedTranspositionTable(size_mb=1, name=owner.name)
+        try:
+            engine = SlowMateEngine({'tt': 'shared'}, tt=helper_table)
+            self.assertIs(engine.tt, helper_table)
+            self.assertEqual(engine.tt_name(), 'shared')
+        finally:
+            helper_table.close()
+            owner.close()
+
+
+class TestLazySMPSearch(unittest.TestCase):
+    def setUp(self):
+        self.engine = SlowMateEngine()
+        self.engine.uci.set_silent_mode(True)
+
+    def tearDown(self):
+        self.engine.set_threads(1)
+
+    def test_threads_search_returns_legal_move(self):
+        self.engine.set_threads(2)
+        self.assertIsInstance(self.engine.tt, SharedTranspositionTable)
+
+        self.engine.board.set_fen("6k1/5ppp/8/8/8/8/5PPP/3R2K1 w - - 0 1")
+        best_move = self.engine.search(time_limit_ms=3000, depth_override=3)
+        self.assertEqual(best_move, chess.Move.from_uci("d1d8"))
+        self.assertGreater(self.engine.smp_pool.helper_nodes(), 0)
+
+    def test_helpers_get_search_settings(self):
+        self.engine.uci.handle_command("setoption name Futility value false")
+        self.engine.uci.handle_command("setoption name RazoringMargin value 250")
+        self.engine.uci.handle_command("setoption name InternalIterative value deepen")
+        helper = SlowMateEngine()
+        helper.apply_search_settings(pickle.loads(pickle.dumps(self.engine.search_settings())))
+        self.assertFalse(helper.searcher.pruning.futility.enabled)
+        self.assertEqual(helper.searcher.pruning.razoring.margin, 250)
+        self.assertEqual(helper.lmr.table, self.engine.lmr.table)
+        self.assertEqual(helper.searcher.internal_iterative, 'deepen')
+
+    def test_back_to_single_thread(self):
+        self.engine.set_threads(2)
+        self.engine.resize_hash(2)
+        self.assertEqual(self.engine.tt.memory_bytes(), 2 * 1024 * 1024)
+        self.engine.set_threads(1)
+        self.assertIsNone(self.engine.smp_pool)
+        self.assertIs(type(self.engine.tt), TranspositionTable)
+        self.assertEqual(self.engine.tt.memory_bytes(), 2 * 1024 * 1024)
+
+
+if __name__ == '__main__':
+    unittest.main()
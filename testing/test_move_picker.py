@@ -0,0 +1,108 @@
+"""
+Test Suite for SlowMate Staged Move Picker
+Checks that the picker yields every legal move exactly once, in stage
+order, and only generates later stages when they are reached
+"""
+
+import sys
+import os
+import glob
+import random
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+import chess.pgn
+from src.search.picker import MovePicker
+from src.search.see import see_ge
+
+
+GAMES_DIR = os.path.join(os.path.dirname(__file__), '..', 'games')
+
+
+def iter_positions(limit: int, stride: int = 11):
+    """Positions from the PGNs in games/, every stride plies."""
+    count = 0
+    for pgn_path in sorted(glob.glob(os.path.join(GAMES_DIR, '*.pgn'))):
+        with open(pgn_path, encoding='latin-1') as pgn_file:
+            while count < limit:
+                game = chess.pgn.read_game(pgn_file)
+                if game is None:
+                    break
+                board = game.board()
+                for ply, move in enumerate(game.mainline_moves()):
+                    board.push(move)
+                    if ply % stride == 0:
+                        count += 1
+                        yield board.copy()
+
+
+class TestMovePicker(unittest.TestCase):
+    def assertStagedOrder(self, board: chess.Board, picker: MovePicker, moves):
+        start = 1 if picker.tt_move in moves[:1] else 0
+        stages = []
+        for move in moves[start:]:
+            if not picker._is_tactical(move):
+                stages.append(1)
+            else:
+                stages.append(0 if see_ge(board, move) else 2)
+        # Good captures, then killers and quiets, then losing captures
+        self.assertEqual(stages, sorted(stages), board.fen())
+
+    def test_yields_each_legal_move_once(self):
+        rng = random.Random(7)
+        for board in iter_positions(1500):
+            legal = list(board.legal_moves)
+            if not legal:
+                continue
+            # Hash/killer moves may be stale or illegal in this position
+            tt_move = rng.choice(legal + [chess.Move(chess.A1, chess.H8)])
+            killers = rng.sample(legal, min(2, len(legal))) + [chess.Move(chess.E2, chess.E4)]
+            history = {(m.from_square, m.to_square): rng.randrange(100) for m in legal}
+            picker = MovePicker(board, tt_move, killers, rng.choice(legal), history)
+            moves = list(picker)
+            self.assertEqual(len(moves), len(set(moves)), board.fen())
+            self.assertEqual(set(moves), set(legal), board.fen())
+            if tt_move in legal:
+                self.assertEqual(moves[0], tt_move)
+            self.assertStagedOrder(board, picker, moves)
+
+    def test_capture_and_quiet_ordering(self):
+        board = chess.Board("4k3/8/8/3q4/4P3/8/1r6/R3K2R w KQ - 0 1")
+        history = {(chess.H1, chess.H7): 500}
+        picker = MovePicker(board, history=history)
+        moves = list(picker)
+        # The only capture (pawn takes queen) comes first; quiets follow history
+        self.assertEqual(moves[0], chess.Move.from_uci("e4d5"))
+        quiets = [m for m in moves if not picker._is_tactical(m)]
+        self.assertEqual(quiets[0], chess.Move.from_uci("h1h7"))
+
+    def test_losing_captures_last(self):
+        board = chess.Board("4k3/8/2p5/3p4/8/8/8/3QK3 w - - 0 1")
+        moves = list(MovePicker(board))
+        self.assertEqual(moves[-1], chess.Move.from_uci("d1d5"))
+
+    def test_stages_are_lazy(self):
+        board = chess.Board()
+        tt_move = chess.Move.from_uci("e2e4")
+        picker = MovePicker(board, tt_move)
+        iterator = iter(picker)
+        self.assertEqual(next(iterator), tt_move)
+        self.assertEqual(picker.stage, MovePicker.STAGE_TT)
+        next(iterator)  # No captures in the start position: straight to quiets
+        self.assertEqual(picker.stage, MovePicker.STAGE_QUIETS)
+
+    def test_killer_and_counter_before_quiets(self):
+        board = chess.Board()
+        killer = chess.Move.from_uci("g1f3")
+        counter = chess.Move.from_uci("d2d4")
+        picker = MovePicker(board, None, [killer], counter, {})
+        moves = list(picker)
+        self.assertEqual(moves[:2], [killer, counter])
+        self.assertEqual(len(moves), 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Test Suite for SlowMate MultiPV
+Checks that MultiPV searches distinct root moves with their own scores and
+PVs, reports one info line per PV, and leaves single-PV search unchanged
+"""
+
+import sys
+import os
+import time
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from src.engine import SlowMateEngine
+from engine_test_utils import EngineOutputTestCase, MIDDLEGAME_FEN
+
+
+class TestMultiPV(EngineOutputTestCase):
+    def test_lines_are_distinct_root_moves(self):
+        self.engine.set_multi_pv(3)
+        self.engine.set_position(MIDDLEGAME_FEN)
+        move = self.engine.search(depth_override=3)
+        lines = self.engine.multipv_lines
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(len({pv[0] for _, pv in lines}), 3)
+        self.assertEqual(move, lines[0][1][0])
+        self.assertEqual(self.engine.current_pv, lines[0][1])
+        board = chess.Board(MIDDLEGAME_FEN)
+        for _, pv in lines:
+            self.assertIn(pv[0], board.legal_moves)
+
+    def test_line_scores_match_single_searches(self):
+        # The second line scores the best move once the first one is excluded
+        self.engine.set_multi_pv(2)
+        self.engine.set_position(MIDDLEGAME_FEN)
+        self.engine.search(depth_override=2)
+        (_, first_pv), (second_score, second_pv) = self.engine.multipv_lines
+        board = chess.Board(MIDDLEGAME_FEN)
+        moves = [move for move in board.legal_moves if move != first_pv[0]]
+
+        single = SlowMateEngine()
+        single.uci._out = lambda message: None
+        single.set_position(MIDDLEGAME_FEN)
+        single.limits.start(depth=2)
+        move, score, _ = single._search_depth_with_pv(2, -30000, 30000, moves)
+        self.assertEqual(score, second_score)
+
+    def test_info_lines_per_pv(self):
+        uci = self.engine.uci
+        uci.handle_command("setoption name MultiPV value 2")
+        uci.handle_command(f"position fen {MIDDLEGAME_FEN}")
+        uci.handle_command("go depth 2")
+        deadline = time.time() + 10
+        while not any(line.startswith("bestmove") for line in self.output) and time.time() < deadline:
+            time.sleep(0.01)
+        depth_two = [line for line in self.output if line.startswith("info depth 2 ")]
+        self.assertEqual([line.split()[4] for line in depth_two], ["1", "2"])
+        self.assertEqual(self.engine.multi_pv, 2)
+
+    def test_opening_book_skipped(self):
+        self.engine.set_multi_pv(2)
+        self.engine.set_position("startpos")
+        self.engine.search(depth_override=1)
+        self.assertEqual(self.engine.completed_depth, 1)
+        self.assertEqual(len(self.engine.multipv_lines), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Test Suite for SlowMate Pawn Hash Table
+Validates the incremental pawn key and checks cached pawn-structure data
+against the square-scanning evaluator methods on positions from games/
+"""
+
+import sys
+import os
+import glob
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+import chess.pgn
+from src.core.board import Board
+from src.core.enhanced_evaluate import EnhancedEvaluator
+from src.core.pawn_hash import PawnHashTable, compute_pawn_entry
+from src.core.zobrist import compute_pawn_key
+
+
+GAMES_DIR = os.path.join(os.path.dirname(__file__), '..', 'games')
+POSITION_STRIDE = 7  # Pawn entries are compared on every Nth ply
+
+
+def iter_games():
+    for pgn_path in sorted(glob.glob(os.path.join(GAMES_DIR, '*.pgn'))):
+        with open(pgn_path, encoding='latin-1') as pgn_file:
+            while True:
+                game = chess.pgn.read_game(pgn_file)
+                if game is None:
+                    break
+                yield game
+
+
+class TestPawnHash(unittest.TestCase):
+    def setUp(self):
+        self.evaluator = EnhancedEvaluator()
+
+    def assertEntryMatchesScan(self, b: chess.Board):
+        entry = compute_pawn_entry(b, compute_pawn_key(b))
+        fen = b.fen()
+        self.assertEqual(entry.score, self.evaluator._evaluate_pawn_structure(b), fen)
+        for color in chess.COLORS:
+            for file in range(8):
+                self.assertEqual(entry.rook_file_score(file, color),
+                                 self.evaluator._evaluate_file_for_rook(b, file, color), fen)
+            for pawn in b.pieces(chess.PAWN, color):
+                self.assertEqual(bool(entry.passed & chess.BB_SQUARES[pawn]),
+                                 self.evaluator._is_passed_pawn(b, pawn, color), fen)
+            king_square = b.king(color)
+            self.assertEqual(entry.shield(color, king_square),
+                             self.evaluator._evaluate_pawn_shield(b, king_square, color), fen)
+        self.assertEqual(self.evaluator._evaluate_king_safety_bitboard(b, entry),
+                         self.evaluator._evaluate_king_safety(b), fen)
+        self.assertEqual(self.evaluator._evaluate_piece_activity_bitboard(b, entry),
+                         self.evaluator._evaluate_piece_activity(b), fen)
+
+    def test_pawn_key_and_entries_over_games(self):
+        """Incremental pawn key stays exact; entries match the square scans."""
+        compared = 0
+        for game in iter_games():
+            board = Board()
+            board.set_fen(game.board().fen())
+            for ply, move in enumerate(game.mainline_moves()):
+                board.make_move(move)
+                self.assertEqual(board.pawn_key, compute_pawn_key(board.board), board.get_fen())
+                if ply % POSITION_STRIDE == 0:
+                    self.assertEntryMatchesScan(board.board)
+                    compared += 1
+            while board.board.move_stack:
+                board.unmake_move()
+            self.assertEqual(board.pawn_key, compute_pawn_key(board.board))
+        self.assertGreater(compared, 1000)
+
+    def test_shields_for_every_king_square(self):
+        """Shield masks handle board edges the same way as the square loop."""
+        b = chess.Board("8/pppppppp/8/8/8/8/PPPPPPPP/8 w - - 0 1")
+        entry = compute_pawn_entry(b, compute_pawn_key(b))
+        for color in chess.COLORS:
+            for square in chess.SQUARES:
+                self.assertEqual(entry.shield(color, square),
+                                 self.evaluator._evaluate_pawn_shield(b, square, color))
+
+    def test_pawn_key_ignores_pieces(self):
+        """Moves that do not touch pawns keep the pawn key."""
+        board = Board()
+        key = board.pawn_key
+        board.make_move(chess.Move.from_uci("g1f3"))
+        self.assertEqual(board.pawn_key, key)
+        board.make_move(chess.Move.from_uci("e7e5"))
+        self.assertNotEqual(board.pawn_key, key)
+        board.unmake_move()
+        self.assertEqual(board.pawn_key, key)
+
+    def test_table_hits_and_bounded_size(self):
+        table = PawnHashTable(1000)
+        self.assertEqual(table.size, 512)
+        b = chess.Board()
+        key = compute_pawn_key(b)
+        first = table.probe(b, key)
+        second = table.probe(b, key)
+        self.assertIs(first, second)
+        self.assertEqual((table.hits, table.misses), (1, 1))
+        self.assertIn("pawn hash hits 1 misses 1", table.stats_string())
+        table.clear()
+        self.assertEqual((table.hits, table.misses), (0, 0))
+        self.assertTrue(all(slot is None for slot in table.slots))
+
+    def test_evaluate_uses_pawn_hash(self):
+        board = Board()
+        board.attach_accumulator(self.evaluator.create_accumulator())
+        self.evaluator.evaluate(board)
+        board.make_move(chess.Move.from_uci("g1f3"))  # Same pawn structure
+        self.evaluator.evaluate(board)
+        self.assertEqual(self.evaluator.pawn_hash.misses, 1)
+        self.assertEqual(self.evaluator.pawn_hash.hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Test Suite for SlowMate Pondering
+Checks the ponder move in bestmove, that a ponder search ignores the clock
+until ponderhit, and that bestmove waits for ponderhit or stop
+"""
+
+import sys
+import os
+import time
+import threading
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from engine_test_utils import EngineOutputTestCase, MIDDLEGAME_FEN
+
+
+class TestPondering(EngineOutputTestCase):
+    def wait_for_bestmove(self, timeout: float = 5.0) -> str:
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            for line in self.output:
+                if line.startswith("bestmove"):
+                    return line
+            time.sleep(0.01)
+        self.fail("no bestmove")
+
+    def test_ponder_move_from_pv(self):
+        self.engine.set_position(MIDDLEGAME_FEN)
+        move = self.engine.search(depth_override=3)
+        ponder_move = self.engine.get_ponder_move(move)
+        self.assertEqual(ponder_move, self.engine.current_pv[1])
+        board = chess.Board(MIDDLEGAME_FEN)
+        board.push(move)
+        self.assertIn(ponder_move, board.legal_moves)
+
+    def test_ponder_search_waits_for_ponderhit(self):
+        self.engine.set_position(MIDDLEGAME_FEN)
+        thread = threading.Thread(target=self.engine.search,
+                                  kwargs={'wtime': 1000, 'btime': 1000, 'ponder': True})
+        thread.start()
+        time.sleep(0.8)
+        self.assertTrue(thread.is_alive())  # Would be past its hard limit on the clock
+        hit = time.time()
+        self.engine.ponderhit()
+        thread.join(5.0)
+        self.assertFalse(thread.is_alive())
+        self.assertLessEqual(time.time() - hit, self.engine.time_manager.hard_limit + 0.05)
+        self.assertGreater(self.engine.completed_depth, 0)
+
+    def test_bestmove_held_until_ponderhit(self):
+        uci = self.engine.uci
+        uci.handle_command(f"position fen {MIDDLEGAME_FEN}")
+        uci.handle_command("go ponder depth 2")
+        time.sleep(0.3)  # The depth 2 search is long finished
+        self.assertFalse(any(line.startswith("bestmove") for line in self.output))
+        uci.handle_command("ponderhit")
+        self.assertRegex(self.wait_for_bestmove(), r"^bestmove \w+ ponder \w+$")
+
+    def test_ponderhit_before_search_thread_starts(self):
+        uci = self.engine.uci
+        search_thread = uci._search_thread
+
+        def delayed_search_thread(search_params):
+            time.sleep(0.05)  # ponderhit is handled first
+            search_thread(search_params)
+        uci._search_thread = delayed_search_thread
+
+        uci.handle_command(f"position fen {MIDDLEGAME_FEN}")
+        uci.handle_command("go ponder wtime 1000 btime 1000")
+        uci.handle_command("ponderhit")
+        self.assertTrue(self.wait_for_bestmove(3.0).startswith("bestmove"))
+        self.assertFalse(self.engine.pondering)
+        self.assertFalse(self.engine.ponderhit_pending)
+
+    def test_stop_during_ponder(self):
+        uci = self.engine.uci
+        uci.handle_command(f"position fen {MIDDLEGAME_FEN}")
+        uci.handle_command("go ponder wtime 1000 btime 1000")
+        time.sleep(0.3)
+        uci.handle_command("stop")
+        self.assertTrue(self.wait_for_bestmove().startswith("bestmove"))
+        self.assertGreater(self.engine.tt.entries_used(), 0)  # Kept for the next search
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Test Suite for SlowMate Position Updates
+A new position that extends the last one must be reached by making only the
+new moves, giving the same board as a full replay, and search state must
+carry over between the moves of a game
+"""
+
+import sys
+import os
+import io
+import contextlib
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from src.engine import SlowMateEngine
+
+
+GAME_MOVES = ["e2e4", "e7e5", "g1f3", "b8c6", "f1b5", "a7a6", "b5a4", "g8f6", "e1g1", "f8e7"]
+
+
+class TestPositionUpdates(unittest.TestCase):
+    def setUp(self):
+        self.engine = SlowMateEngine()
+        self.engine.uci._out = lambda message: None
+
+    def position(self, count: int):
+        self.engine.uci.handle_command("position startpos moves " + " ".join(GAME_MOVES[:count]))
+
+    def assert_matches_replay(self, count: int):
+        replay = chess.Board()
+        for uci in GAME_MOVES[:count]:
+            replay.push_uci(uci)
+        board = self.engine.board
+        self.assertEqual(board.board.fen(), replay.fen())
+        self.assertEqual(board.board.move_stack, replay.move_stack)
+
+    def test_extension_keeps_board(self):
+        self.position(4)
+        board = self.engine.board.board
+        self.position(6)
+        self.assertIs(self.engine.board.board, board)
+        self.assert_matches_replay(6)
+
+    def test_takeback_and_new_root(self):
+        self.position(8)
+        self.position(5)
+        self.assert_matches_replay(5)
+        self.engine.uci.handle_command("position startpos moves e2e4 c7c5")
+        self.assertEqual(self.engine.board.board.move_stack,
+                         [chess.Move.from_uci("e2e4"), chess.Move.from_uci("c7c5")])
+        self.engine.set_position(chess.Board().fen())  # A new root replaces the game
+        self.assertEqual(self.engine.board.board.move_stack, [])
+
+    def test_root_set_directly_on_board(self):
+        self.engine.board.set_fen("8/8/8/8/8/7q/6PP/7K w - - 0 1")
+        self.engine.set_position("startpos")
+        self.assertEqual(self.engine.board.board.fen(), chess.STARTING_FEN)
+        self.assertEqual(self.engine.board.root_fen, chess.STARTING_FEN)
+
+    def test_illegal_move_raises(self):
+        with self.assertRaises(ValueError):
+            self.engine.set_position("startpos", [chess.Move.from_uci("e2e4"), chess.Move.from_uci("e2e4")])
+
+    def test_history_decays_between_searches(self):
+        self.position(10)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.engine.search(depth_override=3)
+        history = dict(self.engine.history_table)
+        self.assertTrue(history)
+        self.engine._age_search_state()
+        for key, score in self.engine.history_table.items():
+            self.assertEqual(score, history[key] >> 1)
+        self.assertGreater(self.engine.tt.entries_used(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
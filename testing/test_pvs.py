@@ -0,0 +1,63 @@
+"""
+Test Suite for SlowMate Principal Variation Search
+Checks the triangular PV table, transposition table bounds and mate scores
+of the unified PVS negamax
+"""
+
+import sys
+import os
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from src.engine import SlowMateEngine
+from src.search.enhanced import NodeType
+from engine_test_utils import MIDDLEGAME_FEN
+
+
+class TestPVS(unittest.TestCase):
+    def setUp(self):
+        self.engine = SlowMateEngine()
+        self.engine.uci.stop_requested = False
+
+    def search_to(self, fen: str, depth: int):
+        self.engine.set_position(fen)
+        moves = self.engine.move_generator.get_legal_moves()
+        for current_depth in range(1, depth + 1):
+            result = self.engine._search_depth_with_pv(current_depth, -30000, 30000, moves)
+        return result
+
+    def test_pv_is_legal_line(self):
+        best_move, _, pv = self.search_to(MIDDLEGAME_FEN, 3)
+        self.assertEqual(pv[0], best_move)
+        self.assertGreaterEqual(len(pv), 3)
+        board = chess.Board(MIDDLEGAME_FEN)
+        for move in pv:
+            self.assertIn(move, board.legal_moves)
+            board.push(move)
+
+    def test_root_entry_is_exact(self):
+        """Bounds are classified against the original alpha, not the raised one."""
+        best_move, score, _ = self.search_to(MIDDLEGAME_FEN, 3)
+        entry = self.engine.tt.probe(self.engine.board.zobrist_key)
+        self.assertEqual(entry.node_type, NodeType.EXACT)
+        self.assertEqual(entry.score, score)
+        self.assertEqual(entry.move, best_move)
+
+    def test_mate_in_one_score(self):
+        best_move, score, pv = self.search_to("6k1/5ppp/8/8/8/8/5PPP/3R2K1 w - - 0 1", 2)
+        self.assertEqual(best_move, chess.Move.from_uci("d1d8"))
+        self.assertEqual(score, 30000 - 1)
+        self.assertEqual(pv, [best_move])
+
+    def test_negamax_returns_int(self):
+        self.engine.set_position(MIDDLEGAME_FEN)
+        score = self.engine._negamax(2, -30000, 30000)
+        self.assertIsInstance(score, int)
+        self.assertGreater(self.engine.pv_length[1], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
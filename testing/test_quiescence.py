@@ -0,0 +1,84 @@
+"""
+Test Suite for SlowMate Quiescence Search
+Checks capture-only move generation, quiet checks at the first quiescence
+ply only, evasions in check and transposition table use at depth 0
+"""
+
+import sys
+import os
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from src.engine import SlowMateEngine
+from src.search.enhanced import NodeType
+from src.search.picker import quiescence_moves
+from engine_test_utils import MIDDLEGAME_FEN
+
+BACK_RANK_FEN = "6k1/5ppp/8/8/8/8/5PPP/3R2K1 w - - 0 1"  # Rd8# is a quiet check
+PROMOTION_FEN = "8/P5k1/8/8/8/8/6K1/8 w - - 0 1"
+
+
+class TestQuiescence(unittest.TestCase):
+    def setUp(self):
+        self.engine = SlowMateEngine()
+        self.engine.uci.set_silent_mode(True)
+        self.engine.limits.start(depth=1)
+
+    def test_moves_are_captures_and_queen_promotions(self):
+        board = chess.Board(MIDDLEGAME_FEN)
+        moves = [move for _, move in quiescence_moves(board)]
+        self.assertEqual(set(moves), set(board.generate_legal_captures()))
+        values = [value for value, _ in quiescence_moves(board)]
+        self.assertEqual(values, sorted(values, reverse=True))
+
+        promotions = [move for _, move in quiescence_moves(chess.Board(PROMOTION_FEN))]
+        self.assertEqual(promotions, [chess.Move.from_uci("a7a8q")])
+
+    def test_quiet_checks_on_request(self):
+        board = chess.Board(BACK_RANK_FEN)
+        self.assertEqual(quiescence_moves(board), [])
+        checks = [move for _, move in quiescence_moves(board, checks=True)]
+        self.assertEqual(checks, [chess.Move.from_uci("d1d8")])
+
+    def test_hash_move_first(self):
+        board = chess.Board(MIDDLEGAME_FEN)
+        last = quiescence_moves(board)[-1][1]
+        self.assertEqual(quiescence_moves(board, last)[0][1], last)
+
+    def test_mate_by_quiet_check_at_first_ply(self):
+        self.engine.set_position(BACK_RANK_FEN)
+        depth = self.engine.quiescence_max_depth
+        self.assertGreater(self.engine._quiescence_search(-30000, 30000, depth), 20000)
+        # Deeper quiescence plies only look at captures
+        self.engine.tt.clear()
+        self.assertLess(self.engine._quiescence_search(-30000, 30000, depth - 1), 20000)
+
+    def test_evasions_in_check(self):
+        # Mated: every evasion is generated, and there are none
+        self.engine.set_position("rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3")
+        self.assertEqual(self.engine._quiescence_search(-30000, 30000, 0), -30000 + 1)
+        # In check with a quiet escape: searched even at depth 0, no stand pat
+        self.engine.set_position("4k3/8/4K3/8/8/8/8/4R3 b - - 0 1")
+        self.assertLess(self.engine._quiescence_search(-30000, 30000, 0), 20000)
+        self.assertGreater(self.engine.qnodes, 1)
+
+    def test_results_stored_at_depth_zero(self):
+        self.engine.set_position(MIDDLEGAME_FEN)
+        score = self.engine._quiescence_search(-30000, 30000, self.engine.quiescence_max_depth)
+        entry = self.engine.tt.probe(self.engine.board.zobrist_key)
+        self.assertIsNotNone(entry)
+        self.assertEqual(entry.depth, 0)
+        self.assertEqual(entry.node_type, NodeType.EXACT)
+        self.assertEqual(entry.score, score)
+
+        # The stored entry answers the next probe without searching
+        nodes = self.engine.nodes
+        self.assertEqual(self.engine._quiescence_search(-30000, 30000, 4), score)
+        self.assertEqual(self.engine.nodes, nodes + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
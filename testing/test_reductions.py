@@ -0,0 +1,70 @@
+"""
+Test Suite for SlowMate Late Move Reductions
+Checks the logarithmic reduction table and its history, PV and improving
+adjustments, and that reduced searches still find the right moves
+"""
+
+import sys
+import os
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from src.bench import BENCH_FENS, run_bench
+from src.engine import SlowMateEngine
+from src.search.reductions import LateMoveReductions
+
+
+class TestLateMoveReductions(unittest.TestCase):
+    def setUp(self):
+        self.lmr = LateMoveReductions()
+
+    def test_table_grows_with_depth_and_move_number(self):
+        table = self.lmr.table
+        for depth in range(1, 20):
+            for move_number in range(1, 40):
+                self.assertLessEqual(table[depth][move_number], table[depth + 1][move_number])
+                self.assertLessEqual(table[depth][move_number], table[depth][move_number + 1])
+        self.assertEqual(table[10][1], 0)  # ln(1) = 0: the first move is never reduced
+        self.assertGreater(table[12][30], table[3][3])
+
+    def test_adjustments(self):
+        base = self.lmr.reduction(10, 20, False, True, 0)
+        self.assertEqual(self.lmr.reduction(10, 20, True, True, 0), base - 1)
+        self.assertEqual(self.lmr.reduction(10, 20, False, False, 0), base + 1)
+        self.assertEqual(self.lmr.reduction(10, 20, False, True, self.lmr.history_scale), base - 1)
+        self.assertEqual(self.lmr.reduction(10, 20, False, True, 100 * self.lmr.history_scale),
+                         base - 2)
+
+    def test_limits(self):
+        self.assertEqual(self.lmr.reduction(2, 40, False, False, 0), 0)
+        for depth in range(3, 40):
+            for move_number in (2, 10, 63, 200):
+                reduction = self.lmr.reduction(depth, move_number, False, False, 0)
+                self.assertGreaterEqual(reduction, 0)
+                self.assertLessEqual(reduction, depth - 2)
+
+    def test_searchers_find_the_winning_capture(self):
+        # White wins the queen with Nxd5; both searcher variants must see it
+        fen = "r1b1kbnr/pppp1ppp/2n5/3qp3/8/2N5/PPPPPPPP/R1BQKBNR w KQkq - 0 1"
+        for searcher in ('pvs', 'alphabeta'):
+            engine = SlowMateEngine({'searcher': searcher})
+            engine.uci.set_silent_mode(True)
+            engine.use_book = False
+            engine.set_position(fen)
+            self.assertEqual(engine.search(depth_override=4), chess.Move.from_uci("c3d5"), searcher)
+
+    def test_bench_reports_branching_factor(self):
+        engine = SlowMateEngine()
+        engine.uci.set_silent_mode(True)
+        result = run_bench(engine, 3, BENCH_FENS[:3])
+        expected = 1.0
+        for position in result.positions:
+            expected *= position.nodes ** (1 / 3)
+        self.assertAlmostEqual(result.branching_factor, expected ** (1 / 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Test Suite for SlowMate Search Limits
+Checks the amortized stop polling: exact node budgets, hard deadlines,
+depth limits and the latency of an external stop request
+"""
+
+import sys
+import os
+import io
+import time
+import threading
+import contextlib
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.engine import SlowMateEngine
+from src.search.limits import SearchLimits
+from engine_test_utils import MIDDLEGAME_FEN
+
+
+class TestSearchLimits(unittest.TestCase):
+    def setUp(self):
+        self.engine = SlowMateEngine()
+        self.engine.set_position(MIDDLEGAME_FEN)
+
+    def search(self, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.engine.search(**kwargs)
+
+    def test_poll_schedule_respects_node_budget(self):
+        limits = SearchLimits()
+        limits.start(nodes=40)
+        self.assertEqual(limits.next_check, SearchLimits.INITIAL_INTERVAL)
+        self.assertFalse(limits.poll(limits.next_check))
+        self.assertLessEqual(limits.next_check, 40)
+        self.assertTrue(limits.poll(40))
+        self.assertTrue(limits.stopped)
+        self.assertEqual(limits.next_check, 0)  # Stays stopped at every later node
+
+    def test_external_stop_signal(self):
+        flag = [False]
+        limits = SearchLimits(lambda: flag[0])
+        limits.start()
+        self.assertFalse(limits.poll(limits.next_check))
+        flag[0] = True
+        self.assertTrue(limits.poll(limits.next_check))
+
+    def test_node_limit_is_exact(self):
+        move = self.search(nodes=2500)
+        self.assertIsNotNone(move)
+        self.assertEqual(self.engine.nodes, 2500)
+        self.assertLess(self.engine.limits.polls, 2500 // 2)
+
+    def test_hard_deadline(self):
+        start = time.time()
+        move = self.search(time_limit_ms=300)
+        elapsed = time.time() - start
+        self.assertIsNotNone(move)
+        self.assertLess(elapsed, 0.35)
+
+    def test_depth_limit_without_deadline(self):
+        self.search(depth_override=2)
+        self.assertIsNone(self.engine.limits.hard_deadline)
+        self.assertEqual(self.engine.limits.depth, 2)
+        self.assertFalse(self.engine.limits.stopped)
+
+    def test_stop_latency(self):
+        result = {}
+
+        def run():
+            result['move'] = self.search(infinite=True)
+            result['finished'] = time.perf_counter()
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        time.sleep(0.5)
+        requested = time.perf_counter()
+        self.engine.uci.stop_requested = True
+        thread.join(5.0)
+        self.assertFalse(thread.is_alive())
+        self.assertIsNotNone(result['move'])
+        self.assertLess(result['finished'] - requested, 0.005)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Test Suite for SlowMate Static Exchange Evaluation
+Checks swap-list SEE results on hand-made exchanges, x-rays and special moves
+"""
+
+import sys
+import os
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from src.search.see import see, see_ge
+
+
+class TestSEE(unittest.TestCase):
+    def assertSEE(self, fen: str, uci: str, expected: int):
+        board = chess.Board(fen)
+        move = chess.Move.from_uci(uci)
+        self.assertTrue(board.is_legal(move), uci)
+        self.assertEqual(see(board, move), expected, f"{uci} in {fen}")
+        self.assertEqual(see_ge(board, move, 0), expected >= 0)
+
+    def test_undefended_capture(self):
+        self.assertSEE("4k3/8/8/3p4/8/8/8/3RK3 w - - 0 1", "d1d5", 100)
+
+    def test_queen_takes_defended_pawn(self):
+        self.assertSEE("4k3/8/2p5/3p4/8/8/8/3QK3 w - - 0 1", "d1d5", 100 - 900)
+
+    def test_equal_trade(self):
+        self.assertSEE("4k3/8/5n2/3n4/8/4N3/8/4K3 w - - 0 1", "e3d5", 0)
+
+    def test_xray_rook_behind_rook(self):
+        # Doubled rooks win the defended rook; the rear rook joins once the front one captures
+        self.assertSEE("3rk3/8/8/3r4/8/8/3R4/3RK3 w - - 0 1", "d2d5", 500)
+        # Without the x-ray supporter the same capture only trades
+        self.assertSEE("3rk3/8/8/3r4/8/8/3R4/4K3 w - - 0 1", "d2d5", 0)
+
+    def test_xray_bishop_behind_queen(self):
+        # Bishop takes a pawn-defended knight; the queen behind it wins the pawn back
+        self.assertSEE("4k3/8/4p3/3n4/8/1B6/Q7/4K3 w - - 0 1", "b3d5", 320 + 100 - 330)
+        self.assertSEE("4k3/8/4p3/3n4/8/1B6/8/4K3 w - - 0 1", "b3d5", 320 - 330)
+
+    def test_defender_stops_when_recapture_loses(self):
+        # Pawn takes knight; the queen would lose itself by recapturing into the rook
+        self.assertSEE("3qk3/8/8/4n3/3P4/8/8/4RK2 w - - 0 1", "d4e5", 320)
+
+    def test_king_cannot_recapture_defended_square(self):
+        self.assertSEE("8/8/8/3k4/3p4/8/3R4/3RK3 w - - 0 1", "d2d4", 100)
+        self.assertSEE("8/8/8/3k4/3p4/8/3R4/4K3 w - - 0 1", "d2d4", 100 - 500)
+
+    def test_en_passant_and_promotion(self):
+        self.assertSEE("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1", "e5d6", 100)
+        self.assertSEE("1r2k3/P7/8/8/8/8/8/4K3 w - - 0 1", "a7a8q", 900 - 100 - 900)
+        self.assertSEE("1r2k3/P7/8/8/8/8/8/4K3 w - - 0 1", "a7b8q", 500 + 900 - 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Test Suite for SlowMate Terminal Detection
+Checks that the evaluator skips mate/stalemate detection under the
+terminal_checked contract without changing scores, and that quiescence
+search detects terminal positions itself
+"""
+
+import sys
+import os
+import unittest
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from src.core.board import Board
+from src.core.enhanced_evaluate import EnhancedEvaluator
+from src.engine import SlowMateEngine
+
+
+POSITIONS = [
+    chess.STARTING_FEN,
+    "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 6 8",
+    "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 11",
+    "4k3/8/4K3/8/8/8/8/4R3 b - - 0 1",  # In check with a legal move
+]
+MATED_FEN = "rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3"
+STALEMATE_FEN = "7k/5Q2/6K1/8/8/8/8/8 b - - 0 1"
+
+
+def make_board(fen: str) -> Board:
+    board = Board()
+    board.set_fen(fen)
+    return board
+
+
+class TestTerminalDetection(unittest.TestCase):
+    def test_terminal_checked_scores_match(self):
+        for fen in POSITIONS:
+            board = make_board(fen)
+            checked = EnhancedEvaluator().evaluate(board, terminal_checked=True)
+            self.assertEqual(checked, EnhancedEvaluator().evaluate(board), fen)
+
+    def test_terminal_checked_skips_move_generation(self):
+        board = make_board(POSITIONS[1])
+        evaluator = EnhancedEvaluator()
+        with mock.patch.object(chess.Board, 'is_checkmate') as is_checkmate, \
+                mock.patch.object(chess.Board, 'is_stalemate') as is_stalemate:
+            evaluator.evaluate(board, terminal_checked=True)
+        is_checkmate.assert_not_called()
+        is_stalemate.assert_not_called()
+
+    def test_unchecked_evaluate_still_detects_terminals(self):
+        evaluator = EnhancedEvaluator()
+        self.assertEqual(evaluator.evaluate(make_board(MATED_FEN)), -20000)
+        self.assertEqual(evaluator.evaluate(make_board(STALEMATE_FEN)), 0)
+
+    def test_quiescence_detects_terminals(self):
+        engine = SlowMateEngine()
+        engine.uci.set_silent_mode(True)
+        engine.limits.start(depth=1)
+        engine.set_position(MATED_FEN)
+        self.assertLess(engine._quiescence_search(-30000, 30000, 4), -20000)
+        # Stalemate is the main search's job; quiescence does not generate quiet moves
+        engine.set_position(STALEMATE_FEN)
+        self.assertEqual(engine._negamax(1, -30000, 30000), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
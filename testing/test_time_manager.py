@@ -0,0 +1,84 @@
+"""
+Test Suite for SlowMate Time Management
+Checks the soft/hard limits and how the soft limit reacts to best-move
+stability and score drops between iterations
+"""
+
+import sys
+import os
+import io
+import time
+import contextlib
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from src.core.time_manager import TimeManager
+from src.engine import SlowMateEngine
+from engine_test_utils import MIDDLEGAME_FEN
+
+
+class TestTimeManager(unittest.TestCase):
+    def setUp(self):
+        self.board = chess.Board(MIDDLEGAME_FEN)
+        self.manager = TimeManager()
+        self.manager.set_time_controls(60000, 60000, 500, 500, None, True)
+        self.soft, self.hard = self.manager.calculate_limits(self.board, self.board.ply())
+
+    def test_limits_fit_the_clock(self):
+        self.assertLess(self.soft, self.hard)
+        self.assertLessEqual(self.hard, 60.0 * 0.4)
+        self.manager.set_time_controls(300, 300, 0, 0, None, True)
+        soft, hard = self.manager.calculate_limits(self.board, self.board.ply())
+        self.assertLessEqual(hard, 0.3 - self.manager.move_overhead)
+
+    def test_stable_best_move_ends_early(self):
+        move = chess.Move.from_uci("c3d5")
+        for depth in range(1, 6):
+            self.manager.update_iteration(depth, move, 40)
+        self.assertLess(self.manager.adjusted_soft_limit(), self.soft)
+
+    def test_best_move_change_and_score_drop_extend(self):
+        self.manager.update_iteration(1, chess.Move.from_uci("c3d5"), 40)
+        self.manager.update_iteration(2, chess.Move.from_uci("h2h3"), 40)
+        changed = self.manager.adjusted_soft_limit()
+        self.assertGreater(changed, self.soft)
+        self.manager.update_iteration(3, chess.Move.from_uci("h2h3"), -200)
+        self.assertEqual(self.manager.score_drop, 240)
+        dropped = self.manager.adjusted_soft_limit()
+        self.assertGreater(dropped, self.soft * 1.4)
+        self.assertLessEqual(dropped, self.hard)
+
+    def test_iteration_prediction(self):
+        self.assertIsNone(self.manager.predict_next_iteration())
+        self.manager.record_iteration(100, 0.01)
+        self.manager.record_iteration(600, 0.06)
+        self.manager.record_iteration(2400, 0.24, predicted=0.36)
+        # Branching factors 6 and 4 average to 5
+        self.assertAlmostEqual(self.manager.predict_next_iteration(), 1.2)
+        self.assertIn("checks 1 mean error 50%", self.manager.prediction_stats_string())
+
+    def test_skipped_time_is_banked(self):
+        self.manager.skip_iteration(2.0)
+        self.assertEqual(self.manager.time_bank, 2.0)
+        soft, hard = self.manager.calculate_limits(self.board, self.board.ply())
+        self.assertAlmostEqual(hard, self.hard + 1.0)
+        self.assertAlmostEqual(self.manager.time_bank, 1.0)
+
+    def test_engine_search_on_clock(self):
+        engine = SlowMateEngine()
+        engine.set_position(MIDDLEGAME_FEN)
+        start = time.time()
+        with contextlib.redirect_stdout(io.StringIO()):
+            move = engine.search(wtime=3000, btime=3000, winc=0, binc=0)
+        elapsed = time.time() - start
+        self.assertIsNotNone(move)
+        self.assertTrue(engine.time_managed)
+        self.assertGreater(engine.completed_depth, 0)
+        self.assertLessEqual(elapsed, engine.time_manager.hard_limit + 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Test Suite for SlowMate Array-Backed Transposition Table
+Validates fixed memory use, O(1) store/lookup and depth/age replacement
+"""
+
+import sys
+import os
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from src.search.enhanced import TranspositionTable, NodeType
+
+
+class TestTranspositionTable(unittest.TestCase):
+    def setUp(self):
+        self.tt = TranspositionTable(size_mb=1)
+
+    def test_memory_matches_hash_option(self):
+        for size_mb in (1, 3, 16):
+            tt = TranspositionTable(size_mb=size_mb)
+            self.assertEqual(tt.memory_bytes(), size_mb * 1024 * 1024)
+
+    def test_store_and_lookup_roundtrip(self):
+        move = chess.Move.from_uci("e7e8q")
+        self.tt.store(12345, 5, -321, NodeType.EXACT, move)
+        self.assertEqual(self.tt.lookup(12345, 5, -30000, 30000), (-321, move))
+        self.assertIsNone(self.tt.lookup(12345, 6, -30000, 30000))
+
+        entry = self.tt.probe(12345)
+        self.assertEqual((entry.depth, entry.score, entry.node_type, entry.move),
+                         (5, -321, NodeType.EXACT, move))
+
+    def test_bound_entries(self):
+        self.tt.store(1, 4, 50, NodeType.UPPER, None)
+        self.assertEqual(self.tt.lookup(1, 4, 60, 100), (60, None))
+        self.assertIsNone(self.tt.lookup(1, 4, 0, 100))
+
+        self.tt.store(2, 4, 150, NodeType.LOWER, None)
+        self.assertEqual(self.tt.lookup(2, 4, 0, 100), (100, None))
+        self.assertIsNone(self.tt.lookup(2, 4, 0, 200))
+
+    def test_table_never_grows(self):
+        for key in range(self.tt.size * 3):
+            self.tt.store(key * 7919, key % 10, key % 500, NodeType.EXACT, None)
+        self.assertEqual(self.tt.memory_bytes(), 1024 * 1024)
+        self.assertEqual(self.tt.entries_used(), self.tt.size)
+
+    def test_replacement_prefers_shallow_and_old_entries(self):
+        clusters = self.tt.num_clusters
+        keys = [index * clusters + 3 for index in range(1, 6)]  # All map to cluster 3
+
+        for depth, key in enumerate(keys[:4], start=1):
+            self.tt.store(key, depth * 2, 0, NodeType.EXACT, None)
+        self.tt.store(keys[4], 5, 0, NodeType.EXACT, None)
+        self.assertIsNone(self.tt.probe(keys[0]), "shallowest entry should be replaced")
+        self.assertIsNotNone(self.tt.probe(keys[3]))
+
+        # After a few searches stale entries lose to a shallow entry from this search
+        for _ in range(3):
+            self.tt.new_search()
+        self.tt.store(keys[4], 5, 0, NodeType.EXACT, None)
+        self.tt.store(keys[0], 1, 0, NodeType.EXACT, None)
+        self.assertIsNotNone(self.tt.probe(keys[0]))
+        self.assertIsNone(self.tt.probe(keys[1]), "stale shallow entry should be replaced")
+        self.assertIsNotNone(self.tt.probe(keys[4]), "entry refreshed this search is kept")
+
+    def test_same_key_keeps_move(self):
+        move = chess.Move.from_uci("g1f3")
+        self.tt.store(99, 3, 10, NodeType.LOWER, move)
+        self.tt.store(99, 4, 20, NodeType.UPPER, None)
+        self.assertEqual(self.tt.probe(99).move, move)
+
+    def test_resize_and_clear(self):
+        self.tt.store(5, 1, 0, NodeType.EXACT, None)
+        self.tt.resize(2)
+        self.assertEqual(self.tt.memory_bytes(), 2 * 1024 * 1024)
+        self.assertIsNone(self.tt.probe(5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Test Suite for SlowMate UCI I/O Threads
+Checks that output keeps its order and batches info lines under the rate
+limit, and that isready and stop are answered within milliseconds while a
+search is running
+"""
+
+import sys
+import os
+import time
+import threading
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.engine import SlowMateEngine
+from src.uci.channel import UCIWriter
+from engine_test_utils import MIDDLEGAME_FEN
+
+
+class RecordingStream:
+    """Output stream that remembers every write and when it happened."""
+
+    def __init__(self):
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append((time.time(), text))
+
+    def flush(self):
+        pass
+
+    def lines(self):
+        return "".join(text for _, text in self.writes).splitlines()
+
+    def wait_for(self, prefix, timeout=5.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            for stamp, text in list(self.writes):
+                if any(line.startswith(prefix) for line in text.splitlines()):
+                    return stamp
+            time.sleep(0.001)
+        raise AssertionError(f"no {prefix!r} output")
+
+
+class TestUCIWriter(unittest.TestCase):
+    def test_order_kept_and_info_batched(self):
+        stream = RecordingStream()
+        writer = UCIWriter(stream, info_interval=0.1)
+        writer.send("info depth 1")
+        time.sleep(0.02)
+        for depth in range(2, 6):
+            writer.send(f"info depth {depth}")
+        time.sleep(0.02)
+        self.assertEqual(writer.writes, 1)  # Depths 2-5 wait for the interval
+        writer.send("bestmove e2e4")
+        writer.close()
+        self.assertEqual(stream.lines(), [f"info depth {depth}" for depth in range(1, 6)] + ["bestmove e2e4"])
+        self.assertEqual(writer.writes, 2)
+
+    def test_info_released_after_interval(self):
+        stream = RecordingStream()
+        writer = UCIWriter(stream, info_interval=0.05)
+        writer.send("info depth 1")
+        writer.send("info depth 2")
+        time.sleep(0.01)
+        writer.send("info depth 3")
+        time.sleep(0.1)
+        self.assertEqual(stream.lines(), ["info depth 1", "info depth 2", "info depth 3"])
+        writer.close()
+
+
+class TestUCIRunLoop(unittest.TestCase):
+    def test_isready_and_stop_during_search(self):
+        engine = SlowMateEngine()
+        read_fd, write_fd = os.pipe()
+        commands = os.fdopen(write_fd, 'w', buffering=1)
+        stream = RecordingStream()
+        loop = threading.Thread(target=engine.uci.run,
+                                args=(os.fdopen(read_fd), stream), daemon=True)
+        loop.start()
+
+        commands.write(f"position fen {MIDDLEGAME_FEN}\ngo infinite\n")
+        stream.wait_for("info depth 2")
+        sent = time.time()
+        commands.write("isready\n")
+        self.assertLess(stream.wait_for("readyok") - sent, 0.05)
+
+        sent = time.time()
+        commands.write("stop\n")
+        self.assertLess(stream.wait_for("bestmove") - sent, 0.05)
+
+        commands.write("quit\n")
+        loop.join(2.0)
+        self.assertFalse(loop.is_alive())
+        commands.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
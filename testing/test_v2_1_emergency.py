@@ -14,7 +14,7 @@ from typing import List, Optional
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from slowmate.engine_v2_1 import SlowMateEngine
-from slowmate.uci.protocol_v2_1 import UCIProtocol
+from slowmate.uci.protocol_v2_2 import UCIProtocol
 
 
 class TestSlowMateV21Emergency(unittest.TestCase):
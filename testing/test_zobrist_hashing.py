@@ -0,0 +1,90 @@
+"""
+Test Suite for SlowMate Incremental Zobrist Hashing
+Validates that Board keeps its 64-bit key in sync on make/unmake
+"""
+
+import sys
+import os
+import glob
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+import chess.pgn
+import chess.polyglot
+from src.core.board import Board
+
+
+GAMES_DIR = os.path.join(os.path.dirname(__file__), '..', 'games')
+
+
+class TestZobristHashing(unittest.TestCase):
+    def assertKeyMatches(self, board: Board):
+        self.assertEqual(board.zobrist_key, chess.polyglot.zobrist_hash(board.board),
+                         f"Key mismatch in {board.get_fen()}")
+
+    def test_startpos_key(self):
+        board = Board()
+        self.assertKeyMatches(board)
+
+    def test_game_records_make_unmake(self):
+        """Replay every game in games/ and compare against a full recomputation."""
+        games_checked = 0
+        for pgn_path in sorted(glob.glob(os.path.join(GAMES_DIR, '*.pgn'))):
+            with open(pgn_path, encoding='latin-1') as pgn_file:
+                while True:
+                    game = chess.pgn.read_game(pgn_file)
+                    if game is None:
+                        break
+                    board = Board()
+                    board.set_fen(game.board().fen())
+                    keys = [board.zobrist_key]
+                    for move in game.mainline_moves():
+                        board.make_move(move)
+                        self.assertKeyMatches(board)
+                        keys.append(board.zobrist_key)
+                    # Unwind the whole game again
+                    while board.board.move_stack:
+                        keys.pop()
+                        board.unmake_move()
+                        self.assertEqual(board.zobrist_key, keys[-1])
+                    games_checked += 1
+        self.assertGreater(games_checked, 0)
+
+    def test_special_moves(self):
+        """Castling, en passant and promotions update the key correctly."""
+        positions = [
+            ("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1", ["e1g1", "e8c8", "a1a8"]),
+            ("4k3/8/8/8/3p4/8/4P3/4K3 w - - 0 1", ["e2e4", "d4e3"]),
+            ("1n2k3/P7/8/8/8/8/8/4K3 w - - 0 1", ["a7b8q", "e8d7"]),
+        ]
+        for fen, uci_moves in positions:
+            board = Board()
+            board.set_fen(fen)
+            for uci in uci_moves:
+                board.make_move(chess.Move.from_uci(uci))
+                self.assertKeyMatches(board)
+
+    def test_null_move(self):
+        board = Board()
+        board.make_move(chess.Move.from_uci("e2e4"))
+        before = board.zobrist_key
+        board.make_null_move()
+        self.assertKeyMatches(board)
+        board.unmake_null_move()
+        self.assertEqual(board.zobrist_key, before)
+
+    def test_repetition_detection(self):
+        board = Board()
+        self.assertFalse(board.is_repetition())
+        for uci in ["g1f3", "g8f6", "f3g1", "f6g8"]:
+            board.make_move(chess.Move.from_uci(uci))
+        self.assertTrue(board.is_repetition())
+        board.unmake_move()
+        self.assertFalse(board.is_repetition())
+
+
+if __name__ == '__main__':
+    unittest.main()
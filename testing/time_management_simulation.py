@@ -0,0 +1,128 @@
+"""
+Simulated Clock Harness for SlowMate Time Management
+Replays games from games/ and makes the engine think about every position
+as if it were playing both sides on a running clock. Search time is real;
+the clocks are simulated. The game move is played afterwards, whatever the
+engine chose, so every run sees the same positions.
+
+Reports time forfeits, hard-limit overruns, the lowest clock reached, the
+average depth completed per move, and how many iterations were skipped
+(predicted not to finish) or aborted at the hard limit.
+
+Usage:
+    python testing/time_management_simulation.py [base_seconds] [increment_seconds] [games] [max_plies]
+"""
+
+import sys
+import os
+import io
+import glob
+import time
+import contextlib
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+import chess.pgn
+from src.engine import SlowMateEngine
+
+
+GAMES_DIR = os.path.join(os.path.dirname(__file__), '..', 'games')
+OVERRUN_TOLERANCE = 0.05  # Seconds past the hard limit counted as an overrun
+LOW_CLOCK_FRACTION = 0.1  # Clock below this fraction of the base time counts as critical
+
+
+def iter_games():
+    for pgn_path in sorted(glob.glob(os.path.join(GAMES_DIR, '*.pgn'))):
+        with open(pgn_path, encoding='latin-1') as pgn_file:
+            while True:
+                game = chess.pgn.read_game(pgn_file)
+                if game is None:
+                    break
+                yield game
+
+
+def simulate_game(engine: SlowMateEngine, game, base: float, increment: float, max_plies: int):
+    """Replay one game on simulated clocks; return per-game statistics."""
+    engine.new_game()
+    engine.set_position(game.board().fen())
+    clocks = {chess.WHITE: base, chess.BLACK: base}
+    stats = {'moves': 0, 'book': 0, 'depth': 0, 'time': 0.0, 'overruns': 0,
+             'forfeit': False, 'low_clock': 0, 'min_clock': base, 'skipped': 0, 'aborted': 0}
+
+    for ply, game_move in enumerate(game.mainline_moves()):
+        if ply >= max_plies:
+            break
+        side = engine.board.board.turn
+        start = time.time()
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine.search(wtime=int(clocks[chess.WHITE] * 1000), btime=int(clocks[chess.BLACK] * 1000),
+                          winc=int(increment * 1000), binc=int(increment * 1000))
+        elapsed = time.time() - start
+
+        clocks[side] -= elapsed
+        if clocks[side] < 0:
+            stats['forfeit'] = True
+            break
+        clocks[side] += increment
+        stats['min_clock'] = min(stats['min_clock'], clocks[side])
+        if clocks[side] < base * LOW_CLOCK_FRACTION:
+            stats['low_clock'] += 1
+
+        if engine.completed_depth == 0:
+            stats['book'] += 1
+        else:
+            stats['moves'] += 1
+            stats['depth'] += engine.completed_depth
+            stats['time'] += elapsed
+            stats['skipped'] += engine.time_manager.iterations_skipped
+            stats['aborted'] += engine.time_manager.iterations_aborted
+            if engine.search_deadline and start + elapsed > engine.search_deadline + OVERRUN_TOLERANCE:
+                stats['overruns'] += 1
+
+        engine.board.make_move(game_move)
+    return stats
+
+
+def main():
+    base = float(sys.argv[1]) if len(sys.argv) > 1 else 30.0
+    increment = float(sys.argv[2]) if len(sys.argv) > 2 else 0.3
+    game_count = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+    max_plies = int(sys.argv[4]) if len(sys.argv) > 4 else 80
+
+    print(f"Time management simulation: {game_count} games, {base:g}s + {increment:g}s, "
+          f"up to {max_plies} plies")
+    print("-" * 78)
+
+    engine = SlowMateEngine()
+    totals = {'moves': 0, 'depth': 0, 'time': 0.0, 'overruns': 0, 'forfeits': 0, 'low_clock': 0,
+              'skipped': 0, 'aborted': 0}
+    played = 0
+    for game in iter_games():
+        if played >= game_count:
+            break
+        if game.end().ply() < 20:
+            continue  # Too short to say anything about the clock
+        stats = simulate_game(engine, game, base, increment, max_plies)
+        played += 1
+        avg_depth = stats['depth'] / max(stats['moves'], 1)
+        print(f"game {played:>2}: {stats['moves']:>3} searched  {stats['book']:>2} book  "
+              f"avg depth {avg_depth:4.1f}  avg time {stats['time'] / max(stats['moves'], 1):5.2f}s  "
+              f"min clock {stats['min_clock']:6.2f}s  overruns {stats['overruns']}  "
+              f"{'FORFEIT' if stats['forfeit'] else 'ok'}")
+        for key in ('moves', 'depth', 'time', 'overruns', 'low_clock', 'skipped', 'aborted'):
+            totals[key] += stats[key]
+        totals['forfeits'] += stats['forfeit']
+
+    print("-" * 78)
+    moves = max(totals['moves'], 1)
+    print(f"Average depth {totals['depth'] / moves:.2f}, average time {totals['time'] / moves:.2f}s per move")
+    print(f"Time forfeits {totals['forfeits']}/{played}, hard-limit overruns {totals['overruns']}, "
+          f"moves below {LOW_CLOCK_FRACTION:.0%} of base clock {totals['low_clock']}")
+    print(f"Iterations skipped (predicted too slow) {totals['skipped']}, "
+          f"aborted at the hard limit {totals['aborted']}")
+
+
+if __name__ == "__main__":
+    main()
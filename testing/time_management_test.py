@@ -12,7 +12,7 @@ import chess
 sys.path.append(str(Path(__file__).parent.parent))
 
 from slowmate.engine import SlowMateEngine
-from slowmate.uci.protocol import UCIProtocol
+from slowmate.uci.protocol_v2_2 import UCIProtocol
 
 class TimeManagementTester:
     def __init__(self):
@@ -0,0 +1,122 @@
+"""
+Zobrist Hashing Benchmark for SlowMate Chess Engine
+Compares search speed with incremental Zobrist keys against the old
+hash(board.get_fen()) keying on a fixed position set.
+
+Usage:
+    python testing/zobrist_benchmark.py [depth]
+"""
+
+import sys
+import os
+import io
+import time
+import contextlib
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import chess
+from src.engine import SlowMateEngine
+from src.core.board import Board
+from src.core.moves import MoveGenerator
+from src.core.zobrist import compute_pawn_key
+
+
+BENCHMARK_POSITIONS = [
+    "r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4",
+    "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 6 8",
+    "r1bq1rk1/pp3ppp/2n1pn2/2bp4/2P5/2N1PN2/PP1B1PPP/R2QKB1R w KQ - 0 8",
+    "2r2rk1/pp1bqppp/2n1pn2/3p4/3P4/2PBPN2/P1Q2PPP/R4RK1 w - - 5 14",
+    "r4rk1/1pp1qppp/p1np1n2/4p3/2B1P1b1/2PP1N2/PP1N1PPP/R2Q1RK1 w - - 0 10",
+    "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+    "4rrk1/pp3ppp/3b4/3p4/3P2q1/2PB4/PP1Q1PPP/R4RK1 b - - 3 18",
+    "6k1/5ppp/8/8/8/8/5PPP/3R2K1 w - - 0 1",
+]
+
+
+class FenKeyedBoard(Board):
+    """Board that keys positions the pre-Zobrist way, for comparison."""
+
+    @property
+    def zobrist_key(self):
+        return hash(self.board.fen()) & 0xFFFFFFFFFFFFFFFF
+
+    @zobrist_key.setter
+    def zobrist_key(self, value):
+        pass
+
+    @property
+    def pawn_key(self):
+        return compute_pawn_key(self.board)
+
+    @pawn_key.setter
+    def pawn_key(self, value):
+        pass
+
+    def make_move(self, move):
+        self.board.push(move)
+        self._key_history.append(self.zobrist_key)
+        self._phase = None
+
+    def unmake_move(self):
+        self.board.pop()
+        self._key_history.pop()
+        self._phase = None
+
+    def make_null_move(self):
+        self.board.push(chess.Move.null())
+        self._key_history.append(self.zobrist_key)
+
+    def unmake_null_move(self):
+        self.board.pop()
+        self._key_history.pop()
+
+
+def run_benchmark(board_class, depth: int):
+    """Search every benchmark position to a fixed depth and return (nodes, seconds)."""
+    total_nodes = 0
+    total_time = 0.0
+
+    for fen in BENCHMARK_POSITIONS:
+        engine = SlowMateEngine()
+        engine.board = board_class()
+        engine.board.set_fen(fen)
+        engine.move_generator = MoveGenerator(engine.board)
+
+        # Drive the iterations directly: search() raises the depth with long time limits
+        engine.search_deadline = None
+        engine.uci.stop_requested = False
+        moves = engine.move_generator.get_legal_moves()
+
+        start = time.time()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for current_depth in range(1, depth + 1):
+                engine._search_depth_with_pv(current_depth, -30000, 30000, moves)
+        total_time += time.time() - start
+        total_nodes += engine.nodes
+
+    return total_nodes, total_time
+
+
+def main():
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+
+    print(f"Zobrist benchmark: {len(BENCHMARK_POSITIONS)} positions, depth {depth}")
+    print("-" * 60)
+
+    results = {}
+    for label, board_class in [("hash(fen) keys", FenKeyedBoard), ("zobrist keys", Board)]:
+        nodes, elapsed = run_benchmark(board_class, depth)
+        nps = int(nodes / max(elapsed, 0.001))
+        results[label] = nps
+        print(f"{label:<16} nodes {nodes:>9}  time {elapsed:7.2f}s  nps {nps:>7}")
+
+    before = results["hash(fen) keys"]
+    after = results["zobrist keys"]
+    print("-" * 60)
+    print(f"Speedup: {after / max(before, 1):.2f}x nodes/sec")
+
+
+if __name__ == "__main__":
+    main()